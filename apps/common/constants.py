@@ -26,11 +26,13 @@ PROFILES: str = "profiles"
 S3: str = "s3"
 KEY: str = "Key"
 FIELDS: str = "fields"
+CONTENT_TYPE: str = "content_type"
 IMAGE = "image"
 IMAGES = "images"
 REQUEST: str = "request"
 CREATED_AT: str = "created_at"
 UPDATED_AT: str = "updated_at"
+SENT_ON: str = "sent_on"
 TYPE: str = "type"
 CODE: str = "code"
 OBJECT: str = "object"
@@ -40,6 +42,7 @@ TOTAL_PRICE: str = "total_price"
 ORDER_TOTAL: str = "order_total"
 ISLOGGEDIN: str = "isLoggedIn"
 DETAIL: str = "detail"
+COUNT: str = "count"
 
 # ACCOUNTS
 USER: str = "user"
@@ -71,6 +74,11 @@ CATEGORY: str = "category"
 DESCRIPTION: str = "description"
 ORDER: str = "order"
 IMAGE_URL: str = "image_url"
+UPLOAD_KEY: str = "upload_key"
+UPLOAD_URL: str = "upload_url"
+UPLOADS: str = "uploads"
+VARIANTS: str = "variants"
+IMAGE_VARIANT: str = "image_variant"
 SIZE: str = "size"
 BRAND: str = "brand"
 PRICE: str = "price"
@@ -106,6 +114,10 @@ COLLECTION_DEADLINE: str = "collection_deadline"
 LISTING_ROLE: str = "listing_role"
 USER_LISTING_RELATION: str = "user_listing_relation"
 LISTING_EXISTS: str = "listing_exists"
+STORE_USER_ID: str = "store_user_id"
+OWNER_USER_ID: str = "owner_user_id"
+LISTINGS: str = "listings"
+TRANSITION: str = "transition"
 # MEMBERS
 MEMBER: str = "member"
 MEMBERS: str = "members"
@@ -135,6 +147,7 @@ HOW_IT_WORKS_URL: str = "how_it_works_url"
 LOGO_URL: str = "logo_url"
 COLLECTION_PIN: str = "collection_pin"
 ITEM_PAGE_URL: str = "item_page_url"
+DOWNLOAD_URL: str = "download_url"
 
 # STORES
 STORE: str = "store"
@@ -168,6 +181,7 @@ IS_CLOSED: str = "is_closed"
 NEW_LISTING_NOTIFICATIONS: str = "new_listing_notifications"
 SALE_NOTIFICATIONS: str = "sale_notifications"
 STOCK_LIMIT: str = "stock_limit"
+TAG_RENDER_MODE: str = "tag_render_mode"
 PHONE: str = "phone"
 COMMISSION: str = "commission"
 ACTIVE_LISTINGS_COUNT: str = "active_listings_count"
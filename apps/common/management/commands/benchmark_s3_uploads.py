@@ -0,0 +1,67 @@
+import os
+import statistics
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+
+from apps.common.s3.s3_utils import S3ClientBase, S3Service
+
+BENCHMARK_PREFIX = "benchmarks/s3_uploads"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare S3 upload latency with a new boto3 client per service, as "
+        "before, versus the shared client. Uploads to the configured bucket "
+        "and deletes the objects afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--uploads", type=int, default=50)
+        parser.add_argument(
+            "--size", type=int, default=64 * 1024, help="Bytes per object."
+        )
+
+    def handle(self, *args, **options):
+        payload = os.urandom(options["size"])
+        uploads = options["uploads"]
+
+        started = time.perf_counter()
+        S3ClientBase().create_s3_client()
+        construction_ms = (time.perf_counter() - started) * 1000
+
+        before = self.measure(uploads, payload, shared=False)
+        after = self.measure(uploads, payload, shared=True)
+
+        self.stdout.write(f"client construction: {construction_ms:.1f} ms")
+        for name, timings in [("per-call client", before), ("shared client", after)]:
+            self.stdout.write(
+                f"{name:<16} median {statistics.median(timings):7.1f} ms  "
+                f"p95 {self.percentile(timings, 95):7.1f} ms"
+            )
+        self.stdout.write(
+            f"median speedup: {statistics.median(before) / statistics.median(after):.1f}x"
+        )
+
+    def measure(self, uploads: int, payload: bytes, shared: bool):
+        timings = []
+        keys = []
+        for i in range(uploads):
+            key = f"{BENCHMARK_PREFIX}/{'shared' if shared else 'per_call'}_{i}"
+            started = time.perf_counter()
+            s3_service = S3Service()
+            if not shared:
+                s3_service.s3_client = s3_service.create_s3_client()
+            s3_service.upload_image(BytesIO(payload), key)
+            timings.append((time.perf_counter() - started) * 1000)
+            keys.append(key)
+
+        s3_service = S3Service()
+        for key in keys:
+            s3_service.delete_image(key)
+        return timings
+
+    def percentile(self, timings: list, percent: int):
+        ordered = sorted(timings)
+        return ordered[min(len(ordered) - 1, len(ordered) * percent // 100)]
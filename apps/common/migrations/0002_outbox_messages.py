@@ -0,0 +1,70 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:36
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def move_pending_s3_deletions(apps, schema_editor):
+    PendingS3Deletion = apps.get_model("common", "PendingS3Deletion")
+    OutboxMessage = apps.get_model("common", "OutboxMessage")
+    OutboxMessage.objects.bulk_create(
+        (
+            OutboxMessage(
+                topic="S3_DELETE",
+                payload={"Key": deletion.key},
+                attempts=deletion.attempts,
+            )
+            for deletion in PendingS3Deletion.objects.order_by("id").iterator()
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxMessage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "topic",
+                    models.CharField(
+                        choices=[("EMAIL", "Email"), ("S3_DELETE", "S3 Delete")],
+                        max_length=20,
+                    ),
+                ),
+                ("payload", models.JSONField()),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Outbox Message",
+                "verbose_name_plural": "Outbox Messages",
+                "db_table": "outbox_messages",
+            },
+        ),
+        migrations.RunPython(move_pending_s3_deletions, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name="PendingS3Deletion",
+        ),
+        migrations.AddIndex(
+            model_name="outboxmessage",
+            index=models.Index(
+                fields=["topic", "id"], name="outbox_mess_topic_89a542_idx"
+            ),
+        ),
+    ]
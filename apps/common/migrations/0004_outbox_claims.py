@@ -0,0 +1,35 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0003_outbox_payload_encoder"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="outboxmessage",
+            name="outbox_mess_topic_89a542_idx",
+        ),
+        migrations.AddField(
+            model_name="outboxmessage",
+            name="claimed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="outboxmessage",
+            name="dead_lettered_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="outboxmessage",
+            index=models.Index(
+                condition=models.Q(("dead_lettered_at__isnull", True)),
+                fields=["topic", "id"],
+                name="outbox_pending_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class OutboxMessage(models.Model):
+    """
+    A side effect waiting to be relayed. Rows are written in the same
+    transaction as the change that causes the side effect, so it happens
+    only once that change has committed, and OutboxService.relay delivers
+    them in batches per topic.
+    """
+
+    class Topics(models.TextChoices):
+        EMAIL = "EMAIL", "Email"
+        S3_DELETE = "S3_DELETE", "S3 Delete"
+
+    topic = models.CharField(max_length=20, choices=Topics.choices)
+    # Email contexts carry Decimal prices, which plain JSON rejects.
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Set while a relay holds the message; a stale claim is taken over.
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    # Set once the message has failed OUTBOX_MAX_ATTEMPTS times.
+    dead_lettered_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.topic} message {self.id}"
+
+    class Meta:
+        verbose_name = "Outbox Message"
+        verbose_name_plural = "Outbox Messages"
+        db_table = "outbox_messages"
+        indexes = [
+            models.Index(
+                fields=["topic", "id"],
+                name="outbox_pending_idx",
+                condition=models.Q(dead_lettered_at__isnull=True),
+            )
+        ]
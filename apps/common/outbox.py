@@ -0,0 +1,145 @@
+import logging
+from datetime import timedelta
+from functools import partial
+from typing import NamedTuple
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils.module_loading import import_string
+from django.utils.timezone import now
+
+from apps.common.models import OutboxMessage
+from apps.common.s3.s3_config import S3_DELETE_BATCH_SIZE
+from apps.common.tasks.outbox import relay_outbox
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_MAX_ATTEMPTS = 5
+# A claim older than this belongs to a relay that died mid-batch.
+OUTBOX_CLAIM_TIMEOUT = timedelta(minutes=5)
+EMAIL_OUTBOX_BATCH_SIZE = 50
+
+
+class OutboxTopic(NamedTuple):
+    # Dotted path to a function taking a batch of payloads and returning
+    # the positions of those that failed; raising fails the whole batch.
+    handler: str
+    batch_size: int
+    # Relay as soon as the transaction commits rather than on the next
+    # sweep, for side effects users are waiting on.
+    relay_on_commit: bool
+
+
+OUTBOX_TOPICS = {
+    OutboxMessage.Topics.EMAIL: OutboxTopic(
+        "apps.notifications.emails.services.email_service.deliver_outbox_emails",
+        EMAIL_OUTBOX_BATCH_SIZE,
+        relay_on_commit=True,
+    ),
+    OutboxMessage.Topics.S3_DELETE: OutboxTopic(
+        "apps.common.s3.s3_cleanup.delete_outbox_keys",
+        S3_DELETE_BATCH_SIZE,
+        relay_on_commit=False,
+    ),
+}
+
+
+class OutboxService:
+    @staticmethod
+    def enqueue(topic: OutboxMessage.Topics, payloads):
+        """
+        Records side effects for the relay. Call it inside the transaction
+        that causes them; nothing is published until it commits.
+        """
+        config = OUTBOX_TOPICS[topic]
+        messages = OutboxMessage.objects.bulk_create(
+            [OutboxMessage(topic=topic, payload=payload) for payload in payloads],
+            batch_size=config.batch_size,
+        )
+        if messages and config.relay_on_commit:
+            # A broker outage must not fail the committed request; the
+            # sweep relays the messages instead.
+            transaction.on_commit(partial(relay_outbox.delay, topic), robust=True)
+        return messages
+
+    @staticmethod
+    def relay(topic: OutboxMessage.Topics):
+        """
+        Hands a topic's messages to its handler a batch at a time, in one
+        pass over the queue. Each batch is claimed in a short transaction
+        and settled in another, so no transaction or row lock is held while
+        the handler talks to the outside world. Messages that fail stay
+        queued for the next relay, and are dead-lettered once they reach
+        OUTBOX_MAX_ATTEMPTS. Returns the number of messages delivered.
+        """
+        config = OUTBOX_TOPICS[topic]
+        handler = import_string(config.handler)
+        delivered = 0
+        last_id = 0
+        while True:
+            messages = OutboxService.claim(topic, last_id, config.batch_size)
+            if not messages:
+                return delivered
+            last_id = messages[-1][0]
+
+            try:
+                failed = set(handler([payload for _, payload in messages]))
+            except Exception:
+                logger.exception("Failed to relay %s outbox messages", topic)
+                failed = set(range(len(messages)))
+
+            failed_ids = {messages[position][0] for position in failed}
+            OutboxService.settle(
+                topic,
+                [id for id, _ in messages if id not in failed_ids],
+                list(failed_ids),
+            )
+            delivered += len(messages) - len(failed)
+
+    @staticmethod
+    @transaction.atomic
+    def claim(topic: OutboxMessage.Topics, after_id: int, batch_size: int):
+        """
+        Claims the next batch of unclaimed (or abandoned) messages. Rows are
+        locked with SKIP LOCKED only while the claim is written, so relays
+        can run side by side.
+        """
+        claimed_at = now()
+        messages = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True)
+            .filter(topic=topic, id__gt=after_id, dead_lettered_at__isnull=True)
+            .filter(
+                Q(claimed_at__isnull=True)
+                | Q(claimed_at__lt=claimed_at - OUTBOX_CLAIM_TIMEOUT)
+            )
+            .order_by("id")
+            .values_list("id", "payload")[:batch_size]
+        )
+        OutboxMessage.objects.filter(id__in=[id for id, _ in messages]).update(
+            claimed_at=claimed_at
+        )
+        return messages
+
+    @staticmethod
+    @transaction.atomic
+    def settle(topic: OutboxMessage.Topics, delivered_ids: list, failed_ids: list):
+        OutboxMessage.objects.filter(id__in=delivered_ids).delete()
+        if not failed_ids:
+            return
+        OutboxMessage.objects.filter(id__in=failed_ids).update(
+            attempts=F("attempts") + 1, claimed_at=None
+        )
+        dead_lettered = OutboxMessage.objects.filter(
+            id__in=failed_ids, attempts__gte=OUTBOX_MAX_ATTEMPTS
+        ).update(dead_lettered_at=now())
+        if dead_lettered:
+            logger.error(
+                "Dead-lettered %s %s outbox messages after %s attempts",
+                dead_lettered,
+                topic,
+                OUTBOX_MAX_ATTEMPTS,
+            )
+
+    @staticmethod
+    def relay_all():
+        return {topic: OutboxService.relay(topic) for topic in OUTBOX_TOPICS}
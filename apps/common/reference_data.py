@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# How often each process asks the shared cache whether its copy is stale.
+GENERATION_CHECK_INTERVAL = 5
+# How often each process may reload a table because a pk was missing from it.
+MISSING_PK_RELOAD_INTERVAL = 5
+
+
+class ReferenceDataCache:
+    """
+    Process-local copy of a small, seed-only table and its serialized rows.
+
+    Writes bump a generation counter held in the shared Django cache (Redis)
+    once they commit. Each process compares its copy against that counter at
+    most every GENERATION_CHECK_INTERVAL seconds and reloads the table when
+    it has moved on. If the shared cache is unavailable, the process keeps
+    serving its last copy and checks again on the next interval.
+    """
+
+    def __init__(self, model, serializer_class: str):
+        self.model = model
+        self.serializer_class = serializer_class
+        self.generation_key = f"reference_data:{model._meta.db_table}:generation"
+        self._lock = threading.Lock()
+        self._next_missing_pk_reload = 0
+        self._reset()
+
+        post_save.connect(self._on_change, sender=model, weak=False)
+        post_delete.connect(self._on_change, sender=model, weak=False)
+
+    def get(self, pk):
+        """
+        Returns the cached instance for pk, or None if no such row exists.
+        """
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            return None
+
+        instances, _, _ = self._get_state()
+        if pk not in instances:
+            # The row may have been added since this process last loaded.
+            instances, _, _ = self._reload_for_missing_pk()
+        return instances.get(pk)
+
+    def get_data(self, pk):
+        if self.get(pk) is None:
+            return None
+        _, data, _ = self._get_state()
+        row = data.get(int(pk))
+        return dict(row) if row is not None else None
+
+    def all(self):
+        instances, _, _ = self._get_state()
+        return list(instances.values())
+
+    def all_data(self):
+        _, data, _ = self._get_state()
+        return list(data.values())
+
+    def get_etag(self, *parts: str):
+        _, _, digest = self._get_state()
+        key = ":".join([digest, *parts])
+        return f'"{hashlib.md5(key.encode()).hexdigest()}"'
+
+    def invalidate(self):
+        # Drop this process's copy straight away and every other process's
+        # once the change is visible to them.
+        self._reset()
+        transaction.on_commit(self._bump_generation)
+
+    def _on_change(self, **kwargs):
+        self.invalidate()
+
+    def _bump_generation(self):
+        try:
+            try:
+                cache.incr(self.generation_key)
+            except ValueError:
+                cache.set(self.generation_key, 1, None)
+        except Exception:
+            # Other processes pick the change up once they next reload.
+            logger.exception("Failed to bump %s", self.generation_key)
+        self._reset()
+
+    def _reset(self):
+        self._state = None
+        self._generation = None
+        self._next_check = 0
+
+    def _get_state(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._state is None or now >= self._next_check:
+                self._refresh(now, force=self._state is None)
+            return self._state
+
+    def _reload_for_missing_pk(self):
+        """
+        Reloads the table at most once every MISSING_PK_RELOAD_INTERVAL
+        seconds, so lookups of pks that do not exist cannot make every
+        request reload it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._next_missing_pk_reload:
+                self._refresh(now, force=True)
+                self._next_missing_pk_reload = now + MISSING_PK_RELOAD_INTERVAL
+            return self._state
+
+    def _refresh(self, now: float, force: bool):
+        # Called with the lock held. Read the generation before the rows so
+        # a write landing mid-load is picked up on the next check.
+        try:
+            generation = cache.get(self.generation_key, 0)
+        except Exception:
+            logger.exception("Failed to read %s", self.generation_key)
+            generation = self._generation
+        if force or generation != self._generation:
+            self._state = self._load()
+            self._generation = generation
+        self._next_check = now + GENERATION_CHECK_INTERVAL
+
+    def _load(self):
+        serializer_class = import_string(self.serializer_class)
+        instances = {
+            instance.pk: instance
+            for instance in self.model.objects.order_by(self.model._meta.pk.name)
+        }
+        data = {
+            pk: serializer_class(instance).data for pk, instance in instances.items()
+        }
+        digest = hashlib.md5(
+            json.dumps(list(data.values()), cls=DjangoJSONEncoder).encode()
+        ).hexdigest()
+        return instances, data, digest
@@ -0,0 +1,85 @@
+from django.utils.timezone import now
+
+from apps.common.constants import KEY
+from apps.common.models import OutboxMessage
+from apps.common.outbox import OutboxService
+from apps.common.s3.s3_config import (
+    PDF_FILE_TYPE,
+    S3_ORPHAN_GRACE_PERIOD,
+    ZIP_FILE_TYPE,
+    get_s3_managed_prefixes,
+    get_tag_group_archive_key,
+    get_tag_image_key,
+    get_tag_vector_image_key,
+)
+from apps.common.s3.s3_utils import S3Service
+from apps.items.models import ItemImages
+from apps.members.models import MemberProfile
+from apps.stores.models import StoreProfile, Tag, TagGroup
+
+
+def delete_outbox_keys(payloads: list[dict]):
+    """Outbox handler: one DeleteObjects request for the batch."""
+    keys = [payload[KEY] for payload in payloads]
+    failed = set(S3Service().delete_objects(list(dict.fromkeys(keys))))
+    return [position for position, key in enumerate(keys) if key in failed]
+
+
+class S3CleanupService:
+    @staticmethod
+    def queue_deletions(keys):
+        """
+        Queues keys for deletion through the outbox. Call it inside the
+        transaction that stops referencing the objects.
+        """
+        OutboxService.enqueue(
+            OutboxMessage.Topics.S3_DELETE, [{KEY: key} for key in keys]
+        )
+
+    @staticmethod
+    def get_referenced_keys():
+        """Every key the database points at, stored as a URL or derived."""
+        s3_service = S3Service()
+        urls = []
+        for image_url, variants in ItemImages.objects.values_list(
+            "image_url", "variants"
+        ).iterator():
+            urls.append(image_url)
+            for variant_urls in (variants or {}).values():
+                urls.extend(variant_urls.values())
+        for model in (MemberProfile, StoreProfile):
+            urls.extend(
+                model.objects.filter(profile_photo_url__isnull=False)
+                .values_list("profile_photo_url", flat=True)
+                .iterator()
+            )
+        keys = {s3_service.get_key_from_s3_url(url) for url in urls}
+
+        for tag in Tag.objects.only("id", "store_id", "tag_group_id").iterator():
+            keys.add(get_tag_image_key(tag))
+            keys.add(get_tag_vector_image_key(tag))
+        for tag_group in TagGroup.objects.only("id", "store_id").iterator():
+            keys.add(get_tag_group_archive_key(tag_group, ZIP_FILE_TYPE))
+            keys.add(get_tag_group_archive_key(tag_group, PDF_FILE_TYPE))
+        keys.discard(None)
+        return keys
+
+    @staticmethod
+    def collect_orphans():
+        """
+        Queues every object under the managed prefixes that nothing in the
+        database references and that is older than S3_ORPHAN_GRACE_PERIOD.
+        Returns the number of orphans queued.
+        """
+        referenced = S3CleanupService.get_referenced_keys()
+        cutoff = now() - S3_ORPHAN_GRACE_PERIOD
+        s3_service = S3Service()
+        orphans = []
+        for prefix in get_s3_managed_prefixes():
+            orphans.extend(
+                entry["Key"]
+                for entry in s3_service.list_objects(prefix)
+                if entry["Key"] not in referenced and entry["LastModified"] < cutoff
+            )
+        S3CleanupService.queue_deletions(orphans)
+        return len(orphans)
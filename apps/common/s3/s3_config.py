@@ -1,23 +1,74 @@
+from datetime import timedelta
+
 from apps.common.constants import *
 from apps.members.models import MemberProfile as Member
-from apps.stores.models import StoreProfile as Store, Tag
+from apps.stores.models import StoreProfile as Store, Tag, TagGroup
 from apps.items.models import Item
 
 PRSIGNED_URL_EXPIRATION: int = 3600
+# Shared client tuning. The pool is sized for the threads of one process.
+S3_MAX_POOL_CONNECTIONS: int = 50
+# Includes the first attempt.
+S3_MAX_ATTEMPTS: int = 5
+S3_CONNECT_TIMEOUT: int = 5
+S3_READ_TIMEOUT: int = 60
+# S3's maximum lifetime for a SigV4 presigned URL.
+TAG_ARCHIVE_URL_EXPIRATION: int = 60 * 60 * 24 * 7
+# S3 rejects parts smaller than 5 MiB, other than the last.
+MULTIPART_UPLOAD_PART_SIZE: int = 8 * 1024 * 1024
+# Browser uploads of item images straight to S3.
+ITEM_IMAGE_UPLOAD_EXPIRATION: int = 15 * 60
+ITEM_IMAGE_MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024
+# S3's limit on keys per DeleteObjects request.
+S3_DELETE_BATCH_SIZE: int = 1000
+# Unreferenced objects younger than this may belong to an upload in flight.
+S3_ORPHAN_GRACE_PERIOD: timedelta = timedelta(days=1)
 IMAGE_FILE_TYPE = "jpg"
+VECTOR_IMAGE_FILE_TYPE = "svg"
+ZIP_FILE_TYPE = "zip"
+PDF_FILE_TYPE = "pdf"
 
 
-def get_member_profile_photo_key(member: Member):
-    return f"{MEMBERS}/{member.id}/{PROFILE_PHOTO}/{PROFILE}.{IMAGE_FILE_TYPE}"
+# Each photo gets its own key, so replacing one never overwrites an object
+# that is still queued for deletion.
+def get_member_profile_photo_key(member: Member, photo_id: str):
+    return (
+        f"{MEMBERS}/{member.id}/{PROFILE_PHOTO}/{PROFILE}_{photo_id}.{IMAGE_FILE_TYPE}"
+    )
 
 
-def get_store_profile_photo_key(store: Store):
-    return f"{STORES}/{store.id}/{PROFILE_PHOTO}/{PROFILE}.{IMAGE_FILE_TYPE}"
+def get_store_profile_photo_key(store: Store, photo_id: str):
+    return f"{STORES}/{store.id}/{PROFILE_PHOTO}/{PROFILE}_{photo_id}.{IMAGE_FILE_TYPE}"
 
 
 def get_item_image_key(item: Item, order=0):
     return f"{MEMBERS}/{item.owner.id}/{ITEMS}/{item.id}/{ITEM_IMAGE}_{order}.{IMAGE_FILE_TYPE}"
 
 
+def get_item_image_variant_key(item: Item, order: int, variant: str, file_type: str):
+    return f"{MEMBERS}/{item.owner.id}/{ITEMS}/{item.id}/{ITEM_IMAGE}_{order}_{variant}.{file_type}"
+
+
+def get_item_image_upload_prefix(member: Member):
+    return f"{MEMBERS}/{member.id}/{UPLOADS}/"
+
+
+def get_item_image_upload_key(member: Member, upload_id: str):
+    return f"{get_item_image_upload_prefix(member)}{upload_id}"
+
+
 def get_tag_image_key(tag: Tag):
-    return f"{STORES}/{tag.store.id}/{TAG_GROUPS}/{tag.tag_group.id}/{IMAGES}/{TAG}_{tag.id}_{QR_CODE}.{IMAGE_FILE_TYPE}"
+    return f"{STORES}/{tag.store_id}/{TAG_GROUPS}/{tag.tag_group_id}/{IMAGES}/{TAG}_{tag.id}_{QR_CODE}.{IMAGE_FILE_TYPE}"
+
+
+def get_tag_vector_image_key(tag: Tag):
+    return f"{STORES}/{tag.store_id}/{TAG_GROUPS}/{tag.tag_group_id}/{IMAGES}/{TAG}_{tag.id}_{QR_CODE}.{VECTOR_IMAGE_FILE_TYPE}"
+
+
+def get_tag_group_archive_key(tag_group: TagGroup, file_type: str):
+    return f"{STORES}/{tag_group.store_id}/{TAG_GROUPS}/{tag_group.id}/{TAG_GROUP}_{tag_group.id}.{file_type}"
+
+
+def get_s3_managed_prefixes():
+    """Prefixes holding only objects the app tracks, swept for orphans."""
+    return [f"{MEMBERS}/", f"{STORES}/"]
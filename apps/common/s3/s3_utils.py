@@ -1,22 +1,72 @@
+import io
+import os
+import threading
 from typing import BinaryIO
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError, ClientError
 from django.conf import settings
-from apps.common.s3.s3_config import PRSIGNED_URL_EXPIRATION
+from apps.common.s3.s3_config import (
+    ITEM_IMAGE_UPLOAD_EXPIRATION,
+    MULTIPART_UPLOAD_PART_SIZE,
+    PRSIGNED_URL_EXPIRATION,
+    S3_CONNECT_TIMEOUT,
+    S3_DELETE_BATCH_SIZE,
+    S3_MAX_ATTEMPTS,
+    S3_MAX_POOL_CONNECTIONS,
+    S3_READ_TIMEOUT,
+)
+
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+    retries={"total_max_attempts": S3_MAX_ATTEMPTS, "mode": "standard"},
+    connect_timeout=S3_CONNECT_TIMEOUT,
+    read_timeout=S3_READ_TIMEOUT,
+    tcp_keepalive=True,
+)
 
 
 class S3ClientBase:
+    """
+    Gives every S3 service the process-wide client, created on first use.
+    boto3 clients are thread-safe, so requests and Celery tasks share its
+    connection pool instead of building a client per call.
+    """
+
+    _client = None
+    _client_lock = threading.Lock()
+
     def __init__(self):
         self.s3_client = self.get_s3_client()
 
     def get_s3_client(self):
+        client = S3ClientBase._client
+        if client is None:
+            with S3ClientBase._client_lock:
+                if S3ClientBase._client is None:
+                    S3ClientBase._client = self.create_s3_client()
+                client = S3ClientBase._client
+        return client
+
+    @classmethod
+    def reset_s3_client(cls):
+        """
+        Drops the shared client, e.g. in a forked worker process. The lock is
+        replaced rather than acquired: a fork taken while another thread held
+        it leaves the child's copy locked for good.
+        """
+        S3ClientBase._client_lock = threading.Lock()
+        S3ClientBase._client = None
+
+    def create_s3_client(self):
         try:
             return boto3.client(
                 "s3",
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
                 region_name=settings.AWS_S3_REGION_NAME,
+                config=S3_CLIENT_CONFIG,
             )
         except (NoCredentialsError, PartialCredentialsError) as e:
             raise Exception(f"AWS credentials error: {e}") from e
@@ -27,17 +77,127 @@ class S3ClientBase:
         bucket_name = bucket_name or settings.AWS_STORAGE_BUCKET_NAME
         return f"https://{bucket_name}.s3.amazonaws.com/{key}"
 
+    def get_key_from_s3_url(self, url: str):
+        """Inverse of generate_s3_url; None for URLs outside the bucket."""
+        prefix = self.generate_s3_url("")
+        if not url or not url.startswith(prefix):
+            return None
+        return url[len(prefix) :]
+
+
+# A client inherited from the parent would share its pooled sockets.
+os.register_at_fork(after_in_child=S3ClientBase.reset_s3_client)
+
+
+class S3MultipartWriter(io.RawIOBase):
+    """
+    Write-only file object that uploads to S3 in parts as data arrives, so at
+    most one part is held in memory. The upload is completed on close, or
+    aborted if the with-block it is used in raises.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        key: str,
+        content_type: str = None,
+        part_size: int = MULTIPART_UPLOAD_PART_SIZE,
+    ):
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = settings.AWS_STORAGE_BUCKET_NAME
+        self.key = key
+        self.part_size = part_size
+        self.parts = []
+        self.buffer = bytearray()
+        self.position = 0
+
+        extra_args = {"ContentType": content_type} if content_type else {}
+        try:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key, **extra_args
+            )
+        except ClientError as e:
+            raise Exception(f"Failed to start multipart upload to S3: {e}") from e
+        self.upload_id = response["UploadId"]
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def write(self, data):
+        self.buffer += data
+        self.position += len(data)
+        while len(self.buffer) >= self.part_size:
+            self._upload_part(self.buffer[: self.part_size])
+            del self.buffer[: self.part_size]
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            # S3 needs at least one part, even for an empty object.
+            if self.buffer or not self.parts:
+                self._upload_part(self.buffer)
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                MultipartUpload={"Parts": self.parts},
+            )
+        except Exception as e:
+            self.abort()
+            raise Exception(f"Failed to complete multipart upload to S3: {e}") from e
+        finally:
+            super().close()
+
+    def abort(self):
+        if self.closed:
+            return
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self.upload_id
+            )
+        finally:
+            super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def _upload_part(self, data: bytearray):
+        part_number = len(self.parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=bytes(data),
+        )
+        self.parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+
 
 class S3Service(S3ClientBase):
-    def upload_image(self, file: BinaryIO, key: str):
+    def upload_image(self, file: BinaryIO, key: str, content_type: str = None):
+        extra_args = {"ContentType": content_type} if content_type else None
         try:
-            self.s3_client.upload_fileobj(file, settings.AWS_STORAGE_BUCKET_NAME, key)
+            self.s3_client.upload_fileobj(
+                file, settings.AWS_STORAGE_BUCKET_NAME, key, ExtraArgs=extra_args
+            )
             return self.generate_s3_url(key)
         except ClientError as e:
             raise Exception(f"Failed to upload file to S3: {e}") from e
         except Exception as e:
             raise Exception(f"Error uploading file to S3: {e}") from e
 
+    def open_multipart_upload(self, key: str, content_type: str = None):
+        return S3MultipartWriter(self.s3_client, key, content_type)
+
     def delete_image(self, key: str):
         try:
             self.s3_client.delete_object(
@@ -48,6 +208,80 @@ class S3Service(S3ClientBase):
         except Exception as e:
             raise Exception(f"Error deleting file from S3: {e}") from e
 
+    def delete_objects(self, keys: list[str]):
+        """
+        Deletes keys with one DeleteObjects request per S3_DELETE_BATCH_SIZE
+        keys. Returns the keys S3 failed to delete.
+        """
+        failed = []
+        for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+            batch = keys[start : start + S3_DELETE_BATCH_SIZE]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except ClientError as e:
+                raise Exception(f"Failed to delete files from S3: {e}") from e
+            failed += [error["Key"] for error in response.get("Errors", [])]
+        return failed
+
+    def list_objects(self, prefix: str):
+        """Yields the listing entry of every object under prefix."""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        try:
+            for page in paginator.paginate(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME, Prefix=prefix
+            ):
+                yield from page.get("Contents", [])
+        except ClientError as e:
+            raise Exception(f"Failed to list files in S3: {e}") from e
+
+    def generate_presigned_post(
+        self,
+        key: str,
+        max_size: int,
+        content_type: str,
+        expiration: int = ITEM_IMAGE_UPLOAD_EXPIRATION,
+    ):
+        """
+        Form fields that let a client upload one object straight to key,
+        limited in size and to exactly content_type.
+        """
+        try:
+            return self.s3_client.generate_presigned_post(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Key=key,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    ["content-length-range", 1, max_size],
+                    {"Content-Type": content_type},
+                ],
+                ExpiresIn=expiration,
+            )
+        except ClientError as e:
+            raise Exception(f"Failed to generate pre-signed POST: {e}") from e
+
+    def get_object_metadata(self, key: str):
+        """Returns the object's HEAD response, or None if it does not exist."""
+        try:
+            return self.s3_client.head_object(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return None
+            raise Exception(f"Failed to read file metadata from S3: {e}") from e
+
+    def download_object(self, key: str):
+        try:
+            response = self.s3_client.get_object(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key
+            )
+            return response["Body"].read()
+        except ClientError as e:
+            raise Exception(f"Failed to download file from S3: {e}") from e
+
     def generate_presigned_url(
         self, key: str, expiration: int = PRSIGNED_URL_EXPIRATION
     ):
@@ -1,2 +1,2 @@
 # apps/common/db/tasks/__init__.py
-from . import db
+from . import db, outbox, s3
@@ -0,0 +1,16 @@
+from celery import shared_task
+
+
+# Imported in the task bodies, as apps.common loads this before the models.
+@shared_task
+def relay_outbox(topic: str):
+    from apps.common.outbox import OutboxService
+
+    OutboxService.relay(topic)
+
+
+@shared_task
+def relay_all_outbox():
+    from apps.common.outbox import OutboxService
+
+    OutboxService.relay_all()
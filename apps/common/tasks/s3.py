@@ -0,0 +1,12 @@
+from celery import shared_task
+
+
+# Imported in the task body, as apps.common loads this before the models.
+@shared_task
+def collect_orphaned_s3_objects():
+    from apps.common.models import OutboxMessage
+    from apps.common.outbox import OutboxService
+    from apps.common.s3.s3_cleanup import S3CleanupService
+
+    S3CleanupService.collect_orphans()
+    OutboxService.relay(OutboxMessage.Topics.S3_DELETE)
@@ -0,0 +1,93 @@
+from io import BytesIO
+
+from botocore.exceptions import ClientError
+from django.utils.timezone import now
+
+
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client calls the app makes."""
+
+    def __init__(self):
+        self.objects = {}
+        self.content_types = {}
+        self.uploads = {}
+        self.aborted = []
+        self.last_modified = {}
+        # Keys DeleteObjects reports as errors, as for a denied delete.
+        self.undeletable = set()
+        self.delete_requests = 0
+
+    def upload_fileobj(self, file, bucket, key, ExtraArgs=None):
+        self.objects[key] = file.read()
+        self.content_types[key] = (ExtraArgs or {}).get("ContentType")
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {
+            "ContentLength": len(self.objects[Key]),
+            "ContentType": self.content_types.get(Key),
+        }
+
+    def get_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": BytesIO(self.objects[Key])}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def delete_objects(self, Bucket, Delete):
+        self.delete_requests += 1
+        errors = []
+        for entry in Delete["Objects"]:
+            if entry["Key"] in self.undeletable:
+                errors.append({"Key": entry["Key"], "Code": "AccessDenied"})
+            else:
+                self.objects.pop(entry["Key"], None)
+        return {"Errors": errors} if errors else {}
+
+    def get_paginator(self, operation):
+        return FakePaginator(self)
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = []
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.uploads[UploadId].append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.objects[Key] = b"".join(self.uploads.pop(UploadId))
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(Key)
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"https://s3.test/{Params['Key']}?expires={ExpiresIn}"
+
+    def generate_presigned_post(self, Bucket, Key, Fields, Conditions, ExpiresIn):
+        return {
+            "url": f"https://{Bucket}.s3.test/",
+            "fields": {
+                **Fields,
+                "key": Key,
+                "policy": f"conditions-{len(Conditions)}",
+            },
+        }
+
+
+class FakePaginator:
+    def __init__(self, client: FakeS3Client):
+        self.client = client
+
+    def paginate(self, Bucket, Prefix):
+        yield {
+            "Contents": [
+                {"Key": key, "LastModified": self.client.last_modified.get(key, now())}
+                for key in sorted(self.client.objects)
+                if key.startswith(Prefix)
+            ]
+        }
@@ -0,0 +1,128 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.core import mail
+from django.db import transaction
+from django.test import TestCase
+from django.utils.timezone import now
+
+from apps.common.models import OutboxMessage
+from apps.common.outbox import OUTBOX_CLAIM_TIMEOUT, OutboxService
+from apps.marketplace.models import SoldItemListing
+from apps.marketplace.processors import ItemListingCreateProcessor
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_listing,
+    create_member,
+    create_store,
+    create_tags,
+)
+from apps.notifications.emails.services import email_service
+from apps.notifications.emails.services.email_senders import ListingEmailSender
+from apps.notifications.emails.services.email_service import (
+    send_email,
+    send_email_batch_task,
+    send_email_task,
+)
+from apps.payments.models.transactions import ItemPaymentTransaction
+
+TEMPLATE_NAME = "action_triggered/member_item_sold.html"
+
+
+class TestOutbox(TestCase):
+    def setUp(self):
+        self.store = create_store()
+        self.item = create_item(create_member(), create_category(), create_condition())
+        (self.tag,) = create_tags(self.store, 1)
+
+    def test_processor_emails_are_sent_only_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            ItemListingCreateProcessor(self.item, self.tag).process()
+            self.assertEqual(mail.outbox, [])
+            self.assertEqual(OutboxMessage.objects.count(), 1)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_rolled_back_processor_sends_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                ItemListingCreateProcessor(self.item, self.tag).process()
+                raise RuntimeError
+
+        self.assertEqual(callbacks, [])
+        self.assertFalse(OutboxMessage.objects.exists())
+        self.assertEqual(mail.outbox, [])
+
+    def test_only_failed_emails_are_retried(self):
+        for to in ["ok@test.com", "bad@test.com"]:
+            send_email("Sold", to, TEMPLATE_NAME, {"item_name": "Jacket"})
+        build_email_message = email_service.build_email_message
+
+        def fail_for_bad_address(**email):
+            if email["to"] == "bad@test.com":
+                raise ConnectionError
+            return build_email_message(**email)
+
+        with mock.patch.object(
+            email_service, "build_email_message", side_effect=fail_for_bad_address
+        ):
+            delivered = OutboxService.relay(OutboxMessage.Topics.EMAIL)
+
+        self.assertEqual(delivered, 1)
+        self.assertEqual([email.to for email in mail.outbox], [["ok@test.com"]])
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.payload["to"], "bad@test.com")
+        self.assertEqual(message.attempts, 1)
+        self.assertIsNone(message.claimed_at)
+
+    def test_abandoned_claims_are_taken_over(self):
+        send_email("Sold", "ok@test.com", TEMPLATE_NAME, {"item_name": "Jacket"})
+        OutboxMessage.objects.update(claimed_at=now())
+        self.assertEqual(OutboxService.relay(OutboxMessage.Topics.EMAIL), 0)
+
+        OutboxMessage.objects.update(claimed_at=now() - OUTBOX_CLAIM_TIMEOUT * 2)
+        self.assertEqual(OutboxService.relay(OutboxMessage.Topics.EMAIL), 1)
+
+    def test_sale_emails_with_decimal_prices_go_through_the_outbox(self):
+        listing = create_listing(self.item, self.tag)
+        payment = ItemPaymentTransaction.objects.create(
+            amount=Decimal("12.00"),
+            item=self.item,
+            member=self.item.owner,
+            store=self.store,
+            buyer_email="buyer@test.com",
+        )
+        sold_listing = SoldItemListing.objects.create(
+            item=self.item,
+            tag=self.tag,
+            store=self.store,
+            store_commission=self.store.commission,
+            min_listing_days=self.store.min_listing_days,
+            transaction=payment,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ListingEmailSender.send_listing_sold_email(listing)
+            ListingEmailSender.send_listing_purchased_email(sold_listing)
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn(str(listing.member_earnings), mail.outbox[0].body)
+        self.assertIn("12.00", mail.outbox[1].body)
+
+    def test_tasks_queued_before_the_outbox_are_still_delivered(self):
+        context = {"item_name": "Jacket"}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            send_email_task.delay("Sold", "one@test.com", TEMPLATE_NAME, context)
+            send_email_batch_task.delay(
+                [["Sold", "two@test.com", TEMPLATE_NAME, context, None, None]]
+            )
+
+        self.assertEqual(
+            sorted(email.to[0] for email in mail.outbox),
+            ["one@test.com", "two@test.com"],
+        )
+        self.assertFalse(OutboxMessage.objects.exists())
@@ -0,0 +1,136 @@
+from datetime import timedelta
+from io import BytesIO
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+from django.utils.timezone import now
+
+from apps.common.models import OutboxMessage
+from apps.common.outbox import OUTBOX_MAX_ATTEMPTS, OUTBOX_TOPICS, OutboxService
+from apps.common.s3.s3_cleanup import S3CleanupService
+from apps.common.s3.s3_config import (
+    S3_ORPHAN_GRACE_PERIOD,
+    get_item_image_key,
+    get_item_image_upload_key,
+    get_tag_image_key,
+)
+from apps.common.s3.s3_utils import S3ClientBase, S3Service
+from apps.common.tests.fakes import FakeS3Client
+from apps.items.models import ItemImages
+from apps.items.services import ItemImageService
+from apps.members.services import MemberService
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_member,
+    create_store,
+    create_tags,
+)
+from apps.stores.services.tags_services import TagService
+
+
+class TestS3Cleanup(TestCase):
+    def setUp(self):
+        self.member = create_member()
+        self.item = create_item(self.member, create_category(), create_condition())
+        self.s3_client = FakeS3Client()
+        patcher = mock.patch.object(
+            S3ClientBase, "get_s3_client", return_value=self.s3_client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _store(self, key: str, age: timedelta = S3_ORPHAN_GRACE_PERIOD * 2):
+        self.s3_client.objects[key] = b"data"
+        self.s3_client.last_modified[key] = now() - age
+
+    def _relay(self):
+        return OutboxService.relay(OutboxMessage.Topics.S3_DELETE)
+
+    def test_deleting_images_queues_keys_until_commit(self):
+        key = get_item_image_key(self.item, 0)
+        self._store(key)
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            ItemImageService.delete_item_images(self.item)
+            raise RuntimeError
+        self.assertFalse(OutboxMessage.objects.exists())
+
+        ItemImageService.delete_item_images(self.item)
+
+        self.assertIn(key, self.s3_client.objects)
+        self.assertEqual(self._relay(), 1)
+        self.assertNotIn(key, self.s3_client.objects)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_relay_batches_and_retries_refused_keys(self):
+        keys = [f"members/{self.member.id}/items/{i}.jpg" for i in range(5)]
+        for key in keys:
+            self._store(key)
+        self.s3_client.undeletable.add(keys[0])
+        S3CleanupService.queue_deletions(keys)
+        topic = OutboxMessage.Topics.S3_DELETE
+
+        with mock.patch.dict(
+            OUTBOX_TOPICS, {topic: OUTBOX_TOPICS[topic]._replace(batch_size=2)}
+        ):
+            deleted = self._relay()
+
+        self.assertEqual(deleted, 4)
+        self.assertEqual(self.s3_client.delete_requests, 3)
+        self.assertEqual(OutboxMessage.objects.get().attempts, 1)
+
+        for _ in range(OUTBOX_MAX_ATTEMPTS - 1):
+            self._relay()
+        self.assertIsNotNone(OutboxMessage.objects.get().dead_lettered_at)
+        requests = self.s3_client.delete_requests
+        self.assertEqual(self._relay(), 0)
+        self.assertEqual(self.s3_client.delete_requests, requests)
+
+    def test_replacing_a_profile_photo_keeps_the_new_one(self):
+        s3_service = S3Service()
+        MemberService.update_member_profile_photo(self.member, BytesIO(b"first"))
+        first_key = s3_service.get_key_from_s3_url(self.member.profile_photo_url)
+        MemberService.delete_member_profile_photo(self.member)
+
+        # Uploaded before the queued delete of the first photo is relayed.
+        MemberService.update_member_profile_photo(self.member, BytesIO(b"second"))
+        self._relay()
+
+        second_key = s3_service.get_key_from_s3_url(self.member.profile_photo_url)
+        self.assertNotEqual(first_key, second_key)
+        self.assertEqual(set(self.s3_client.objects), {second_key})
+
+    def test_regenerating_tags_queues_the_old_tag_images(self):
+        (tag,) = create_tags(create_store(), 1)
+        self._store(get_tag_image_key(tag))
+
+        TagService.generate_tags_for_group(tag.tag_group)
+        self._relay()
+
+        self.assertNotIn(get_tag_image_key(tag), self.s3_client.objects)
+
+    def test_collector_purges_only_old_unreferenced_objects(self):
+        s3_service = S3Service()
+        referenced = get_item_image_key(self.item, 0)
+        ItemImages.objects.filter(item=self.item).update(
+            image_url=s3_service.generate_s3_url(referenced)
+        )
+        (tag,) = create_tags(create_store(), 1)
+        orphan = get_item_image_key(self.item, 3)
+        recent_upload = get_item_image_upload_key(self.member, "abc")
+        self._store(referenced)
+        self._store(get_tag_image_key(tag))
+        self._store(orphan)
+        self._store(recent_upload, age=timedelta(minutes=5))
+        self._store("exports/report.csv")
+
+        self.assertEqual(S3CleanupService.collect_orphans(), 1)
+        self._relay()
+
+        self.assertEqual(
+            set(self.s3_client.objects),
+            {referenced, get_tag_image_key(tag), recent_upload, "exports/report.csv"},
+        )
@@ -0,0 +1,76 @@
+import os
+import threading
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.common.s3.s3_config import S3_MAX_ATTEMPTS, S3_MAX_POOL_CONNECTIONS
+from apps.common.s3.s3_utils import S3ClientBase, S3Service
+
+
+class TestSharedS3Client(SimpleTestCase):
+    def setUp(self):
+        S3ClientBase.reset_s3_client()
+        self.addCleanup(S3ClientBase.reset_s3_client)
+
+    def test_services_share_one_tuned_client(self):
+        first, second = S3Service(), S3Service()
+
+        self.assertIs(first.s3_client, second.s3_client)
+        config = first.s3_client.meta.config
+        self.assertEqual(config.max_pool_connections, S3_MAX_POOL_CONNECTIONS)
+        self.assertEqual(config.retries["total_max_attempts"], S3_MAX_ATTEMPTS)
+
+    def test_concurrent_first_use_creates_one_client(self):
+        created = []
+
+        def create_s3_client(service):
+            time.sleep(0.01)
+            created.append(object())
+            return created[-1]
+
+        with mock.patch.object(S3ClientBase, "create_s3_client", create_s3_client):
+            clients = []
+            threads = [
+                threading.Thread(target=lambda: clients.append(S3Service().s3_client))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(set(map(id, clients)), {id(created[0])})
+
+    def test_reset_builds_a_new_client(self):
+        client = S3Service().s3_client
+
+        S3ClientBase.reset_s3_client()
+
+        self.assertIsNot(S3Service().s3_client, client)
+
+    def test_reset_does_not_wait_for_a_held_lock(self):
+        # As in a child forked while another thread was creating the client.
+        S3ClientBase._client_lock.acquire()
+
+        S3ClientBase.reset_s3_client()
+
+        self.assertFalse(S3ClientBase._client_lock.locked())
+        self.assertIsNotNone(S3Service().s3_client)
+
+    def test_forked_children_build_their_own_client(self):
+        client = S3Service().s3_client
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            os.write(write, b"1" if S3ClientBase._client is None else b"0")
+            os._exit(0)
+
+        os.close(write)
+        os.waitpid(pid, 0)
+        with os.fdopen(read, "rb") as pipe:
+            self.assertEqual(pipe.read(), b"1")
+        self.assertIs(S3Service().s3_client, client)
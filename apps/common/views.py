@@ -0,0 +1,49 @@
+from django.utils.cache import patch_cache_control
+from rest_framework import generics, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.common.constants import IMAGE_VARIANT
+from apps.common.reference_data import ReferenceDataCache
+
+REFERENCE_DATA_MAX_AGE = 60 * 5
+
+
+class ImageVariantMixin:
+    """
+    Serves the given item image variant as main_image, so list pages get
+    small images while detail pages keep larger ones.
+    """
+
+    image_variant: str = None
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context[IMAGE_VARIANT] = self.image_variant
+        return context
+
+
+class ReferenceDataListView(generics.ListAPIView):
+    """
+    Lists a reference table from its process-local cache, with an ETag so
+    clients can revalidate without downloading the table again.
+    """
+
+    reference_data: ReferenceDataCache = None
+
+    def list(self, request: Request, *args, **kwargs):
+        etag = self.reference_data.get_etag(request.get_full_path())
+
+        if etag in request.headers.get("If-None-Match", ""):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            rows = self.reference_data.all_data()
+            page = self.paginate_queryset(rows)
+            if page is not None:
+                response = self.get_paginated_response(page)
+            else:
+                response = Response(rows)
+
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=REFERENCE_DATA_MAX_AGE)
+        return response
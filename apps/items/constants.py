@@ -0,0 +1,32 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ItemImageVariant(models.TextChoices):
+    THUMBNAIL = "thumbnail", _("Thumbnail")
+    MEDIUM = "medium", _("Medium")
+    LARGE = "large", _("Large")
+
+
+class ItemImageFormat(models.TextChoices):
+    WEBP = "webp", _("WebP")
+    # Only produced where Pillow is built with AVIF support.
+    AVIF = "avif", _("AVIF")
+
+
+class ItemImageUploadContentType(models.TextChoices):
+    # Raster formats only: staged uploads are served from S3 until they are
+    # processed, so types a browser would run (e.g. image/svg+xml) are refused.
+    JPEG = "image/jpeg", _("JPEG")
+    PNG = "image/png", _("PNG")
+    WEBP = "image/webp", _("WebP")
+
+
+# Widths item images are resized down to; smaller images are not upscaled.
+ITEM_IMAGE_VARIANT_WIDTHS = {
+    ItemImageVariant.THUMBNAIL: 320,
+    ItemImageVariant.MEDIUM: 640,
+    ItemImageVariant.LARGE: 1280,
+}
+# Longest edge of the re-encoded original.
+ITEM_IMAGE_MAX_DIMENSION = 2048
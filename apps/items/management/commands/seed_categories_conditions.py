@@ -4,6 +4,7 @@ import os
 from django.core.management.base import BaseCommand
 
 from apps.items.models import ItemCategory, ItemCondition
+from apps.items.reference_data import item_categories, item_conditions
 from apps.common.constants import FIELDS, CONDITION, NAME, DESCRIPTION
 
 
@@ -25,6 +26,9 @@ class Command(BaseCommand):
             categories_data = json.load(file)
             self.sync_categories(categories_data)
 
+        item_conditions.invalidate()
+        item_categories.invalidate()
+
         self.stdout.write(
             self.style.SUCCESS("Successfully synced item categories and conditions")
         )
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="itemimages",
+            options={"ordering": ["order"]},
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0002_item_images_ordering"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="itemimages",
+            name="variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
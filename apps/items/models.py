@@ -1,12 +1,12 @@
 from django.db import models
 from decimal import Decimal
-from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator
 from django.utils.translation import gettext_lazy as _
 
 from apps.members.models import MemberProfile as Member
 from apps.common.constants import ITEMS, ORDER, IMAGES
+from apps.items.constants import ItemImageFormat
 
 
 User = get_user_model()
@@ -74,13 +74,11 @@ class Item(models.Model):
 
     @property
     def main_image(self):
-        main_image = self.images.order_by(ORDER).first()
-        return main_image.image_url if main_image else None
+        return self.get_main_image()
 
-    @property
-    def images(self):
-        images = self.images.order_by(ORDER).all()
-        return images if images else []
+    def get_main_image(self, variant: str = None):
+        main_image = next(iter(self.images.all()), None)
+        return main_image.get_url(variant) if main_image else None
 
     @property
     def category_details(self):
@@ -92,9 +90,8 @@ class Item(models.Model):
 
     @property
     def tag_id(self):
-        ItemListing = apps.get_model("marketplace", "ItemListing")
-        item_listing = ItemListing.objects.filter(item=self).first()
-        return item_listing.tag.id if item_listing else None
+        item_listing = next(iter(self.itemlisting_set.all()), None)
+        return item_listing.tag_id if item_listing else None
 
 
 class ItemImages(models.Model):
@@ -102,12 +99,33 @@ class ItemImages(models.Model):
 
     item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name=IMAGES)
     image_url = models.URLField(blank=True, null=True)
+    # Resized copies by variant and file type, e.g. {"medium": {"webp": url}}.
+    # Empty until the variants task has processed the image.
+    variants = models.JSONField(default=dict, blank=True)
     order = models.IntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "item_images"
+        ordering = [ORDER]
 
     def __str__(self):
         return self.image
+
+    def get_url(self, variant: str = None, file_type: str = ItemImageFormat.WEBP):
+        """The variant's URL, or the original's if it has not been made yet."""
+        return self.variants.get(variant, {}).get(file_type) or self.image_url
+
+
+class ItemImageUpload(models.Model):
+    """A direct upload's staging key, recorded once an item is made from it."""
+
+    key = models.CharField(max_length=255, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "item_image_uploads"
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,9 @@
+from apps.common.reference_data import ReferenceDataCache
+from apps.items.models import ItemCategory, ItemCondition
+
+item_categories = ReferenceDataCache(
+    ItemCategory, "apps.items.serializers.ItemCategorySerializer"
+)
+item_conditions = ReferenceDataCache(
+    ItemCondition, "apps.items.serializers.ItemConditionSerializer"
+)
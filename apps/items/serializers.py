@@ -1,14 +1,23 @@
+from functools import partial
+
+from django.db import transaction
 from rest_framework import serializers
 
+from apps.items.constants import ItemImageUploadContentType
 from apps.items.models import Item, ItemCategory, ItemCondition, ItemImages
 from apps.items.services import ItemService, ItemImageService
+from apps.items.tasks import (
+    process_uploaded_item_image,
+    schedule_item_image_variants,
+)
+from apps.items.reference_data import item_categories, item_conditions
 from apps.common.constants import *
 
 
 class ItemImagesSerializer(serializers.ModelSerializer):
     class Meta:
         model = ItemImages
-        fields = [IMAGE_URL, ORDER]
+        fields = [IMAGE_URL, VARIANTS, ORDER]
 
 
 class ItemCreateSerializer(serializers.ModelSerializer):
@@ -37,9 +46,52 @@ class ItemCreateSerializer(serializers.ModelSerializer):
 
         try:
             item = ItemImageService.create_item_and_image(validated_data, member, image)
-            return item
         except Exception as e:
             raise serializers.ValidationError(f"Failed to create item: {e}")
+        schedule_item_image_variants(item.id)
+        return item
+
+
+class ItemImageUploadSerializer(serializers.Serializer):
+    content_type = serializers.ChoiceField(
+        choices=ItemImageUploadContentType.choices, write_only=True
+    )
+
+
+class ItemFromUploadCreateSerializer(serializers.ModelSerializer):
+    upload_key = serializers.CharField(write_only=True)
+    images = ItemImagesSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Item
+        fields = [
+            ID,
+            NAME,
+            DESCRIPTION,
+            SIZE,
+            BRAND,
+            PRICE,
+            CONDITION,
+            CATEGORY,
+            UPLOAD_KEY,
+            IMAGES,
+        ]
+
+    def validate_upload_key(self, upload_key: str):
+        member = self.context.get(REQUEST).user.member
+        ItemImageService.validate_image_upload(member, upload_key)
+        return upload_key
+
+    def create(self, validated_data: dict):
+        member = self.context.get(REQUEST).user.member
+        upload_key = validated_data.pop(UPLOAD_KEY)
+        item, item_image = ItemImageService.create_item_from_upload(
+            validated_data, member, upload_key
+        )
+        transaction.on_commit(
+            partial(process_uploaded_item_image.delay, item_image.id, upload_key)
+        )
+        return item
 
 
 class FlatItemSerializer(serializers.ModelSerializer):
@@ -99,6 +151,7 @@ class ItemRetrieveUpdateDeleteSerializer(serializers.ModelSerializer):
             item = ItemService.update_item(item, validated_data)
         if image:
             ItemImageService.update_and_replace_item_image(item, image)
+            schedule_item_image_variants(item.id)
 
         return item
 
@@ -106,13 +159,13 @@ class ItemRetrieveUpdateDeleteSerializer(serializers.ModelSerializer):
         ItemImageService.delete_item_and_images(item)
 
     def get_main_image(self, item: Item):
-        return item.main_image
+        return item.get_main_image(self.context.get(IMAGE_VARIANT))
 
     def get_category_details(self, item: Item):
-        return ItemCategorySerializer(item.category).data
+        return item_categories.get_data(item.category_id)
 
     def get_condition_details(self, item: Item):
-        return ItemConditionSerializer(item.condition).data
+        return item_conditions.get_data(item.condition_id)
 
     def get_tag_id(self, item: Item):
         return item.tag_id
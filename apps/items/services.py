@@ -1,12 +1,49 @@
-from django.db import transaction
+import uuid
+from io import BytesIO
+
+from django.db import IntegrityError, transaction
+from django.utils.timezone import now
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from PIL import Image, ImageOps, UnidentifiedImageError
 
-from apps.items.models import Item, ItemImages
+from apps.items.constants import (
+    ITEM_IMAGE_MAX_DIMENSION,
+    ITEM_IMAGE_VARIANT_WIDTHS,
+    ItemImageFormat,
+    ItemImageUploadContentType,
+)
+from apps.items.models import Item, ItemImages, ItemImageUpload
 from apps.common.s3.s3_utils import S3Service
-from apps.common.s3.s3_config import get_item_image_key
+from apps.common.s3.s3_cleanup import S3CleanupService
+from apps.common.s3.s3_config import (
+    IMAGE_FILE_TYPE,
+    ITEM_IMAGE_MAX_UPLOAD_SIZE,
+    get_item_image_key,
+    get_item_image_variant_key,
+    get_item_image_upload_key,
+    get_item_image_upload_prefix,
+)
+from apps.marketplace.models import ItemListing, RecalledItemListing
+from apps.marketplace.services.listing_cache_services import ListingCacheService
 from apps.common.constants import *
 
+# Pillow format name and save options per file type.
+IMAGE_FORMATS = {
+    IMAGE_FILE_TYPE: ("JPEG", {"quality": 85, "optimize": True, "progressive": True}),
+    ItemImageFormat.WEBP: ("WEBP", {"quality": 80, "method": 4}),
+    ItemImageFormat.AVIF: ("AVIF", {"quality": 60}),
+}
+# Variant file types this Pillow build can write, worked out once. Pillow 10
+# only writes AVIF through a plugin, while newer builds may bundle it.
+Image.init()
+VARIANT_FILE_TYPES = [
+    file_type
+    for file_type in ItemImageFormat
+    if IMAGE_FORMATS[file_type][0] in Image.SAVE
+]
+IMAGE_DECODE_ERRORS = (UnidentifiedImageError, Image.DecompressionBombError, OSError)
+
 
 class ItemService:
     @staticmethod
@@ -30,12 +67,22 @@ class ItemService:
             for key, value in validated_data.items():
                 setattr(item, key, value)
             item.save()
+            if PRICE in validated_data:
+                # Sold and delisted listings keep the price they closed at.
+                ItemListing.objects.filter(item=item).reprice(item.price)
+                RecalledItemListing.objects.filter(item=item).reprice(item.price)
+            ListingCacheService.invalidate_item(item.id)
             return item
         except Exception as e:
             raise serializers.ValidationError(f"Failed to update item attributes: {e}")
 
     @staticmethod
     def delete_item_if_allowed(item):
+        ItemService.validate_item_deletable(item)
+        item.delete()
+
+    @staticmethod
+    def validate_item_deletable(item):
         if item.status not in [Item.Statuses.AVAILABLE, Item.Statuses.ABANDONED]:
             disallowed_statuses = [
                 status
@@ -50,7 +97,6 @@ class ItemService:
                     DETAIL: f"This item is currently {item.status}. Only items that are: {joined_statuses} can be deleted."
                 }
             )
-        item.delete()
 
     @staticmethod
     def list_item(item: Item):
@@ -82,6 +128,12 @@ class ItemService:
         item.status = Item.Statuses.ABANDONED
         item.save()
 
+    @staticmethod
+    def abandon_items(item_ids: list[int]):
+        Item.objects.filter(id__in=item_ids).update(
+            status=Item.Statuses.ABANDONED, updated_at=now()
+        )
+
 
 class ItemValidationService:
     @staticmethod
@@ -105,8 +157,12 @@ class ItemImageService:
     def update_item_image(item: Item, image_url: str, order=0):
         try:
             item_image, created = ItemImages.objects.update_or_create(
-                item=item, order=order, defaults={IMAGE_URL: image_url}
+                item=item,
+                order=order,
+                # The old variants are stale until the new ones are made.
+                defaults={IMAGE_URL: image_url, VARIANTS: {}},
             )
+            ListingCacheService.invalidate_item(item.id)
             return item_image
         except Exception as e:
             raise serializers.ValidationError(f"Failed to create item images: {e}")
@@ -131,6 +187,172 @@ class ItemImageService:
         except Exception as e:
             raise serializers.ValidationError(f"Failed to create item and images: {e}")
 
+    @staticmethod
+    def create_image_upload(member, content_type: str):
+        """
+        Reserves a staging key for a new item image and returns the presigned
+        POST the client uploads it with, so the file never passes through
+        the web workers. S3 only accepts the upload with content_type.
+        """
+        key = get_item_image_upload_key(member, uuid.uuid4().hex)
+        try:
+            presigned_post = S3Service().generate_presigned_post(
+                key, ITEM_IMAGE_MAX_UPLOAD_SIZE, content_type
+            )
+        except Exception as e:
+            raise serializers.ValidationError(f"Failed to create image upload: {e}")
+        return {
+            UPLOAD_KEY: key,
+            UPLOAD_URL: presigned_post["url"],
+            FIELDS: presigned_post[FIELDS],
+        }
+
+    @staticmethod
+    def validate_image_upload(member, upload_key: str):
+        if not upload_key.startswith(get_item_image_upload_prefix(member)):
+            raise serializers.ValidationError("Invalid upload key.")
+        try:
+            metadata = S3Service().get_object_metadata(upload_key)
+        except Exception as e:
+            raise serializers.ValidationError(f"Failed to check image upload: {e}")
+        if metadata is None:
+            raise serializers.ValidationError("The image has not been uploaded.")
+        if metadata.get("ContentType") not in ItemImageUploadContentType.values:
+            raise serializers.ValidationError("Unsupported image type.")
+
+    @staticmethod
+    @transaction.atomic
+    def create_item_from_upload(item_data: dict, member, upload_key: str):
+        """
+        Records an item and its directly uploaded image. The image is served
+        from its staging key until process_uploaded_image moves it. Each key
+        can be finalized once; the unique ItemImageUpload row makes a second
+        or concurrent finalize of the same key fail.
+        """
+        try:
+            ItemImageUpload.objects.create(key=upload_key)
+        except IntegrityError:
+            raise serializers.ValidationError("This upload has already been used.")
+        item = ItemService.create_item(item_data, member)
+        item_image = ItemImages.objects.create(
+            item=item, image_url=S3Service().generate_s3_url(upload_key), order=0
+        )
+        return item, item_image
+
+    @staticmethod
+    def process_uploaded_image(item_image_id: int, upload_key: str):
+        """
+        Moves a directly uploaded image under the item's image key along
+        with its variants and drops the staging object. Files that are not
+        images are removed along with their ItemImages row.
+        """
+        s3_service = S3Service()
+        item_image = (
+            ItemImages.objects.select_related("item__owner")
+            .filter(id=item_image_id)
+            .first()
+        )
+        if item_image is None:
+            s3_service.delete_image(upload_key)
+            return None
+
+        try:
+            image = ItemImageService.open_image(s3_service.download_object(upload_key))
+        except IMAGE_DECODE_ERRORS:
+            item_image.delete()
+            s3_service.delete_image(upload_key)
+            ListingCacheService.invalidate_item(item_image.item_id)
+            return None
+
+        image_url = ItemImageService.store_image_derivatives(
+            s3_service, item_image, image
+        )
+        s3_service.delete_image(upload_key)
+        return image_url
+
+    @staticmethod
+    def create_image_variants(item_id: int, order=0):
+        """Builds the variants of an image uploaded through the API."""
+        item_image = (
+            ItemImages.objects.select_related("item__owner")
+            .filter(item_id=item_id, order=order)
+            .first()
+        )
+        if item_image is None:
+            return None
+
+        s3_service = S3Service()
+        key = get_item_image_key(item_image.item, order)
+        try:
+            image = ItemImageService.open_image(s3_service.download_object(key))
+        except IMAGE_DECODE_ERRORS:
+            return None
+        return ItemImageService.store_image_derivatives(s3_service, item_image, image)
+
+    @staticmethod
+    def store_image_derivatives(s3_service: S3Service, item_image: ItemImages, image):
+        """
+        Uploads the image as a JPEG no larger than ITEM_IMAGE_MAX_DIMENSION
+        under the item's image key, then each variant width in every
+        supported format, and records the URLs on the ItemImages row.
+        """
+        item = item_image.item
+        original = image.copy()
+        original.thumbnail((ITEM_IMAGE_MAX_DIMENSION, ITEM_IMAGE_MAX_DIMENSION))
+        image_url = s3_service.upload_image(
+            ItemImageService.encode_image(original, IMAGE_FORMATS[IMAGE_FILE_TYPE]),
+            get_item_image_key(item, item_image.order),
+            content_type="image/jpeg",
+        )
+
+        variants = {}
+        for variant, width in ITEM_IMAGE_VARIANT_WIDTHS.items():
+            resized = ItemImageService.resize_to_width(image, width)
+            variants[variant] = {
+                file_type: s3_service.upload_image(
+                    ItemImageService.encode_image(resized, IMAGE_FORMATS[file_type]),
+                    get_item_image_variant_key(
+                        item, item_image.order, variant, file_type
+                    ),
+                    content_type=f"image/{file_type}",
+                )
+                for file_type in ItemImageService.get_variant_file_types()
+            }
+
+        ItemImages.objects.filter(id=item_image.id).update(
+            image_url=image_url, variants=variants
+        )
+        ListingCacheService.invalidate_item(item.id)
+        return image_url
+
+    @staticmethod
+    def open_image(data: bytes):
+        """Decodes an upload upright, in RGB and without its metadata."""
+        with Image.open(BytesIO(data)) as image:
+            image = ImageOps.exif_transpose(image).convert("RGB")
+        # Drops EXIF (including GPS), ICC profiles and comments.
+        image.info.clear()
+        return image
+
+    @staticmethod
+    def resize_to_width(image, width: int):
+        if image.width <= width:
+            return image
+        height = max(1, round(image.height * width / image.width))
+        return image.resize((width, height), Image.Resampling.LANCZOS)
+
+    @staticmethod
+    def encode_image(image, image_format: tuple):
+        format_name, options = image_format
+        buffer = BytesIO()
+        image.save(buffer, format=format_name, **options)
+        buffer.seek(0)
+        return buffer
+
+    @staticmethod
+    def get_variant_file_types():
+        return VARIANT_FILE_TYPES
+
     @staticmethod
     def update_and_replace_item_image(item: Item, image, order=0):
         try:
@@ -144,10 +366,22 @@ class ItemImageService:
     @staticmethod
     @transaction.atomic
     def delete_item_images(item: Item):
+        """
+        Deletes the item's image rows and queues their S3 objects, which are
+        removed in a batch once this transaction has committed.
+        """
         try:
+            keys = []
             for image in item.images.all():
-                key = get_item_image_key(item, image.order)
-                S3Service().delete_image(key)
+                keys.append(get_item_image_key(item, image.order))
+                for variant, urls in image.variants.items():
+                    keys.extend(
+                        get_item_image_variant_key(
+                            item, image.order, variant, file_type
+                        )
+                        for file_type in urls
+                    )
+            S3CleanupService.queue_deletions(keys)
 
             ItemImages.objects.filter(item=item).delete()
         except Exception as e:
@@ -156,5 +390,8 @@ class ItemImageService:
     @staticmethod
     @transaction.atomic
     def delete_item_and_images(item: Item):
-        ItemService.delete_item_if_allowed(item)
+        # The image keys are derived from the item, so they are collected
+        # before the item row, and its pk, are gone.
+        ItemService.validate_item_deletable(item)
         ItemImageService.delete_item_images(item)
+        item.delete()
@@ -0,0 +1,29 @@
+from functools import partial
+
+from celery import shared_task
+from django.db import transaction
+
+from apps.items.services import ItemImageService
+
+
+# S3Service wraps S3 failures in Exception, and the service handles files
+# that do not decode, so anything raised here is worth retrying. Each attempt
+# starts again from the staging object.
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=5,
+)
+def process_uploaded_item_image(item_image_id: int, upload_key: str):
+    ItemImageService.process_uploaded_image(item_image_id, upload_key)
+
+
+@shared_task
+def process_item_image_variants(item_id: int, order: int = 0):
+    ItemImageService.create_image_variants(item_id, order)
+
+
+def schedule_item_image_variants(item_id: int, order: int = 0):
+    transaction.on_commit(partial(process_item_image_variants.delay, item_id, order))
@@ -0,0 +1,165 @@
+from io import BytesIO
+from unittest import mock
+
+from botocore.exceptions import ClientError
+from django.test import TestCase
+from PIL import Image
+from rest_framework.test import APIClient
+
+from apps.common.s3.s3_config import get_item_image_key
+from apps.common.s3.s3_utils import S3ClientBase
+from apps.common.tests.fakes import FakeS3Client
+from apps.items.models import Item, ItemImages
+from apps.items.tasks import process_uploaded_item_image
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_member,
+)
+
+UPLOAD_URL = "/v1/members/me/items/uploads/"
+FINALIZE_URL = "/v1/members/me/items/finalize/"
+
+
+def png_bytes():
+    buffer = BytesIO()
+    Image.new("RGBA", (8, 8), (255, 0, 0, 128)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestDirectItemImageUploads(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.member = create_member()
+        self.category = create_category()
+        self.condition = create_condition()
+        self.client.force_authenticate(self.member.user)
+        self.s3_client = FakeS3Client()
+        patcher = mock.patch.object(
+            S3ClientBase, "get_s3_client", return_value=self.s3_client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _request_upload(self):
+        response = self.client.post(
+            UPLOAD_URL, {"content_type": "image/png"}, format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        return response.data["upload_key"]
+
+    def _stage(self, upload_key: str, data: bytes, content_type="image/png"):
+        self.s3_client.objects[upload_key] = data
+        self.s3_client.content_types[upload_key] = content_type
+
+    def _finalize(self, upload_key: str):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                FINALIZE_URL,
+                {
+                    "name": "Jacket",
+                    "price": "12.00",
+                    "category": self.category.id,
+                    "condition": self.condition.id,
+                    "upload_key": upload_key,
+                },
+                format="json",
+            )
+
+    def test_upload_is_presigned_for_a_member_staging_key(self):
+        response = self.client.post(
+            UPLOAD_URL, {"content_type": "image/jpeg"}, format="json"
+        )
+
+        upload_key = response.data["upload_key"]
+        self.assertTrue(upload_key.startswith(f"members/{self.member.id}/uploads/"))
+        self.assertEqual(response.data["fields"]["key"], upload_key)
+        self.assertEqual(response.data["fields"]["Content-Type"], "image/jpeg")
+        self.assertTrue(response.data["upload_url"])
+
+    def test_only_raster_content_types_are_presigned(self):
+        response = self.client.post(
+            UPLOAD_URL, {"content_type": "image/svg+xml"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_finalize_records_the_item_and_processes_the_image(self):
+        upload_key = self._request_upload()
+        self._stage(upload_key, png_bytes())
+
+        response = self._finalize(upload_key)
+
+        self.assertEqual(response.status_code, 201)
+        item = Item.objects.get(id=response.data["id"])
+        image = ItemImages.objects.get(item=item)
+        key = get_item_image_key(item, 0)
+        self.assertTrue(image.image_url.endswith(key))
+        self.assertNotIn(upload_key, self.s3_client.objects)
+        with Image.open(BytesIO(self.s3_client.objects[key])) as stored:
+            self.assertEqual(stored.format, "JPEG")
+
+    def test_finalize_rejects_missing_and_foreign_uploads(self):
+        missing = self._finalize(self._request_upload())
+        other_member = create_member("other")
+        foreign_key = f"members/{other_member.id}/uploads/abc"
+        self._stage(foreign_key, png_bytes())
+        foreign = self._finalize(foreign_key)
+
+        self.assertEqual(missing.status_code, 400)
+        self.assertEqual(foreign.status_code, 400)
+        self.assertFalse(Item.objects.exists())
+
+    def test_files_that_are_not_images_are_discarded(self):
+        upload_key = self._request_upload()
+        self._stage(upload_key, b"not an image")
+
+        response = self._finalize(upload_key)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(ItemImages.objects.exists())
+        self.assertNotIn(upload_key, self.s3_client.objects)
+
+    def test_finalize_rejects_objects_of_other_content_types(self):
+        upload_key = self._request_upload()
+        self._stage(upload_key, b"<svg/>", content_type="image/svg+xml")
+
+        response = self._finalize(upload_key)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Item.objects.exists())
+
+    def test_an_upload_can_only_be_finalized_once(self):
+        upload_key = self._request_upload()
+        self._stage(upload_key, png_bytes())
+        # Finalized twice before the first processing run removes the object.
+        with mock.patch("apps.items.tasks.process_uploaded_item_image.delay"):
+            first = self._finalize(upload_key)
+            second = self._finalize(upload_key)
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 400)
+        self.assertEqual(Item.objects.count(), 1)
+
+    def test_processing_retries_s3_errors(self):
+        upload_key = self._request_upload()
+        self._stage(upload_key, png_bytes())
+        with mock.patch("apps.items.tasks.process_uploaded_item_image.delay"):
+            item = Item.objects.get(id=self._finalize(upload_key).data["id"])
+        image = ItemImages.objects.get(item=item)
+        outage = ClientError({"Error": {"Code": "SlowDown"}}, "GetObject")
+
+        with mock.patch.object(
+            self.s3_client,
+            "get_object",
+            side_effect=[outage, {"Body": BytesIO(png_bytes())}],
+        ):
+            # Without throw, eager tasks retry in place rather than raising.
+            result = process_uploaded_item_image.apply(
+                (image.id, upload_key), throw=False
+            )
+
+        self.assertTrue(result.successful())
+        image.refresh_from_db()
+        self.assertTrue(image.image_url.endswith(get_item_image_key(item, 0)))
+        self.assertNotIn(upload_key, self.s3_client.objects)
@@ -0,0 +1,135 @@
+from io import BytesIO
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from PIL import Image
+from rest_framework.test import APIClient
+
+from apps.common.s3.s3_config import get_item_image_key, get_item_image_variant_key
+from apps.common.s3.s3_utils import S3ClientBase
+from apps.common.tests.fakes import FakeS3Client
+from apps.items import services
+from apps.items.constants import (
+    ITEM_IMAGE_VARIANT_WIDTHS,
+    ItemImageFormat,
+    ItemImageVariant,
+)
+from apps.items.models import ItemImages
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_listing,
+    create_member,
+    create_store,
+    create_tags,
+)
+
+# Orientation and GPS tags, as a phone camera would write them.
+EXIF_ORIENTATION = 0x0112
+EXIF_GPS_INFO = 0x8825
+
+
+def photo_bytes(width: int, height: int):
+    exif = Image.Exif()
+    exif[EXIF_ORIENTATION] = 1
+    exif[EXIF_GPS_INFO] = {1: "N", 2: (51.0, 30.0, 0.0)}
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), (30, 120, 200)).save(
+        buffer, format="JPEG", exif=exif
+    )
+    return buffer.getvalue()
+
+
+class TestItemImageVariants(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.member = create_member()
+        self.category = create_category()
+        self.condition = create_condition()
+        self.client.force_authenticate(self.member.user)
+        self.s3_client = FakeS3Client()
+        patcher = mock.patch.object(
+            S3ClientBase, "get_s3_client", return_value=self.s3_client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # WebP only, as with the locked Pillow 10, whatever this build writes.
+        patcher = mock.patch.object(
+            services, "VARIANT_FILE_TYPES", [ItemImageFormat.WEBP]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _create_item(self, width: int, height: int):
+        upload = SimpleUploadedFile(
+            "photo.jpg", photo_bytes(width, height), content_type="image/jpeg"
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/v1/members/me/items/",
+                {
+                    "name": "Jacket",
+                    "price": "12.00",
+                    "category": self.category.id,
+                    "condition": self.condition.id,
+                    "image": upload,
+                },
+            )
+        self.assertEqual(response.status_code, 201)
+        return ItemImages.objects.select_related("item__owner").get(
+            item_id=response.data["id"]
+        )
+
+    def _open(self, key: str):
+        return Image.open(BytesIO(self.s3_client.objects[key]))
+
+    def test_upload_produces_resized_variants_without_metadata(self):
+        item_image = self._create_item(3000, 2000)
+        item = item_image.item
+
+        with self._open(get_item_image_key(item, 0)) as original:
+            self.assertEqual(original.format, "JPEG")
+            self.assertEqual(max(original.size), 2048)
+            self.assertEqual(len(original.getexif()), 0)
+
+        for variant, width in ITEM_IMAGE_VARIANT_WIDTHS.items():
+            key = get_item_image_variant_key(item, 0, variant, "webp")
+            self.assertEqual(list(item_image.variants[variant]), ["webp"])
+            self.assertTrue(item_image.variants[variant]["webp"].endswith(key))
+            self.assertEqual(self.s3_client.content_types[key], "image/webp")
+            with self._open(key) as resized:
+                self.assertEqual(resized.format, "WEBP")
+                self.assertEqual(resized.width, width)
+                self.assertEqual(len(resized.getexif()), 0)
+
+    def test_small_images_are_not_upscaled(self):
+        item_image = self._create_item(400, 300)
+
+        key = get_item_image_variant_key(
+            item_image.item, 0, ItemImageVariant.LARGE, "webp"
+        )
+        with self._open(key) as resized:
+            self.assertEqual(resized.size, (400, 300))
+
+    def test_listing_pages_serve_the_medium_variant(self):
+        item_image = self._create_item(1000, 1000)
+        store = create_store()
+        (tag,) = create_tags(store, 1)
+        create_listing(item_image.item, tag)
+
+        response = self.client.get(f"/v1/stores/{store.id}/listings/")
+
+        main_image = response.data["results"][0]["item_details"]["main_image"]
+        self.assertEqual(
+            main_image, item_image.variants[ItemImageVariant.MEDIUM]["webp"]
+        )
+
+    def test_images_without_variants_fall_back_to_the_original(self):
+        item_image = self._create_item(100, 100)
+        ItemImages.objects.filter(id=item_image.id).update(variants={})
+        item_image.refresh_from_db()
+
+        self.assertEqual(
+            item_image.get_url(ItemImageVariant.MEDIUM), item_image.image_url
+        )
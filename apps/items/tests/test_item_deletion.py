@@ -0,0 +1,65 @@
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.common.models import OutboxMessage
+from apps.common.outbox import OutboxService
+from apps.common.s3.s3_config import get_item_image_key, get_item_image_variant_key
+from apps.common.s3.s3_utils import S3ClientBase
+from apps.common.tests.fakes import FakeS3Client
+from apps.items.constants import ItemImageVariant
+from apps.items.models import Item, ItemImages
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_member,
+)
+
+
+class TestItemDeletion(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.member = create_member()
+        self.client.force_authenticate(self.member.user)
+        self.item = create_item(
+            self.member, create_category(), create_condition(), images=2
+        )
+        self.s3_client = FakeS3Client()
+        patcher = mock.patch.object(
+            S3ClientBase, "get_s3_client", return_value=self.s3_client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _url(self):
+        return f"/v1/members/me/items/{self.item.id}/"
+
+    def test_deleting_an_item_removes_its_images_from_s3(self):
+        variant_key = get_item_image_variant_key(
+            self.item, 0, ItemImageVariant.THUMBNAIL, "webp"
+        )
+        ItemImages.objects.filter(item=self.item, order=0).update(
+            variants={ItemImageVariant.THUMBNAIL: {"webp": "https://test.com/v.webp"}}
+        )
+        keys = [get_item_image_key(self.item, 0), get_item_image_key(self.item, 1)]
+        for key in [*keys, variant_key]:
+            self.s3_client.objects[key] = b"data"
+
+        response = self.client.delete(self._url())
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Item.objects.filter(id=self.item.id).exists())
+        self.assertFalse(ItemImages.objects.exists())
+        self.assertEqual(OutboxService.relay(OutboxMessage.Topics.S3_DELETE), 3)
+        self.assertEqual(self.s3_client.objects, {})
+
+    def test_items_that_cannot_be_deleted_keep_their_images(self):
+        Item.objects.filter(id=self.item.id).update(status=Item.Statuses.LISTED)
+
+        response = self.client.delete(self._url())
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(ItemImages.objects.filter(item=self.item).count(), 2)
+        self.assertFalse(OutboxMessage.objects.exists())
@@ -0,0 +1,95 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.common import reference_data
+from apps.items.models import ItemCategory
+from apps.items.reference_data import item_categories
+
+
+class TestReferenceDataCache(TestCase):
+    url = "/v1/items/categories/"
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.category = ItemCategory.objects.create(name="Tops")
+
+    def test_lookups_are_served_from_memory(self):
+        item_categories.get(self.category.id)
+
+        with CaptureQueriesContext(connection) as queries:
+            data = item_categories.get_data(self.category.id)
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(data["name"], "Tops")
+
+    def test_saving_a_row_bumps_the_shared_generation(self):
+        item_categories.all()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.name = "Shirts"
+            self.category.save()
+
+        self.assertEqual(cache.get(item_categories.generation_key), 1)
+        self.assertEqual(item_categories.get_data(self.category.id)["name"], "Shirts")
+
+    def test_reloads_when_another_process_bumps_the_generation(self):
+        item_categories.all()
+        ItemCategory.objects.filter(id=self.category.id).update(name="Shirts")
+
+        cache.set(item_categories.generation_key, 5)
+        item_categories._next_check = 0
+
+        self.assertEqual(item_categories.get_data(self.category.id)["name"], "Shirts")
+
+    def test_unknown_pks_reload_at_most_once_per_interval(self):
+        item_categories.all()
+        item_categories._next_missing_pk_reload = 0
+        unknown = self.category.id + 100
+
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(3):
+                self.assertIsNone(item_categories.get(unknown))
+
+        self.assertEqual(len(queries), 1)
+
+        # A row added without signals, e.g. by another process's seed script.
+        ItemCategory.objects.bulk_create([ItemCategory(id=unknown, name="Shirts")])
+        item_categories._next_missing_pk_reload = 0
+        self.assertEqual(item_categories.get(unknown).name, "Shirts")
+
+    def test_lookups_survive_a_cache_outage(self):
+        item_categories.invalidate()
+        broken_cache = mock.Mock()
+        broken_cache.get.side_effect = ConnectionError
+        broken_cache.incr.side_effect = ConnectionError
+
+        with mock.patch.object(reference_data, "cache", broken_cache):
+            self.assertEqual(item_categories.get_data(self.category.id)["name"], "Tops")
+            with self.captureOnCommitCallbacks(execute=True):
+                self.category.name = "Shirts"
+                self.category.save()
+            item_categories._next_check = 0
+            self.assertEqual(
+                item_categories.get_data(self.category.id)["name"], "Shirts"
+            )
+
+    def test_list_endpoint_supports_etag_revalidation(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["name"], "Tops")
+        self.assertIn("max-age", response["Cache-Control"])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+        ItemCategory.objects.create(name="Shirts")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 2)
@@ -2,6 +2,8 @@ from django.urls import path
 
 from apps.items.views import (
     MemberItemListCreateView,
+    MemberItemImageUploadView,
+    MemberItemFromUploadCreateView,
     MemberItemRetrieveUpdateDeleteView,
     ItemCategoryListView,
     ItemConditionListView,
@@ -9,6 +11,16 @@ from apps.items.views import (
 
 urlpatterns = [
     path("members/me/items/", MemberItemListCreateView.as_view(), name="create_item"),
+    path(
+        "members/me/items/uploads/",
+        MemberItemImageUploadView.as_view(),
+        name="item_image_upload",
+    ),
+    path(
+        "members/me/items/finalize/",
+        MemberItemFromUploadCreateView.as_view(),
+        name="create_item_from_upload",
+    ),
     path(
         "members/me/items/<int:pk>/",
         MemberItemRetrieveUpdateDeleteView.as_view(),
@@ -4,18 +4,26 @@ from rest_framework.response import Response
 
 from apps.items.serializers import (
     ItemCreateSerializer,
+    ItemFromUploadCreateSerializer,
+    ItemImageUploadSerializer,
     ItemRetrieveUpdateDeleteSerializer,
     ItemCategorySerializer,
     ItemConditionSerializer,
 )
+from apps.common.views import ImageVariantMixin, ReferenceDataListView
+from apps.items.constants import ItemImageVariant
 from apps.members.permissions import IsMemberUser
 from apps.items.permissions import IsItemOwner
-from apps.items.models import Item, ItemCategory, ItemCondition
+from apps.items.models import Item
+from apps.items.services import ItemImageService
+from apps.items.reference_data import item_categories, item_conditions
+from apps.common.constants import CONTENT_TYPE
 
 
-class MemberItemListCreateView(generics.ListCreateAPIView):
+class MemberItemListCreateView(ImageVariantMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsMemberUser]
     parser_classes = (MultiPartParser, FormParser)
+    image_variant = ItemImageVariant.THUMBNAIL
 
     def get_queryset(self):
         return Item.objects.filter(owner=self.request.user.member)
@@ -28,6 +36,28 @@ class MemberItemListCreateView(generics.ListCreateAPIView):
         )
 
 
+class MemberItemImageUploadView(generics.GenericAPIView):
+    """Hands out a presigned POST for uploading an item image straight to S3."""
+
+    permission_classes = [permissions.IsAuthenticated, IsMemberUser]
+    serializer_class = ItemImageUploadSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = ItemImageService.create_image_upload(
+            request.user.member, serializer.validated_data[CONTENT_TYPE]
+        )
+        return Response(upload, status=status.HTTP_201_CREATED)
+
+
+class MemberItemFromUploadCreateView(generics.CreateAPIView):
+    """Creates an item from an image the client has already uploaded to S3."""
+
+    permission_classes = [permissions.IsAuthenticated, IsMemberUser]
+    serializer_class = ItemFromUploadCreateSerializer
+
+
 class MemberItemRetrieveUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated, IsItemOwner]
     serializer_class = ItemRetrieveUpdateDeleteSerializer
@@ -40,11 +70,11 @@ class MemberItemRetrieveUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class ItemCategoryListView(generics.ListAPIView):
+class ItemCategoryListView(ReferenceDataListView):
     serializer_class = ItemCategorySerializer
-    queryset = ItemCategory.objects.all()
+    reference_data = item_categories
 
 
-class ItemConditionListView(generics.ListAPIView):
+class ItemConditionListView(ReferenceDataListView):
     serializer_class = ItemConditionSerializer
-    queryset = ItemCondition.objects.all()
+    reference_data = item_conditions
@@ -1,7 +1,21 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+
 class ListingRole(models.TextChoices):
     HOST = "HOST", _("Host Store")
     OWNER = "OWNER", _("Item Owner")
     VIEWER = "VIEWER", _("Viewer")
+
+
+class ListingTransition(models.TextChoices):
+    RECALL = "RECALL", _("Recall")
+    DELIST = "DELIST", _("Delist")
+    COLLECT = "COLLECT", _("Collect")
+
+
+class ListingState(models.TextChoices):
+    ACTIVE = "ACTIVE", _("Active")
+    RECALLED = "RECALLED", _("Recalled")
+    DELISTED = "DELISTED", _("Delisted")
+    SOLD = "SOLD", _("Sold")
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.common.constants import ID, STATE
+from apps.marketplace.models import Listing, UNIFIED_LISTING_MODELS
+from apps.marketplace.services.listing_transition_services import (
+    ListingTransitionService,
+)
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Copy the per-state listing tables into the unified listings table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BACKFILL_BATCH_SIZE,
+            help="Listings copied per INSERT ... SELECT.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        with transaction.atomic():
+            if Listing.objects.exists():
+                raise CommandError("The listings table has already been populated.")
+
+            for legacy_model, proxy_model in UNIFIED_LISTING_MODELS.items():
+                listing_ids = list(
+                    legacy_model.objects.order_by(ID).values_list(ID, flat=True)
+                )
+                for start in range(0, len(listing_ids), batch_size):
+                    ListingTransitionService.copy_listings(
+                        legacy_model,
+                        Listing,
+                        listing_ids[start : start + batch_size],
+                        {STATE: proxy_model.listing_state},
+                        keep_timestamps=True,
+                    )
+                self.stdout.write(
+                    f"{legacy_model._meta.db_table}: {len(listing_ids)} copied"
+                )
@@ -0,0 +1,262 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils.timezone import now
+
+from apps.accounts.models import User
+from apps.items.models import Item, ItemCategory, ItemCondition
+from apps.marketplace.models import ItemListing, RecalledItemListing, RecallReason
+from apps.members.models import MemberProfile
+from apps.payments.models.transactions import (
+    ItemCheckoutSession,
+    ItemPaymentTransaction,
+)
+from apps.stores.models import StoreProfile, Tag, TagGroup
+
+BENCHMARK_PREFIX = "idx_bench"
+INDEXED_MODELS = [
+    ItemListing,
+    RecalledItemListing,
+    ItemCheckoutSession,
+    ItemPaymentTransaction,
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway dataset and compare query plans and latency of the "
+        "marketplace lookup patterns with and without the Meta.indexes. "
+        "Everything runs in one transaction that is rolled back (PostgreSQL only)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--listings", type=int, default=1_000_000)
+        parser.add_argument("--stores", type=int, default=1_000)
+        parser.add_argument(
+            "--runs", type=int, default=20, help="Timed runs per lookup."
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("The index benchmark needs a PostgreSQL database.")
+
+        self.runs = options["runs"]
+
+        with transaction.atomic():
+            self.stdout.write("Seeding benchmark data...")
+            seed = self.seed(options["listings"], options["stores"])
+            lookups = self.get_lookups(seed)
+
+            self.drop_indexes()
+            before = self.measure(lookups)
+            self.create_indexes()
+            after = self.measure(lookups)
+
+            self.report(before, after)
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS("Benchmark data rolled back."))
+
+    def seed(self, listing_count: int, store_count: int):
+        category = ItemCategory.objects.create(name=f"{BENCHMARK_PREFIX}_category")
+        condition = ItemCondition.objects.create(
+            condition=f"{BENCHMARK_PREFIX}_condition"
+        )
+        reason = RecallReason.objects.create(
+            reason=BENCHMARK_PREFIX,
+            type=RecallReason.Type.ISSUE,
+            description=BENCHMARK_PREFIX,
+        )
+        member_user = User.objects.create(
+            username=f"{BENCHMARK_PREFIX}_member",
+            email=f"{BENCHMARK_PREFIX}_member@test.com",
+        )
+        member = MemberProfile.objects.create(user=member_user)
+
+        store_users = User.objects.bulk_create(
+            User(
+                username=f"{BENCHMARK_PREFIX}_store_{i}",
+                email=f"{BENCHMARK_PREFIX}_store_{i}@test.com",
+                role=User.Roles.STORE,
+            )
+            for i in range(store_count)
+        )
+        stores = StoreProfile.objects.bulk_create(
+            StoreProfile(user=user, store_name=user.username) for user in store_users
+        )
+        tag_groups = TagGroup.objects.bulk_create(
+            TagGroup(store=store, group_size=listing_count // store_count)
+            for store in stores
+        )
+        store_ids = [store.id for store in stores]
+        tag_group_ids = [tag_group.id for tag_group in tag_groups]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {Tag._meta.db_table}
+                    (tag_group_id, store_id, created_at, updated_at)
+                SELECT (%s::bigint[])[1 + g %% %s], (%s::bigint[])[1 + g %% %s],
+                       now(), now()
+                FROM generate_series(0, %s - 1) AS g
+                """,
+                [tag_group_ids, store_count, store_ids, store_count, listing_count],
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {Item._meta.db_table}
+                    (owner_id, name, price, category_id, condition_id, status,
+                     created_at, updated_at)
+                SELECT %s, 'item ' || g, 10 + g %% 90, %s, %s, %s,
+                       now() - g * interval '1 second', now()
+                FROM generate_series(0, %s - 1) AS g
+                """,
+                [
+                    member.id,
+                    category.id,
+                    condition.id,
+                    Item.Statuses.LISTED,
+                    listing_count,
+                ],
+            )
+            # Pair the n-th new tag with the n-th new item.
+            cursor.execute(
+                f"""
+                INSERT INTO {ItemListing._meta.db_table}
+                    (tag_id, item_id, store_id, store_commission, min_listing_days,
+                     listing_price, transaction_fee, store_commission_amount,
+                     member_earnings, created_at, updated_at)
+                SELECT t.id, i.id, t.store_id, 10, 14,
+                       round(i.price * 1.05 + 1, 2), round(i.price * 0.05 + 1, 2),
+                       round(i.price * 0.10, 2), round(i.price * 0.90, 2),
+                       i.created_at, now()
+                FROM (
+                    SELECT id, store_id, row_number() OVER (ORDER BY id) AS n
+                    FROM {Tag._meta.db_table} WHERE tag_group_id = ANY(%s)
+                ) t
+                JOIN (
+                    SELECT id, price, created_at,
+                           row_number() OVER (ORDER BY id) AS n
+                    FROM {Item._meta.db_table} WHERE owner_id = %s
+                ) i USING (n)
+                """,
+                [tag_group_ids, member.id],
+            )
+            # A tenth of the listings also have a recalled row, with collection
+            # deadlines spread over two months either side of today.
+            cursor.execute(
+                f"""
+                INSERT INTO {RecalledItemListing._meta.db_table}
+                    (tag_id, item_id, store_id, store_commission, min_listing_days,
+                     listing_price, transaction_fee, store_commission_amount,
+                     member_earnings, reason_id, recalled_at, collection_pin,
+                     collection_deadline, created_at, updated_at)
+                SELECT tag_id, item_id, store_id, 10, 14, listing_price,
+                       transaction_fee, store_commission_amount, member_earnings,
+                       %s, now(), '00',
+                       now() + ((id %% 120) - 60) * interval '1 day', now(), now()
+                FROM {ItemListing._meta.db_table}
+                WHERE store_id = ANY(%s) AND id %% 10 = 0
+                """,
+                [reason.id, store_ids],
+            )
+            # Checkout sessions and transactions for a tenth of the listings,
+            # with one in a hundred still unchecked by the cleanup tasks.
+            cursor.execute(
+                f"""
+                INSERT INTO {ItemCheckoutSession._meta.db_table}
+                    (session_id, item_id, store_id, checkout_status_checked,
+                     created_at, updated_at)
+                SELECT %s || '_cs_' || id, item_id, store_id, id %% 100 <> 0,
+                       created_at, now()
+                FROM {ItemListing._meta.db_table}
+                WHERE store_id = ANY(%s) AND id %% 10 = 0
+                """,
+                [BENCHMARK_PREFIX, store_ids],
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {ItemPaymentTransaction._meta.db_table}
+                    (amount, payment_intent_id, status, processed, item_id,
+                     member_id, store_id, store_commission, member_earnings,
+                     transaction_fee, payment_status_checked, created_at, updated_at)
+                SELECT 10, %s || '_pi_' || id, 'processing', false, item_id, %s,
+                       store_id, 1, 9, 1.5, id %% 100 <> 0, created_at, now()
+                FROM {ItemListing._meta.db_table}
+                WHERE store_id = ANY(%s) AND id %% 10 = 0
+                """,
+                [BENCHMARK_PREFIX, member.id, store_ids],
+            )
+            for model in INDEXED_MODELS:
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+        middle_listing = (
+            ItemListing.objects.filter(store_id__in=store_ids)
+            .order_by("id")
+            .values("tag_id", "item_id", "store_id")[listing_count // 2]
+        )
+        return middle_listing
+
+    def get_lookups(self, seed: dict):
+        return {
+            "listing by tag": ItemListing.objects.filter(tag_id=seed["tag_id"]),
+            "listing by item": ItemListing.objects.filter(item_id=seed["item_id"]),
+            "store listings page": ItemListing.objects.filter(
+                store_id=seed["store_id"]
+            ).order_by("-created_at")[:20],
+            "abandoned recalled sweep": RecalledItemListing.objects.filter(
+                collection_deadline__lt=now(),
+                collection_deadline__gte=now() - timedelta(hours=1),
+            ),
+            "unchecked checkout sessions": ItemCheckoutSession.objects.filter(
+                checkout_status_checked=False
+            ),
+            "unchecked payment transactions": ItemPaymentTransaction.objects.filter(
+                payment_status_checked=False
+            ),
+        }
+
+    def drop_indexes(self):
+        with connection.schema_editor() as schema_editor:
+            for model in INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    schema_editor.remove_index(model, index)
+
+    def create_indexes(self):
+        with connection.schema_editor() as schema_editor:
+            for model in INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    schema_editor.add_index(model, index)
+        with connection.cursor() as cursor:
+            for model in INDEXED_MODELS:
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def measure(self, lookups: dict):
+        results = {}
+        for name, queryset in lookups.items():
+            plan = queryset.explain(analyze=True)
+            timings = []
+            for _ in range(self.runs):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = {
+                "plan": plan.splitlines()[0].strip(),
+                "median_ms": statistics.median(timings),
+            }
+        return results
+
+    def report(self, before: dict, after: dict):
+        for name in before:
+            speedup = before[name]["median_ms"] / max(after[name]["median_ms"], 1e-6)
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(
+                f"  before: {before[name]['median_ms']:.2f} ms  {before[name]['plan']}"
+            )
+            self.stdout.write(
+                f"  after:  {after[name]['median_ms']:.2f} ms  {after[name]['plan']}"
+            )
+            self.stdout.write(f"  speedup: {speedup:.1f}x")
@@ -0,0 +1,39 @@
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+
+from apps.marketplace.services.pricing_services import PricingEngine
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare price breakdowns computed per second one listing at a time "
+        "versus in a batch of integer pence columns. Pure computation; the "
+        "database is not touched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--breakdowns", type=int, default=20000)
+        parser.add_argument("--seed", type=int, default=2024)
+
+    def handle(self, *args, **options):
+        count = options["breakdowns"]
+        rng = random.Random(options["seed"])
+        prices = [Decimal(rng.randint(0, 1_000_000)).scaleb(-2) for _ in range(count)]
+        commissions = [Decimal(rng.randint(0, 10_000)).scaleb(-2) for _ in range(count)]
+        engine = PricingEngine()
+
+        started = time.perf_counter()
+        for price, commission in zip(prices, commissions):
+            engine.calculate_breakdown(price, commission)
+        scalar = count / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        engine.calculate_breakdowns_in_pence(prices, commissions)
+        batch = count / (time.perf_counter() - started)
+
+        self.stdout.write(f"one at a time: {scalar:>12,.0f} breakdowns/s")
+        self.stdout.write(f"batched:       {batch:>12,.0f} breakdowns/s")
+        self.stdout.write(f"speedup:       {batch / scalar:>12.1f}x")
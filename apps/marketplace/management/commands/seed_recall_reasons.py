@@ -4,6 +4,7 @@ import os
 from django.core.management.base import BaseCommand
 
 from apps.marketplace.models import RecallReason
+from apps.marketplace import reference_data
 from apps.common.constants import FIELDS, REASON, TYPE, DESCRIPTION
 
 
@@ -20,6 +21,8 @@ class Command(BaseCommand):
             recall_reasons = json.load(file)
             self.sync_recall_reasons(recall_reasons)
 
+        reference_data.recall_reasons.invalidate()
+
         self.stdout.write(self.style.SUCCESS("Successfully synced recall reasons"))
 
     def sync_recall_reasons(self, recall_reasons_data: dict):
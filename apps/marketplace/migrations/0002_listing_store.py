@@ -0,0 +1,103 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+LISTING_MODELS = [
+    "ItemListing",
+    "RecalledItemListing",
+    "DelistedItemListing",
+    "SoldItemListing",
+]
+
+
+def backfill_listing_store(apps, schema_editor):
+    Tag = apps.get_model("stores", "Tag")
+    tag_store = Subquery(
+        Tag.objects.filter(id=OuterRef("tag_id")).values("store_id")[:1]
+    )
+
+    for model_name in LISTING_MODELS:
+        listing_model = apps.get_model("marketplace", model_name)
+        listing_model.objects.update(store_id=tag_store)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("marketplace", "0001_initial"),
+        ("stores", "0003_tag_store"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="itemlisting",
+            name="store",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="stores.storeprofile",
+            ),
+        ),
+        migrations.AddField(
+            model_name="recalleditemlisting",
+            name="store",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="stores.storeprofile",
+            ),
+        ),
+        migrations.AddField(
+            model_name="delisteditemlisting",
+            name="store",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="stores.storeprofile",
+            ),
+        ),
+        migrations.AddField(
+            model_name="solditemlisting",
+            name="store",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="stores.storeprofile",
+            ),
+        ),
+        migrations.RunPython(backfill_listing_store, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="itemlisting",
+            name="store",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                to="stores.storeprofile",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recalleditemlisting",
+            name="store",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                to="stores.storeprofile",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="delisteditemlisting",
+            name="store",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                to="stores.storeprofile",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="solditemlisting",
+            name="store",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                to="stores.storeprofile",
+            ),
+        ),
+    ]
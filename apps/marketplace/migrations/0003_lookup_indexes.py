@@ -0,0 +1,33 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0002_item_images_ordering"),
+        ("marketplace", "0002_listing_store"),
+        ("stores", "0003_tag_store"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="itemlisting",
+            index=models.Index(
+                fields=["store", "-created_at"], name="item_listing_store_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recalleditemlisting",
+            index=models.Index(
+                fields=["store", "-created_at"], name="recalled_store_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recalleditemlisting",
+            index=models.Index(
+                fields=["collection_deadline"], name="recalled_deadline_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0002_item_images_ordering"),
+        ("marketplace", "0003_lookup_indexes"),
+        ("stores", "0003_tag_store"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="itemlisting",
+            constraint=models.UniqueConstraint(
+                fields=("tag",), name="item_listing_unique_tag"
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("marketplace", "0004_item_listing_unique_tag"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecalledItemListingReminder",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sent_on", models.DateField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "recalled_listing",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reminders",
+                        to="marketplace.recalleditemlisting",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "recalled_item_listing_reminders",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="recalleditemlistingreminder",
+            constraint=models.UniqueConstraint(
+                fields=("recalled_listing", "sent_on"),
+                name="recalled_reminder_unique_day",
+            ),
+        ),
+    ]
@@ -0,0 +1,228 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:21
+
+import django.core.validators
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0002_item_images_ordering"),
+        ("marketplace", "0005_recalled_item_listing_reminders"),
+        ("payments", "0008_lookup_indexes"),
+        ("stores", "0003_tag_store"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Listing",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "store_commission",
+                    models.DecimalField(
+                        decimal_places=2,
+                        max_digits=9,
+                        validators=[
+                            django.core.validators.MinValueValidator(Decimal("0.00"))
+                        ],
+                    ),
+                ),
+                (
+                    "min_listing_days",
+                    models.IntegerField(
+                        validators=[django.core.validators.MinValueValidator(1)]
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "state",
+                    models.CharField(
+                        choices=[
+                            ("ACTIVE", "Active"),
+                            ("RECALLED", "Recalled"),
+                            ("DELISTED", "Delisted"),
+                            ("SOLD", "Sold"),
+                        ],
+                        default="ACTIVE",
+                        max_length=16,
+                    ),
+                ),
+                ("recalled_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "collection_pin",
+                    models.CharField(blank=True, max_length=2, null=True),
+                ),
+                ("collection_deadline", models.DateTimeField(blank=True, null=True)),
+                ("delisted_at", models.DateTimeField(blank=True, null=True)),
+                ("sold_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="items.item"
+                    ),
+                ),
+                (
+                    "reason",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="marketplace.recallreason",
+                    ),
+                ),
+                (
+                    "store",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="stores.storeprofile",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="stores.tag"
+                    ),
+                ),
+                (
+                    "transaction",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="listing",
+                        to="payments.itempaymenttransaction",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "listings",
+            },
+        ),
+        migrations.CreateModel(
+            name="ActiveListing",
+            fields=[],
+            options={
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("marketplace.listing",),
+        ),
+        migrations.CreateModel(
+            name="DelistedListing",
+            fields=[],
+            options={
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("marketplace.listing",),
+        ),
+        migrations.CreateModel(
+            name="RecalledListing",
+            fields=[],
+            options={
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("marketplace.listing",),
+        ),
+        migrations.CreateModel(
+            name="SoldListing",
+            fields=[],
+            options={
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("marketplace.listing",),
+        ),
+        migrations.AddIndex(
+            model_name="listing",
+            index=models.Index(
+                fields=["item", "created_at"], name="listing_item_history_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="listing",
+            index=models.Index(
+                condition=models.Q(("state", "ACTIVE")),
+                fields=["store", "-created_at"],
+                name="listing_active_store_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="listing",
+            index=models.Index(
+                condition=models.Q(("state", "RECALLED")),
+                fields=["store", "-created_at"],
+                name="listing_recalled_store_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="listing",
+            index=models.Index(
+                condition=models.Q(("state", "RECALLED")),
+                fields=["collection_deadline"],
+                name="listing_recalled_deadline_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="listing",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("state", "ACTIVE")),
+                fields=("tag",),
+                name="listing_unique_active_tag",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="listing",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(("state", "RECALLED"), _negated=True),
+                    models.Q(
+                        ("collection_deadline__isnull", False),
+                        ("collection_pin__isnull", False),
+                        ("reason__isnull", False),
+                    ),
+                    _connector="OR",
+                ),
+                name="listing_recalled_fields",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="listing",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(("state", "DELISTED"), _negated=True),
+                    ("reason__isnull", False),
+                    _connector="OR",
+                ),
+                name="listing_delisted_fields",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="listing",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(("state", "SOLD"), _negated=True),
+                    ("transaction__isnull", False),
+                    _connector="OR",
+                ),
+                name="listing_sold_fields",
+            ),
+        ),
+    ]
@@ -0,0 +1,209 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:23
+
+from decimal import Decimal, ROUND_HALF_UP
+from django.db import migrations, models
+
+LISTING_MODELS = [
+    "ItemListing",
+    "RecalledItemListing",
+    "DelistedItemListing",
+    "SoldItemListing",
+    "Listing",
+]
+PRICING_FIELDS = [
+    "listing_price",
+    "transaction_fee",
+    "store_commission_amount",
+    "member_earnings",
+]
+BATCH_SIZE = 1000
+# Frozen copy of the pricing rules when this migration was written, so
+# replaying it never depends on the live pricing code.
+TRANSACTION_FEE_RATE = Decimal("0.05")
+TRANSACTION_FLAT_FEE = Decimal("1")
+
+
+def quantize(value: Decimal):
+    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def calculate_breakdown(price, commission):
+    price = Decimal(str(price))
+    commission = Decimal(str(commission)) / Decimal("100")
+    transaction_fee = price * TRANSACTION_FEE_RATE + TRANSACTION_FLAT_FEE
+    store_commission = price * commission
+    return {
+        "listing_price": quantize(price + transaction_fee),
+        "transaction_fee": quantize(transaction_fee),
+        "store_commission_amount": quantize(store_commission),
+        "member_earnings": quantize(price - store_commission),
+    }
+
+
+def fill_pricing(apps, schema_editor):
+    for model_name in LISTING_MODELS:
+        model = apps.get_model("marketplace", model_name)
+        listings = model.objects.select_related("item").order_by("id")
+        batch = []
+        for listing in listings.iterator(chunk_size=BATCH_SIZE):
+            breakdown = calculate_breakdown(
+                listing.item.price, listing.store_commission
+            )
+            for field, value in breakdown.items():
+                setattr(listing, field, value)
+            batch.append(listing)
+            if len(batch) == BATCH_SIZE:
+                model.objects.bulk_update(batch, PRICING_FIELDS)
+                batch = []
+        model.objects.bulk_update(batch, PRICING_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("marketplace", "0006_unified_listings"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="delisteditemlisting",
+            name="listing_price",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="delisteditemlisting",
+            name="member_earnings",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="delisteditemlisting",
+            name="store_commission_amount",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="delisteditemlisting",
+            name="transaction_fee",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="itemlisting",
+            name="listing_price",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="itemlisting",
+            name="member_earnings",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="itemlisting",
+            name="store_commission_amount",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="itemlisting",
+            name="transaction_fee",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="listing",
+            name="listing_price",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="listing",
+            name="member_earnings",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="listing",
+            name="store_commission_amount",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="listing",
+            name="transaction_fee",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="recalleditemlisting",
+            name="listing_price",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="recalleditemlisting",
+            name="member_earnings",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="recalleditemlisting",
+            name="store_commission_amount",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="recalleditemlisting",
+            name="transaction_fee",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="solditemlisting",
+            name="listing_price",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="solditemlisting",
+            name="member_earnings",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="solditemlisting",
+            name="store_commission_amount",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="solditemlisting",
+            name="transaction_fee",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.RunPython(fill_pricing, migrations.RunPython.noop),
+    ]
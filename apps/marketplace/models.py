@@ -3,14 +3,24 @@ import random
 import string
 
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth import get_user_model
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MinLengthValidator
 
 from apps.items.models import Item
-from apps.stores.models import Tag
+from apps.stores.models import Tag, StoreProfile
 from apps.payments.models.transactions import ItemPaymentTransaction
-from apps.marketplace.services.pricing_services import PricingEngine
+from apps.marketplace.services.pricing_services import PRICING_FIELDS, PricingEngine
+from apps.marketplace.querysets import (
+    STATE_TIMESTAMP_FIELDS,
+    ListingQuerySet,
+    ListingStateManager,
+    UnifiedListingQuerySet,
+)
+from apps.marketplace.constants import ListingState
+from apps.common.constants import REMINDERS
 
 User = get_user_model()
 
@@ -18,48 +28,55 @@ User = get_user_model()
 class BaseItemListing(models.Model):
     tag = models.ForeignKey(Tag, on_delete=models.CASCADE)
     item = models.ForeignKey(Item, on_delete=models.CASCADE)
+    # Denormalised from tag so store lookups skip the tag -> tag group join.
+    store = models.ForeignKey(StoreProfile, on_delete=models.CASCADE)
     store_commission = models.DecimalField(
         max_digits=9, decimal_places=2, validators=[MinValueValidator(Decimal("0.00"))]
     )
     min_listing_days = models.IntegerField(validators=[MinValueValidator(1)])
+    # Pricing breakdown for the item price, stored so list pages and checkout
+    # read columns instead of re-running the pricing engine per row.
+    listing_price = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    transaction_fee = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    store_commission_amount = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    member_earnings = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
     updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ListingQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
-    @property
-    def item_price(self):
-        return Decimal(self.item.price)
-
-    @property
-    def listing_price(self):
-        return PricingEngine().calculate_list_price(self.item.price)
+    def save(self, *args, **kwargs):
+        if self._state.adding and not self.listing_price:
+            self.set_pricing(self.item.price)
+        super().save(*args, **kwargs)
 
-    @property
-    def transaction_fee(self):
-        return PricingEngine().calculate_transaction_fee(self.item.price)
+    def set_pricing(self, price: Decimal):
+        breakdown = PricingEngine().calculate_breakdown(price, self.store_commission)
+        for field, value in breakdown.items():
+            setattr(self, field, value)
 
-    @property
-    def store_commission_amount(self):
-        return PricingEngine().calculate_store_commission(
-            self.item.price, self.store_commission
-        )
+    def get_pricing(self):
+        return {field: getattr(self, field) for field in PRICING_FIELDS}
 
     @property
-    def member_earnings(self):
-        return PricingEngine().calculate_user_earnings(
-            self.item.price, self.store_commission
-        )
+    def item_price(self):
+        return Decimal(self.item.price)
 
     @property
     def owner(self):
         return self.item.owner
 
-    @property
-    def store(self):
-        return self.tag.store
-
     @property
     def item_details(self):
         return self.item
@@ -75,6 +92,16 @@ class BaseItemListing(models.Model):
 class ItemListing(BaseItemListing):
     class Meta:
         db_table = "item_listings"
+        indexes = [
+            # Store listing pages, newest first.
+            models.Index(
+                fields=["store", "-created_at"], name="item_listing_store_created_idx"
+            ),
+        ]
+        constraints = [
+            # A tag can only be attached to one active listing at a time.
+            models.UniqueConstraint(fields=["tag"], name="item_listing_unique_tag"),
+        ]
 
 
 class RecallReason(models.Model):
@@ -111,11 +138,39 @@ class RecalledItemListing(BaseItemListing):
 
     class Meta:
         db_table = "recalled_item_listings"
+        indexes = [
+            # Store recalled listing pages, newest first.
+            models.Index(
+                fields=["store", "-created_at"], name="recalled_store_created_idx"
+            ),
+            # Abandoned item sweep (collection_deadline__lt=now).
+            models.Index(fields=["collection_deadline"], name="recalled_deadline_idx"),
+        ]
 
     def __str__(self):
         return f"{self.reason}"
 
 
+class RecalledItemListingReminder(models.Model):
+    recalled_listing = models.ForeignKey(
+        RecalledItemListing, on_delete=models.CASCADE, related_name=REMINDERS
+    )
+    sent_on = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "recalled_item_listing_reminders"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["recalled_listing", "sent_on"],
+                name="recalled_reminder_unique_day",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.recalled_listing_id} - {self.sent_on}"
+
+
 class DelistedItemListing(BaseItemListing):
     reason = models.ForeignKey(RecallReason, on_delete=models.CASCADE)
     delisted_at = models.DateTimeField(auto_now_add=True)
@@ -142,3 +197,140 @@ class SoldItemListing(BaseItemListing):
 
     def __str__(self):
         return f"{self.buyer}"
+
+
+class Listing(BaseItemListing):
+    """
+    Optional single-table listing store. Every state lives in one row whose
+    state column changes in place, so a transition is one UPDATE and an
+    item's history is one index scan. Columns only used by some states are
+    nullable and guarded by check constraints.
+    """
+
+    state = models.CharField(
+        max_length=16, choices=ListingState.choices, default=ListingState.ACTIVE
+    )
+    reason = models.ForeignKey(
+        RecallReason, on_delete=models.CASCADE, null=True, blank=True
+    )
+    recalled_at = models.DateTimeField(null=True, blank=True)
+    collection_pin = models.CharField(max_length=2, null=True, blank=True)
+    collection_deadline = models.DateTimeField(null=True, blank=True)
+    delisted_at = models.DateTimeField(null=True, blank=True)
+    sold_at = models.DateTimeField(null=True, blank=True)
+    transaction = models.OneToOneField(
+        ItemPaymentTransaction,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="listing",
+    )
+
+    objects = UnifiedListingQuerySet.as_manager()
+
+    # Set by the per-state proxies so rows they create start in that state.
+    listing_state = None
+
+    class Meta:
+        db_table = "listings"
+        indexes = [
+            # Item history across every state.
+            models.Index(
+                fields=["item", "created_at"], name="listing_item_history_idx"
+            ),
+            # Store listing pages per state, newest first.
+            models.Index(
+                fields=["store", "-created_at"],
+                condition=Q(state=ListingState.ACTIVE),
+                name="listing_active_store_idx",
+            ),
+            models.Index(
+                fields=["store", "-created_at"],
+                condition=Q(state=ListingState.RECALLED),
+                name="listing_recalled_store_idx",
+            ),
+            # Abandoned item sweep.
+            models.Index(
+                fields=["collection_deadline"],
+                condition=Q(state=ListingState.RECALLED),
+                name="listing_recalled_deadline_idx",
+            ),
+        ]
+        constraints = [
+            # A tag can only be attached to one active listing at a time.
+            models.UniqueConstraint(
+                fields=["tag"],
+                condition=Q(state=ListingState.ACTIVE),
+                name="listing_unique_active_tag",
+            ),
+            models.CheckConstraint(
+                check=~Q(state=ListingState.RECALLED)
+                | Q(
+                    reason__isnull=False,
+                    collection_pin__isnull=False,
+                    collection_deadline__isnull=False,
+                ),
+                name="listing_recalled_fields",
+            ),
+            models.CheckConstraint(
+                check=~Q(state=ListingState.DELISTED) | Q(reason__isnull=False),
+                name="listing_delisted_fields",
+            ),
+            models.CheckConstraint(
+                check=~Q(state=ListingState.SOLD) | Q(transaction__isnull=False),
+                name="listing_sold_fields",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.listing_state:
+            self.state = self.listing_state
+        if self.state == ListingState.RECALLED and not self.collection_pin:
+            self.collection_pin = self.generate_collection_pin()
+        timestamp_field = STATE_TIMESTAMP_FIELDS.get(self.state)
+        if timestamp_field and getattr(self, timestamp_field) is None:
+            setattr(self, timestamp_field, now())
+        super().save(*args, **kwargs)
+
+
+class ActiveListing(Listing):
+    listing_state = ListingState.ACTIVE
+    objects = ListingStateManager(ListingState.ACTIVE)
+
+    class Meta:
+        proxy = True
+
+
+class RecalledListing(Listing):
+    listing_state = ListingState.RECALLED
+    objects = ListingStateManager(ListingState.RECALLED)
+
+    class Meta:
+        proxy = True
+
+
+class DelistedListing(Listing):
+    listing_state = ListingState.DELISTED
+    objects = ListingStateManager(ListingState.DELISTED)
+
+    class Meta:
+        proxy = True
+
+
+class SoldListing(Listing):
+    listing_state = ListingState.SOLD
+    objects = ListingStateManager(ListingState.SOLD)
+
+    class Meta:
+        proxy = True
+
+
+# Drop-in replacements for the per-state tables. The proxies keep their field
+# names and queryset methods, so code taking a listing model can be pointed
+# at the unified table.
+UNIFIED_LISTING_MODELS = {
+    ItemListing: ActiveListing,
+    RecalledItemListing: RecalledListing,
+    DelistedItemListing: DelistedListing,
+    SoldItemListing: SoldListing,
+}
@@ -5,7 +5,7 @@ from apps.marketplace.models import BaseItemListing
 
 class IsTagOwner(permissions.BasePermission):
     def has_object_permission(self, request, view: APIView, listing: BaseItemListing):
-        return listing.tag.tag_group.store.user == request.user
+        return listing.store.user_id == request.user.id
 
 
 class IsListingOwner(permissions.BasePermission):
@@ -2,13 +2,35 @@ from django.db import transaction
 
 from apps.common.abstract_classes import AbstractProcessor
 from apps.marketplace.services.listing_services import ItemListingService
+from apps.marketplace.services.listing_cache_services import ListingCacheService
 from apps.notifications.emails.services.email_senders import ListingEmailSender
+from apps.notifications.emails.services.email_service import email_batch
 from apps.items.models import Item
-from apps.stores.models import Tag
+from apps.stores.models import StoreProfile, Tag
 from apps.items.services import ItemService
+from apps.stores.services.store_services import StoreService
 from apps.marketplace.models import ItemListing, RecalledItemListing, RecallReason
+from apps.marketplace.constants import ListingTransition
+from apps.marketplace.services.listing_transition_services import (
+    INVALID_PIN,
+    LISTING_NOT_FOUND,
+    ListingTransitionService,
+)
+from apps.common.constants import (
+    COLLECTION_DEADLINE,
+    COLLECTION_PIN,
+    ERROR,
+    ID,
+    ITEM_ID,
+    PIN,
+    REASON,
+    SUCCESS,
+    TAG_ID,
+)
 from apps.payments.models.transactions import ItemPaymentTransaction
 
+ABANDONED_BATCH_SIZE = 200
+
 
 class ItemListingCreateProcessor(AbstractProcessor):
     def __init__(self, item: Item, tag: Tag):
@@ -18,7 +40,9 @@ class ItemListingCreateProcessor(AbstractProcessor):
     @transaction.atomic
     def process(self):
         listing = ItemListingService.create_listing(self.item, self.tag)
+        StoreService.increment_active_listings(listing.store)
         ItemService.list_item(self.item)
+        ListingCacheService.invalidate_tags(listing.tag_id)
         ListingEmailSender.send_listing_created_email(listing)
         return listing
 
@@ -35,6 +59,8 @@ class ItemListingRecallProcessor(AbstractProcessor):
         )
         ItemService.recall_item(recalled_listing.item)
         ItemListingService.delete_listing(self.listing)
+        StoreService.decrement_active_listings(recalled_listing.store)
+        ListingCacheService.invalidate_tags(recalled_listing.tag_id)
         ListingEmailSender.send_listing_recalled_email(recalled_listing, self.reason)
         return recalled_listing
 
@@ -51,6 +77,8 @@ class ItemListingDelistProcessor(AbstractProcessor):
         )
         ItemService.delist_item(delisted_listing.item)
         ItemListingService.delete_listing(self.listing)
+        StoreService.decrement_active_listings(delisted_listing.store)
+        ListingCacheService.invalidate_tags(delisted_listing.tag_id)
         ListingEmailSender.send_listing_delisted_email(delisted_listing)
         return delisted_listing
 
@@ -75,8 +103,16 @@ class ItemListingReplaceTagProcessor(AbstractProcessor):
         self.listing = listing
         self.tag = tag
 
+    @transaction.atomic
     def process(self):
-        return ItemListingService.replace_listing_tag(self.listing, self.tag)
+        previous_store = self.listing.store
+        previous_tag_id = self.listing.tag_id
+        listing = ItemListingService.replace_listing_tag(self.listing, self.tag)
+        if listing.store.pk != previous_store.pk:
+            StoreService.increment_active_listings(listing.store)
+            StoreService.decrement_active_listings(previous_store)
+        ListingCacheService.invalidate_tags(previous_tag_id, listing.tag_id)
+        return listing
 
 
 class CollectionPinUpdateProcessor(AbstractProcessor):
@@ -104,6 +140,140 @@ class ItemListingAbandonedProcessor(AbstractProcessor):
         return self.recalled_listing
 
 
+class ItemListingAbandonedBatchProcessor(AbstractProcessor):
+    """
+    Abandons a batch of expired recalled listings in one transaction, with a
+    bulk statement per table. Rows are claimed with SELECT ... FOR UPDATE
+    SKIP LOCKED, so several workers can drain a backlog side by side.
+    """
+
+    def __init__(self, deadline, batch_size: int = None):
+        self.deadline = deadline
+        self.batch_size = batch_size or ABANDONED_BATCH_SIZE
+
+    def process(self):
+        with transaction.atomic():
+            recalled_listings = ItemListingService.claim_expired_recalled_listings(
+                self.deadline, self.batch_size
+            )
+            if not recalled_listings:
+                return []
+            ItemListingService.create_delisted_listings(recalled_listings)
+            ItemService.abandon_items(
+                [recalled_listing.item_id for recalled_listing in recalled_listings]
+            )
+            ItemListingService.delete_recalled_listings(recalled_listings)
+            # Recorded with the batch and delivered once it has committed.
+            with email_batch():
+                for recalled_listing in recalled_listings:
+                    ListingEmailSender.send_item_abandonded_email(recalled_listing)
+        return recalled_listings
+
+
+class BulkListingTransitionProcessor(AbstractProcessor):
+    """
+    Moves a set of a store's listings, identified by tag, to another state
+    with a fixed number of set-based statements however many there are.
+    Returns a result per requested tag; listings that cannot move are
+    reported and the rest still move.
+    """
+
+    def __init__(
+        self,
+        store: StoreProfile,
+        transition: ListingTransition,
+        listings: list[dict],
+        reason: RecallReason = None,
+    ):
+        self.store = store
+        self.transition = transition
+        self.rule = ListingTransitionService.get_rule(transition)
+        self.pins = {listing[TAG_ID]: listing.get(PIN) for listing in listings}
+        self.reason = reason
+
+    def process(self):
+        results = {}
+        moved = []
+        with transaction.atomic():
+            listings = ListingTransitionService.lock_store_listings(
+                self.rule, self.store, list(self.pins)
+            )
+            movable = []
+            for tag_id, pin in self.pins.items():
+                listing = listings.get(tag_id)
+                if listing is None:
+                    results[tag_id] = self._failure(tag_id, LISTING_NOT_FOUND)
+                elif (
+                    self.transition == ListingTransition.COLLECT
+                    and not listing.validate_pin(pin)
+                ):
+                    results[tag_id] = self._failure(tag_id, INVALID_PIN)
+                else:
+                    movable.append(listing)
+
+            if movable:
+                moved = self._move(movable)
+                for listing in moved:
+                    results[listing.tag_id] = {
+                        TAG_ID: listing.tag_id,
+                        SUCCESS: True,
+                        ID: listing.id,
+                        ITEM_ID: listing.item_id,
+                    }
+
+            with email_batch():
+                for listing in moved:
+                    self._send_email(listing)
+        return [results[tag_id] for tag_id in self.pins]
+
+    def _move(self, listings: list):
+        listing_ids = [listing.id for listing in listings]
+        item_ids = [listing.item_id for listing in listings]
+
+        created_at = ListingTransitionService.copy_listings(
+            self.rule.source, self.rule.target, listing_ids, self._get_values(listings)
+        )
+        ListingTransitionService.delete_listings(self.rule.source, listing_ids)
+        ListingTransitionService.update_item_statuses(item_ids, self.rule.item_status)
+
+        if self.rule.frees_store_slot:
+            StoreService.decrement_active_listings(self.store, len(listings))
+            ListingCacheService.invalidate_tags(
+                *[listing.tag_id for listing in listings]
+            )
+        return ListingTransitionService.get_copied_listings(
+            self.rule.target, item_ids, created_at
+        )
+
+    def _get_values(self, listings: list):
+        if self.transition == ListingTransition.RECALL:
+            return {
+                REASON: self.reason,
+                COLLECTION_DEADLINE: ItemListingService.get_collection_deadline(
+                    self.store
+                ),
+                COLLECTION_PIN: {
+                    listing.id: RecalledItemListing.generate_collection_pin()
+                    for listing in listings
+                },
+            }
+        if self.transition == ListingTransition.DELIST:
+            return {REASON: self.reason}
+        # Collected listings keep the reason they were recalled for.
+        return {}
+
+    def _send_email(self, listing):
+        if self.transition == ListingTransition.RECALL:
+            ListingEmailSender.send_listing_recalled_email(listing, self.reason)
+        elif self.transition == ListingTransition.DELIST:
+            ListingEmailSender.send_listing_delisted_email(listing)
+        else:
+            ListingEmailSender.send_recalled_listing_collected_email(listing)
+
+    def _failure(self, tag_id: int, error: str):
+        return {TAG_ID: tag_id, SUCCESS: False, ERROR: error}
+
+
 class ItemListingPurchaseProcessor(AbstractProcessor):
     def __init__(
         self, listing: ItemListing, payment_trasaction: ItemPaymentTransaction
@@ -117,5 +287,7 @@ class ItemListingPurchaseProcessor(AbstractProcessor):
             self.listing, self.transaction
         )
         ItemListingService.delete_listing(self.listing)
+        StoreService.decrement_active_listings(sold_listing.store)
+        ListingCacheService.invalidate_tags(sold_listing.tag_id)
         ItemService.purchase_item(sold_listing.item)
         return sold_listing
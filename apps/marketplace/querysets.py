@@ -0,0 +1,79 @@
+from django.db import models
+from django.utils.timezone import now
+
+from apps.common.constants import CREATED_AT, STATE, UPDATED_AT
+from apps.marketplace.constants import ListingState
+from apps.marketplace.services.pricing_services import PRICING_FIELDS, PricingEngine
+
+# Set when a unified listing enters the state, like the legacy tables'
+# recalled_at, delisted_at and sold_at columns.
+STATE_TIMESTAMP_FIELDS = {
+    ListingState.RECALLED: "recalled_at",
+    ListingState.DELISTED: "delisted_at",
+    ListingState.SOLD: "sold_at",
+}
+
+
+class ListingQuerySet(models.QuerySet):
+    def with_details(self):
+        """
+        Joins and prefetches every relation read by the listing serializers,
+        so a page of listings costs the same number of queries however many
+        rows it holds. Categories and conditions come from the reference data
+        cache instead.
+        """
+        return self.select_related(
+            "item__owner",
+            "store",
+        ).prefetch_related(
+            "item__images",
+            "item__itemlisting_set",
+        )
+
+    def for_store(self, store_id: int):
+        return self.filter(store_id=store_id)
+
+    def for_store_user(self, user):
+        return self.filter(store__user=user)
+
+    def reprice(self, price):
+        """Recomputes the stored pricing breakdown for a new item price."""
+        listings = list(self)
+        breakdowns = PricingEngine().calculate_breakdowns(
+            [price] * len(listings), [listing.store_commission for listing in listings]
+        )
+        for listing, breakdown in zip(listings, breakdowns):
+            for field, value in breakdown.items():
+                setattr(listing, field, value)
+        return self.model.objects.bulk_update(listings, PRICING_FIELDS)
+
+
+class UnifiedListingQuerySet(ListingQuerySet):
+    def in_state(self, state: ListingState):
+        return self.filter(state=state)
+
+    def history(self, item_id: int):
+        return self.filter(item_id=item_id).order_by(CREATED_AT)
+
+    def transition(self, source: ListingState, target: ListingState, **fields):
+        """
+        Moves the listings still in the source state to the target state with
+        a single UPDATE and returns how many moved.
+        """
+        timestamp = now()
+        fields[STATE] = target
+        fields[UPDATED_AT] = timestamp
+        if target in STATE_TIMESTAMP_FIELDS:
+            fields.setdefault(STATE_TIMESTAMP_FIELDS[target], timestamp)
+        return self.filter(state=source).update(**fields)
+
+
+class ListingStateManager(models.Manager.from_queryset(UnifiedListingQuerySet)):
+    """Scopes the unified listings table to one state for the proxy models."""
+
+    def __init__(self, state: ListingState):
+        super().__init__()
+        self.state = state
+
+    def get_queryset(self):
+        return super().get_queryset().filter(state=self.state)
@@ -0,0 +1,6 @@
+from apps.common.reference_data import ReferenceDataCache
+from apps.marketplace.models import RecallReason
+
+recall_reasons = ReferenceDataCache(
+    RecallReason, "apps.marketplace.serializers.RecallReasonSerializer"
+)
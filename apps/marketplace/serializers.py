@@ -6,12 +6,18 @@ from apps.marketplace.services.listing_services import ItemListingValidationServ
 from apps.common.constants import *
 from apps.items.services import ItemValidationService
 from apps.stores.services.tags_services import TagService
-from apps.marketplace.processors import ItemListingCreateProcessor
+from apps.marketplace.processors import (
+    BulkListingTransitionProcessor,
+    ItemListingCreateProcessor,
+)
+from apps.marketplace.constants import ListingTransition
 from apps.marketplace.services.listing_services import ItemListingService
 from apps.items.serializers import ItemCreateSerializer, FlatItemSerializer
 from apps.items.models import Item
 from apps.stores.models import Tag
 
+BULK_TRANSITION_MAX_LISTINGS = 500
+
 
 class CreateListingSerializer(serializers.ModelSerializer):
     item_id = serializers.IntegerField(write_only=True)
@@ -23,9 +29,8 @@ class CreateListingSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         item = Item.objects.get(id=data.get(ITEM_ID))
-        tag = Tag.objects.get(id=data.get(TAG_ID))
+        tag = Tag.objects.select_related(STORE).get(id=data.get(TAG_ID))
         ItemValidationService.validate_item_availability(item)
-        ItemListingValidationService.validate_tag_availability(tag)
         ItemListingValidationService.meets_store_requirements(item, tag)
 
         data[ITEM] = item
@@ -159,3 +164,35 @@ class RecallItemListingSerializer(serializers.ModelSerializer):
             REASON,
             UPDATED_AT,
         ]
+
+
+class BulkListingTransitionListingSerializer(serializers.Serializer):
+    tag_id = serializers.IntegerField()
+    pin = serializers.CharField(required=False)
+
+
+class BulkListingTransitionSerializer(serializers.Serializer):
+    transition = serializers.ChoiceField(choices=ListingTransition.choices)
+    reason = serializers.IntegerField(required=False)
+    listings = BulkListingTransitionListingSerializer(
+        many=True, allow_empty=False, max_length=BULK_TRANSITION_MAX_LISTINGS
+    )
+
+    def validate(self, data):
+        if data[TRANSITION] == ListingTransition.COLLECT:
+            if not all(listing.get(PIN) for listing in data[LISTINGS]):
+                raise serializers.ValidationError(
+                    {LISTINGS: "A PIN is required for every collected listing."}
+                )
+        else:
+            data[REASON] = ItemListingService.get_recall_reasons(data.get(REASON))
+        return data
+
+    def create(self, validated_data):
+        processor = BulkListingTransitionProcessor(
+            validated_data[STORE],
+            validated_data[TRANSITION],
+            validated_data[LISTINGS],
+            validated_data.get(REASON),
+        )
+        return processor.process()
@@ -0,0 +1,67 @@
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.marketplace.models import ItemListing
+from apps.common.constants import DATA, OWNER_USER_ID, STORE_USER_ID, TAG_ID
+
+LISTING_CACHE_TIMEOUT = 60 * 15
+
+logger = logging.getLogger(__name__)
+
+
+class ListingCacheService:
+    """
+    Read-through cache of the public listing payload served for a tag scan.
+
+    Entries hold the serialized listing without the per-user relation, along
+    with the store and owner user ids needed to work that relation out for
+    each request. Anything that changes a listing or its item invalidates the
+    entry once the surrounding transaction commits.
+
+    The cache shares Redis with the broker, so it fails open: a cache error
+    is logged and the request falls through to the database.
+    """
+
+    @staticmethod
+    def get_key(tag_id: int):
+        return f"listing:tag:{tag_id}"
+
+    @staticmethod
+    def get_listing(tag_id: int):
+        try:
+            return cache.get(ListingCacheService.get_key(tag_id))
+        except Exception:
+            logger.exception("Failed to read listing %s from the cache", tag_id)
+            return None
+
+    @staticmethod
+    def set_listing(listing: ItemListing, listing_data: dict):
+        entry = {
+            DATA: listing_data,
+            STORE_USER_ID: listing.store.user_id,
+            OWNER_USER_ID: listing.item.owner.user_id,
+        }
+        try:
+            cache.set(
+                ListingCacheService.get_key(listing.tag_id),
+                entry,
+                LISTING_CACHE_TIMEOUT,
+            )
+        except Exception:
+            logger.exception("Failed to cache listing %s", listing.tag_id)
+        return entry
+
+    @staticmethod
+    def invalidate_tags(*tag_ids: int):
+        keys = [ListingCacheService.get_key(tag_id) for tag_id in tag_ids]
+        # Best effort: a missed delete leaves the entry to expire.
+        transaction.on_commit(lambda: cache.delete_many(keys), robust=True)
+
+    @staticmethod
+    def invalidate_item(item_id: int):
+        tag_ids = ItemListing.objects.filter(item_id=item_id).values_list(
+            TAG_ID, flat=True
+        )
+        ListingCacheService.invalidate_tags(*tag_ids)
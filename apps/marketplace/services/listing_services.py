@@ -1,4 +1,6 @@
 from datetime import timedelta
+from django.db import IntegrityError, transaction
+from django.db.models import OuterRef, Subquery
 from django.utils.timezone import now
 
 from rest_framework import serializers
@@ -13,18 +15,24 @@ from apps.marketplace.models import (
     RecallReason,
 )
 from apps.items.models import Item
-from apps.stores.models import (
-    StoreItemCategory,
-    StoreItemCondition,
-    StoreProfile,
-    StoreOpeningHours,
+from apps.stores.models import StoreProfile, StoreOpeningHours
+from apps.stores.services.store_services import StoreAcceptanceService
+from apps.common.constants import (
+    CONDITION,
+    CONDITIONS,
+    CATEGORY,
+    CATEGORIES,
+    ID,
+    PRICE,
+    STORE,
 )
-from apps.common.constants import CONDITION, CATEGORY, PRICE
+from apps.items.reference_data import item_categories, item_conditions
 from apps.marketplace.constants import ListingRole
+from apps.marketplace.reference_data import recall_reasons
 from apps.payments.models.transactions import ItemPaymentTransaction
 
-
 COLLECTION_PERIOD_DAYS = 21
+TAG_UNAVAILABLE_ERROR = "There is already an active listing with this tag."
 
 
 class ItemListingService:
@@ -59,28 +67,62 @@ class ItemListingService:
 
     @staticmethod
     def get_recall_reasons(reason_id: int):
-        try:
-            return RecallReason.objects.get(id=reason_id)
-        except RecallReason.DoesNotExist:
+        reason = recall_reasons.get(reason_id)
+        if reason is None:
             raise serializers.ValidationError("Invalid reason provided.")
+        return reason
+
+    @staticmethod
+    def resolve_tag(tag_id: int):
+        """
+        Fetches a tag with its store, annotated with the id of its active
+        listing (if any) and that listing's item owner, in a single query.
+        """
+        active_listing = ItemListing.objects.filter(tag_id=OuterRef(ID))
+        try:
+            return (
+                Tag.objects.select_related(STORE)
+                .annotate(
+                    listing_id=Subquery(active_listing.values(ID)[:1]),
+                    listing_owner_user_id=Subquery(
+                        active_listing.values("item__owner__user_id")[:1]
+                    ),
+                )
+                .get(id=tag_id)
+            )
+        except Tag.DoesNotExist:
+            raise serializers.ValidationError("Tag does not exist.")
 
     @staticmethod
     def get_user_listing_relation(request: Request, listing: ItemListing):
-        if request.user == listing.tag.tag_group.store.user:
+        return ItemListingService.get_user_relation(
+            request, listing.store.user_id, listing.item.owner.user_id
+        )
+
+    @staticmethod
+    def get_user_relation(request: Request, store_user_id: int, owner_user_id: int):
+        if request.user.id == store_user_id:
             return ListingRole.HOST
-        elif request.user == listing.item.owner_user:
+        elif request.user.id == owner_user_id:
             return ListingRole.OWNER
         else:
             return ListingRole.VIEWER
 
     @staticmethod
     def create_listing(item: Item, tag: Tag):
-        return ItemListing.objects.create(
-            item=item,
-            tag=tag,
-            store_commission=tag.store.commission,
-            min_listing_days=tag.store.min_listing_days,
-        )
+        # The unique constraint on ItemListing.tag guards against two listings
+        # claiming the same tag concurrently.
+        try:
+            with transaction.atomic():
+                return ItemListing.objects.create(
+                    item=item,
+                    tag=tag,
+                    store=tag.store,
+                    store_commission=tag.store.commission,
+                    min_listing_days=tag.store.min_listing_days,
+                )
+        except IntegrityError:
+            raise serializers.ValidationError(TAG_UNAVAILABLE_ERROR)
 
     @staticmethod
     def delete_listing(listing: ItemListing):
@@ -92,8 +134,10 @@ class ItemListingService:
         return RecalledItemListing.objects.create(
             tag=listing.tag,
             item=listing.item,
+            store=listing.store,
             store_commission=listing.store_commission,
             min_listing_days=listing.min_listing_days,
+            **listing.get_pricing(),
             reason=reason,
             collection_deadline=collection_deadline,
         )
@@ -102,13 +146,50 @@ class ItemListingService:
     def delete_recalled_listing(recalled_listing: RecalledItemListing):
         recalled_listing.delete()
 
+    @staticmethod
+    def claim_expired_recalled_listings(deadline, limit: int):
+        """
+        Locks up to limit recalled listings whose collection deadline has
+        passed, skipping rows another worker has already claimed. Must run
+        inside a transaction.
+        """
+        return list(
+            RecalledItemListing.objects.filter(collection_deadline__lt=deadline)
+            .select_related("item__owner__user", STORE, "reason")
+            .select_for_update(skip_locked=True, of=("self",))
+            .order_by("collection_deadline")[:limit]
+        )
+
+    @staticmethod
+    def delete_recalled_listings(recalled_listings: list[RecalledItemListing]):
+        RecalledItemListing.objects.filter(
+            id__in=[recalled_listing.id for recalled_listing in recalled_listings]
+        ).delete()
+
+    @staticmethod
+    def create_delisted_listings(recalled_listings: list[RecalledItemListing]):
+        return DelistedItemListing.objects.bulk_create(
+            DelistedItemListing(
+                tag_id=recalled_listing.tag_id,
+                item_id=recalled_listing.item_id,
+                store_id=recalled_listing.store_id,
+                store_commission=recalled_listing.store_commission,
+                min_listing_days=recalled_listing.min_listing_days,
+                **recalled_listing.get_pricing(),
+                reason_id=recalled_listing.reason_id,
+            )
+            for recalled_listing in recalled_listings
+        )
+
     @staticmethod
     def create_delisted_listing(listing: ItemListing, reason: RecallReason):
         return DelistedItemListing.objects.create(
             tag=listing.tag,
             item=listing.item,
+            store=listing.store,
             store_commission=listing.store_commission,
             min_listing_days=listing.min_listing_days,
+            **listing.get_pricing(),
             reason=reason,
         )
 
@@ -116,15 +197,22 @@ class ItemListingService:
         return SoldItemListing.objects.create(
             tag=listing.tag,
             item=listing.item,
+            store=listing.store,
             store_commission=listing.store_commission,
             min_listing_days=listing.min_listing_days,
+            **listing.get_pricing(),
             transaction=transaction,
         )
 
     @staticmethod
     def replace_listing_tag(listing: ItemListing, new_tag: Tag):
         listing.tag = new_tag
-        listing.save()
+        listing.store = new_tag.store
+        try:
+            with transaction.atomic():
+                listing.save()
+        except IntegrityError:
+            raise serializers.ValidationError(TAG_UNAVAILABLE_ERROR)
         return listing
 
     @staticmethod
@@ -170,55 +258,52 @@ class ItemListingService:
 class ItemListingValidationService:
     @staticmethod
     def meets_store_requirements(item: Item, tag: Tag):
+        store = tag.store
+        accepted_ids = StoreAcceptanceService.get_accepted_ids(store.id)
         errors = {}
 
-        errors.update(ItemListingValidationService._validate_condition(item, tag))
-        errors.update(ItemListingValidationService._validate_category(item, tag))
-        errors.update(ItemListingValidationService._validate_price(item, tag))
         errors.update(
-            ItemListingValidationService._validate_store_availability(tag.store)
+            ItemListingValidationService._validate_condition(
+                item, accepted_ids[CONDITIONS]
+            )
         )
+        errors.update(
+            ItemListingValidationService._validate_category(
+                item, store, accepted_ids[CATEGORIES]
+            )
+        )
+        errors.update(ItemListingValidationService._validate_price(item, store))
+        errors.update(ItemListingValidationService._validate_store_availability(store))
 
         if errors:
             raise serializers.ValidationError(errors)
 
     @staticmethod
-    def _validate_condition(item: Item, tag: Tag):
-        store_conditions = StoreItemCondition.objects.filter(store=tag.store)
-        if item.condition not in [
-            condition.condition for condition in store_conditions
-        ]:
+    def _validate_condition(item: Item, condition_ids: set[int]):
+        if item.condition_id not in condition_ids:
+            condition = item_conditions.get(item.condition_id)
             return {
-                CONDITION: f"'{item.condition}' does not meet store condition requirements."
+                CONDITION: f"'{condition}' does not meet store condition requirements."
             }
         return {}
 
     @staticmethod
-    def _validate_category(item: Item, tag: Tag):
-        categories = StoreItemCategory.objects.filter(store=tag.store)
-        if item.category not in [category.category for category in categories]:
-            return {
-                CATEGORY: f"{tag.store.store_name} does not accept '{item.category}' items."
-            }
+    def _validate_category(item: Item, store: StoreProfile, category_ids: set[int]):
+        if item.category_id not in category_ids:
+            category = item_categories.get(item.category_id)
+            return {CATEGORY: f"{store.store_name} does not accept '{category}' items."}
         return {}
 
     @staticmethod
-    def _validate_price(item: Item, tag: Tag):
-        if item.price < tag.store.min_price:
+    def _validate_price(item: Item, store: StoreProfile):
+        if item.price < store.min_price:
             return {
-                PRICE: f"Item price is below {tag.store.store_name}'s minimum price requirement."
+                PRICE: f"Item price is below {store.store_name}'s minimum price requirement."
             }
         return {}
 
+    @staticmethod
     def _validate_store_availability(store: StoreProfile):
         if not store.accepting_listings:
-            return {"store": "Store is not currently accepting listings."}
+            return {STORE: "Store is not currently accepting listings."}
         return {}
-
-    @staticmethod
-    def validate_tag_availability(tag, instance=None):
-        active_tag_listings = ItemListing.objects.filter(tag=tag)
-        if active_tag_listings.exists():
-            raise serializers.ValidationError(
-                "There is already an active listing with this tag."
-            )
@@ -0,0 +1,164 @@
+from dataclasses import dataclass
+
+from django.db import connection, models
+from django.utils.timezone import now
+
+from apps.common.constants import ID, STORE
+from apps.items.models import Item
+from apps.marketplace.constants import ListingTransition
+from apps.marketplace.models import (
+    BaseItemListing,
+    DelistedItemListing,
+    ItemListing,
+    RecalledItemListing,
+)
+
+LISTING_NOT_FOUND = "Listing not found."
+INVALID_PIN = "Invalid PIN."
+
+
+@dataclass(frozen=True)
+class ListingTransitionRule:
+    source: type[BaseItemListing]
+    target: type[BaseItemListing]
+    item_status: str
+    # Whether the source is an active listing holding one of the store's slots.
+    frees_store_slot: bool
+
+
+TRANSITION_RULES = {
+    ListingTransition.RECALL: ListingTransitionRule(
+        source=ItemListing,
+        target=RecalledItemListing,
+        item_status=Item.Statuses.RECALLED,
+        frees_store_slot=True,
+    ),
+    ListingTransition.DELIST: ListingTransitionRule(
+        source=ItemListing,
+        target=DelistedItemListing,
+        item_status=Item.Statuses.AVAILABLE,
+        frees_store_slot=True,
+    ),
+    ListingTransition.COLLECT: ListingTransitionRule(
+        source=RecalledItemListing,
+        target=DelistedItemListing,
+        item_status=Item.Statuses.AVAILABLE,
+        frees_store_slot=False,
+    ),
+}
+
+
+class ListingTransitionService:
+    @staticmethod
+    def get_rule(transition: str):
+        return TRANSITION_RULES[ListingTransition(transition)]
+
+    @staticmethod
+    def lock_store_listings(rule: ListingTransitionRule, store, tag_ids: list[int]):
+        """
+        Locks the store's source listings for the given tags, keyed by tag id.
+        Must run inside a transaction.
+        """
+        listings = (
+            rule.source.objects.filter(store=store, tag_id__in=tag_ids)
+            .select_related("item__owner__user", STORE)
+            .select_for_update(of=("self",))
+        )
+        return {listing.tag_id: listing for listing in listings}
+
+    @staticmethod
+    def copy_listings(
+        source_model: type[BaseItemListing],
+        target_model: type[BaseItemListing],
+        listing_ids: list[int],
+        values: dict,
+        keep_timestamps: bool = False,
+    ):
+        """
+        Copies listings into target_model with a single INSERT ... SELECT and
+        returns the timestamp the new rows were created at.
+
+        Each target field is taken, in order of preference, from values
+        (one value for every row, or a {listing_id: value} dict), set to now()
+        if it is an auto timestamp, read from the source row if both tables
+        have it, or set to its default. keep_timestamps reads auto timestamps
+        from the source too, for backfills.
+        """
+        timestamp = now()
+        quote = connection.ops.quote_name
+        source_fields = {
+            field.name: field for field in source_model._meta.concrete_fields
+        }
+        columns = []
+        selects = []
+        params = []
+
+        for field in target_model._meta.concrete_fields:
+            if field.primary_key:
+                continue
+            columns.append(quote(field.column))
+
+            if field.name in values:
+                value = values[field.name]
+            elif (
+                getattr(field, "auto_now", False)
+                or getattr(field, "auto_now_add", False)
+            ) and not (keep_timestamps and field.name in source_fields):
+                value = timestamp
+            elif field.name in source_fields:
+                source_column = source_fields[field.name].column
+                selects.append(f"source.{quote(source_column)}")
+                continue
+            else:
+                value = field.get_default()
+
+            if isinstance(value, dict):
+                cases = []
+                for listing_id, listing_value in value.items():
+                    cases.append("WHEN %s THEN %s")
+                    params.extend(
+                        [
+                            listing_id,
+                            ListingTransitionService._prep(field, listing_value),
+                        ]
+                    )
+                selects.append(f"CASE source.{quote(ID)} {' '.join(cases)} END")
+            else:
+                selects.append("%s")
+                params.append(ListingTransitionService._prep(field, value))
+
+        placeholders = ", ".join(["%s"] * len(listing_ids))
+        params.extend(listing_ids)
+        sql = (
+            f"INSERT INTO {quote(target_model._meta.db_table)} ({', '.join(columns)}) "
+            f"SELECT {', '.join(selects)} "
+            f"FROM {quote(source_model._meta.db_table)} AS source "
+            f"WHERE source.{quote(ID)} IN ({placeholders})"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+        return timestamp
+
+    @staticmethod
+    def _prep(field, value):
+        if isinstance(value, models.Model):
+            value = value.pk
+        return field.get_db_prep_save(value, connection)
+
+    @staticmethod
+    def get_copied_listings(target_model, item_ids: list[int], created_at):
+        return list(
+            target_model.objects.filter(
+                item_id__in=item_ids, created_at=created_at
+            ).select_related("item__owner__user", STORE, "reason")
+        )
+
+    @staticmethod
+    def delete_listings(source_model, listing_ids: list[int]):
+        source_model.objects.filter(id__in=listing_ids).delete()
+
+    @staticmethod
+    def update_item_statuses(item_ids: list[int], item_status: str):
+        Item.objects.filter(id__in=item_ids).update(
+            status=item_status, updated_at=now()
+        )
@@ -1,7 +1,28 @@
 from decimal import Decimal, ROUND_HALF_UP
 
+from apps.common.constants import (
+    LISTING_PRICE,
+    MEMBER_EARNINGS,
+    STORE_COMMISSION_AMOUNT,
+    TRANSACTION_FEE,
+)
+
 GRACE_PERIOD_DAYS = 7
 RECALLED_LISTING_RECURRING_FEE = Decimal("5.00")
+# Listing columns filled from calculate_breakdown.
+PRICING_FIELDS = [
+    LISTING_PRICE,
+    TRANSACTION_FEE,
+    STORE_COMMISSION_AMOUNT,
+    MEMBER_EARNINGS,
+]
+PENCE_PER_POUND = 100
+# Commissions are percentages with two decimal places, so 12.5% is 1250.
+BASIS_POINTS = 10000
+
+
+def from_pence(pence: int):
+    return Decimal(pence).scaleb(-2)
 
 
 class PricingEngine:
@@ -9,6 +30,65 @@ class PricingEngine:
         self.tagandtake_commission = Decimal("0.05")
         self.tagandtake_flat_fee = Decimal("1")
 
+    def calculate_breakdown(self, price: Decimal, commission: Decimal):
+        """
+        Every listing price in one pass, as Decimals rounded like the single
+        calculations. Stored on listings when they are created or repriced.
+        """
+        price = self._to_decimal(price)
+        commission = self._rebase_commission(commission)
+        transaction_fee = self.calculate_transaction_fee(price, round_result=False)
+        store_commission = price * commission
+        return {
+            LISTING_PRICE: self._quantize(price + transaction_fee),
+            TRANSACTION_FEE: self._quantize(transaction_fee),
+            STORE_COMMISSION_AMOUNT: self._quantize(store_commission),
+            MEMBER_EARNINGS: self._quantize(price - store_commission),
+        }
+
+    def calculate_breakdowns_in_pence(self, prices: list, commissions: list):
+        """
+        Prices a batch of (price, commission) pairs with integer pence
+        arithmetic, rounding half up like the single calculations. Returns a
+        column of pence per breakdown field, in input order.
+        """
+        if len(prices) != len(commissions):
+            raise ValueError("Every price needs a commission.")
+        prices = [self._to_pence(price) for price in prices]
+        rates = [self._to_basis_points(commission) for commission in commissions]
+        fee_rate = self._to_basis_points(self.tagandtake_commission * 100)
+        flat_fee = self._to_pence(self.tagandtake_flat_fee)
+
+        # (2n + d) // 2d is n / d rounded half up for non-negative n.
+        half_up = 2 * BASIS_POINTS
+        fees = [
+            (2 * price * fee_rate + BASIS_POINTS) // half_up + flat_fee
+            for price in prices
+        ]
+        return {
+            LISTING_PRICE: [price + fee for price, fee in zip(prices, fees)],
+            TRANSACTION_FEE: fees,
+            STORE_COMMISSION_AMOUNT: [
+                (2 * price * rate + BASIS_POINTS) // half_up
+                for price, rate in zip(prices, rates)
+            ],
+            MEMBER_EARNINGS: [
+                (2 * price * (BASIS_POINTS - rate) + BASIS_POINTS) // half_up
+                for price, rate in zip(prices, rates)
+            ],
+        }
+
+    def calculate_breakdowns(self, prices: list, commissions: list):
+        """
+        Batch version of calculate_breakdown, returning one dict of Decimals
+        per (price, commission) pair.
+        """
+        columns = self.calculate_breakdowns_in_pence(prices, commissions)
+        rows = zip(*columns.values())
+        return [
+            dict(zip(columns, [from_pence(pence) for pence in row])) for row in rows
+        ]
+
     def calculate_list_price(self, price: Decimal):
         """
         Price that the buyer sees.
@@ -54,7 +134,35 @@ class PricingEngine:
             )
 
     def _round_decimal(self, value: Decimal):
-        return float(value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+        return float(self._quantize(value))
+
+    def _quantize(self, value: Decimal):
+        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+    def _to_pence(self, value):
+        if isinstance(value, int):
+            pence = value * PENCE_PER_POUND
+        else:
+            pence = self._to_whole_units(value, PENCE_PER_POUND, "Prices")
+        if pence < 0:
+            raise ValueError("Prices cannot be negative.")
+        return pence
+
+    def _to_basis_points(self, commission):
+        basis_points = self._to_whole_units(
+            commission, BASIS_POINTS // 100, "Commissions"
+        )
+        if not 0 <= basis_points <= BASIS_POINTS:
+            raise ValueError("Commissions must be between 0 and 100.")
+        return basis_points
+
+    def _to_whole_units(self, value, scale: int, name: str):
+        if not isinstance(value, Decimal):
+            value = self._to_decimal(value)
+        units = value * scale
+        if units != units.to_integral_value():
+            raise ValueError(f"{name} can have at most two decimal places.")
+        return int(units)
 
     def _rebase_commission(self, commission: Decimal):
         return Decimal(str(commission)) / Decimal("100")
@@ -1,26 +1,86 @@
+from datetime import timedelta
+
 from celery import shared_task
+from django.db import connection, transaction
 from django.utils.timezone import now
 from apps.notifications.emails.services.email_senders import ListingEmailSender
-from apps.marketplace.models import RecalledItemListing
+from apps.notifications.emails.services.email_service import email_batch
+from apps.marketplace.models import RecalledItemListing, RecalledItemListingReminder
+from apps.common.constants import CREATED_AT, ID, SENT_ON, STORE
+
+# Reminders built and sent together over one SMTP connection.
+REMINDER_BATCH_SIZE = 50
 
 
 @shared_task
 def run_recalled_listing_reminders():
-    recalled_listings = RecalledItemListing.objects.all()
-    for listing in recalled_listings:
-        if is_time_to_remind(listing):
-            remind_member.delay(listing.id)
+    """
+    Reminds owners to collect recalled items once a day, skipping the day
+    the item was recalled and the day of the deadline. Only reminders this
+    run records are sent, so a re-run or an overlapping run sends nothing
+    new.
+    """
+    today_start = now().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = today_start.date()
+
+    due_ids = list(
+        RecalledItemListing.objects.filter(
+            created_at__lt=today_start,
+            collection_deadline__gte=today_start + timedelta(days=1),
+        )
+        .exclude(reminders__sent_on=today)
+        .values_list(ID, flat=True)
+    )
+    for start in range(0, len(due_ids), REMINDER_BATCH_SIZE):
+        # Reminders are recorded and queued together, so a batch that rolls
+        # back neither records nor sends anything.
+        with transaction.atomic():
+            recorded_ids = record_reminders(
+                due_ids[start : start + REMINDER_BATCH_SIZE], today
+            )
+            if recorded_ids:
+                send_reminders(recorded_ids)
+
+
+def record_reminders(recalled_listing_ids: list[int], sent_on):
+    """
+    Records a reminder per listing for sent_on and returns the listings
+    this call recorded. Listings an overlapping run has already recorded
+    are left out, so each reminder is sent once.
+    """
+    meta = RecalledItemListingReminder._meta
+    quote = connection.ops.quote_name
+    listing_column = quote(meta.get_field("recalled_listing").column)
+    sent_on = meta.get_field(SENT_ON).get_db_prep_save(sent_on, connection)
+    created_at = meta.get_field(CREATED_AT).get_db_prep_save(now(), connection)
+
+    rows = ", ".join(["(%s, %s, %s)"] * len(recalled_listing_ids))
+    params = []
+    for listing_id in recalled_listing_ids:
+        params.extend([listing_id, sent_on, created_at])
+    sql = (
+        f"INSERT INTO {quote(meta.db_table)} "
+        f"({listing_column}, {quote(SENT_ON)}, {quote(CREATED_AT)}) "
+        f"VALUES {rows} "
+        f"ON CONFLICT ({listing_column}, {quote(SENT_ON)}) DO NOTHING "
+        f"RETURNING {listing_column}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def send_reminders(recalled_listing_ids: list[int]):
+    # Contexts are built here and recorded in the outbox as one batch.
+    recalled_listings = RecalledItemListing.objects.filter(
+        id__in=recalled_listing_ids
+    ).select_related("item__owner__user", STORE, "reason")
+    with email_batch():
+        for recalled_listing in recalled_listings:
+            ListingEmailSender.send_collection_reminder_email(recalled_listing)
 
 
 @shared_task
 def remind_member(recalled_listing_id):
     recalled_listing = RecalledItemListing.objects.get(id=recalled_listing_id)
     ListingEmailSender.send_collection_reminder_email(recalled_listing)
-
-
-def is_time_to_remind(recalled_listing: RecalledItemListing):
-    return (
-        now() < recalled_listing.collection_deadline
-        and now().date() != recalled_listing.collection_deadline.date()
-        and now().date() != recalled_listing.created_at.date()
-    )
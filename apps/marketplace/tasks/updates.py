@@ -1,16 +1,41 @@
+import time
+
 from celery import shared_task
+from celery.utils.log import get_task_logger
 from django.utils.timezone import now
 from apps.marketplace.models import RecalledItemListing
-from apps.marketplace.processors import ItemListingAbandonedProcessor
+from apps.marketplace.processors import (
+    ItemListingAbandonedBatchProcessor,
+    ItemListingAbandonedProcessor,
+)
+
+logger = get_task_logger(__name__)
 
 
 @shared_task
 def run_abandoned_item_updates():
-    recalled_listings = RecalledItemListing.objects.filter(
-        collection_deadline__lt=now()
-    )
-    for listing in recalled_listings:
-        run_task_for_listing.delay(listing.id)
+    """
+    Abandons every recalled listing past its collection deadline, one batch
+    per transaction, and returns throughput metrics for the run.
+    """
+    deadline = now()
+    started = time.perf_counter()
+    processed = 0
+    batches = 0
+
+    while abandoned := ItemListingAbandonedBatchProcessor(deadline).process():
+        processed += len(abandoned)
+        batches += 1
+
+    seconds = time.perf_counter() - started
+    metrics = {
+        "processed": processed,
+        "batches": batches,
+        "seconds": round(seconds, 3),
+        "listings_per_second": round(processed / seconds, 1) if seconds else 0,
+    }
+    logger.info("Abandoned item updates: %s", metrics)
+    return metrics
 
 
 @shared_task
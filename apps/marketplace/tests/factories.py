@@ -0,0 +1,64 @@
+from decimal import Decimal
+
+from apps.accounts.models import User
+from apps.items.models import Item, ItemCategory, ItemCondition, ItemImages
+from apps.marketplace.models import ItemListing
+from apps.members.models import MemberProfile
+from apps.stores.models import StoreProfile, Tag, TagGroup
+
+
+def create_user(username: str, role: str = User.Roles.MEMBER):
+    return User.objects.create_user(
+        username=username,
+        email=f"{username}@test.com",
+        password="password123",
+        role=role,
+    )
+
+
+def create_store(name: str = "store", **store_data):
+    user = create_user(name, role=User.Roles.STORE)
+    return StoreProfile.objects.create(user=user, store_name=name, **store_data)
+
+
+def create_member(name: str = "member"):
+    user = create_user(name)
+    return MemberProfile.objects.create(user=user)
+
+
+def create_category(name: str = "Tops"):
+    return ItemCategory.objects.create(name=name)
+
+
+def create_condition(condition: str = "Good"):
+    return ItemCondition.objects.create(condition=condition)
+
+
+def create_tags(store: StoreProfile, count: int = 1):
+    tag_group = TagGroup.objects.create(store=store, group_size=count)
+    return [Tag.objects.create(tag_group=tag_group, store=store) for _ in range(count)]
+
+
+def create_item(member: MemberProfile, category, condition, price="10.00", images=1):
+    item = Item.objects.create(
+        owner=member,
+        name="Jacket",
+        price=Decimal(price),
+        category=category,
+        condition=condition,
+    )
+    for order in range(images):
+        ItemImages.objects.create(
+            item=item, image_url=f"https://test.com/{item.id}_{order}.jpg", order=order
+        )
+    return item
+
+
+def create_listing(item: Item, tag: Tag):
+    return ItemListing.objects.create(
+        item=item,
+        tag=tag,
+        store=tag.store,
+        store_commission=tag.store.commission,
+        min_listing_days=tag.store.min_listing_days,
+    )
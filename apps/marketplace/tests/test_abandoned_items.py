@@ -0,0 +1,68 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.test import TestCase
+from django.utils.timezone import now
+
+from apps.items.models import Item
+from apps.marketplace import processors
+from apps.marketplace.models import (
+    DelistedItemListing,
+    RecalledItemListing,
+    RecallReason,
+)
+from apps.marketplace.tasks.updates import run_abandoned_item_updates
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_member,
+    create_store,
+    create_tags,
+)
+
+
+class TestAbandonedItemUpdates(TestCase):
+    def setUp(self):
+        self.store = create_store()
+        self.member = create_member()
+        self.category = create_category()
+        self.condition = create_condition()
+        self.reason = RecallReason.objects.create(
+            reason="Damaged", type=RecallReason.Type.ISSUE, description="Damaged"
+        )
+
+    def _recall(self, deadline_in_days: int):
+        item = create_item(self.member, self.category, self.condition)
+        (tag,) = create_tags(self.store, 1)
+        return RecalledItemListing.objects.create(
+            item=item,
+            tag=tag,
+            store=self.store,
+            store_commission=self.store.commission,
+            min_listing_days=self.store.min_listing_days,
+            reason=self.reason,
+            collection_deadline=now() + timedelta(days=deadline_in_days),
+        )
+
+    def test_abandons_expired_listings_in_batches(self):
+        expired = [self._recall(deadline_in_days=-1) for _ in range(5)]
+        pending = self._recall(deadline_in_days=3)
+
+        with mock.patch.object(processors, "ABANDONED_BATCH_SIZE", 2):
+            with self.captureOnCommitCallbacks(execute=True):
+                metrics = run_abandoned_item_updates()
+
+        self.assertEqual(metrics["processed"], 5)
+        self.assertEqual(metrics["batches"], 3)
+        self.assertEqual(
+            list(RecalledItemListing.objects.values_list("id", flat=True)),
+            [pending.id],
+        )
+        self.assertEqual(
+            set(DelistedItemListing.objects.values_list("item_id", flat=True)),
+            {listing.item_id for listing in expired},
+        )
+        self.assertEqual(Item.objects.filter(status=Item.Statuses.ABANDONED).count(), 5)
+        self.assertEqual(len(mail.outbox), 5)
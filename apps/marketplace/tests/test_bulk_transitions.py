@@ -0,0 +1,132 @@
+from django.core import mail
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.items.models import Item
+from apps.marketplace.constants import ListingTransition
+from apps.marketplace.models import (
+    DelistedItemListing,
+    ItemListing,
+    RecalledItemListing,
+    RecallReason,
+)
+from apps.marketplace.reference_data import recall_reasons
+from apps.marketplace.services.listing_transition_services import INVALID_PIN
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_listing,
+    create_member,
+    create_store,
+    create_tags,
+)
+
+URL = "/v1/stores/me/listings/bulk-transition/"
+
+
+class TestBulkListingTransitions(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.store = create_store()
+        self.member = create_member()
+        self.category = create_category()
+        self.condition = create_condition()
+        self.reason = RecallReason.objects.create(
+            reason="Damaged", type=RecallReason.Type.ISSUE, description="Damaged"
+        )
+        recall_reasons.all()
+        self.client.force_authenticate(self.store.user)
+
+    def _add_listings(self, count: int):
+        listings = []
+        for tag in create_tags(self.store, count):
+            item = create_item(self.member, self.category, self.condition)
+            listings.append(create_listing(item, tag))
+        self.store.active_listings_count += count
+        self.store.save()
+        return listings
+
+    def _post(self, transition: str, listings: list[dict]):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                URL,
+                {
+                    "transition": transition,
+                    "reason": self.reason.id,
+                    "listings": listings,
+                },
+                format="json",
+            )
+
+    def test_recalls_listings_and_reports_missing_tags(self):
+        listings = self._add_listings(3)
+        missing_tag_id = listings[-1].tag_id + 100
+
+        response = self._post(
+            ListingTransition.RECALL,
+            [{"tag_id": listing.tag_id} for listing in listings]
+            + [{"tag_id": missing_tag_id}],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = {result["tag_id"]: result for result in response.data["data"]}
+        self.assertFalse(results[missing_tag_id]["success"])
+        self.assertTrue(all(results[l.tag_id]["success"] for l in listings))
+
+        self.assertFalse(ItemListing.objects.exists())
+        recalled = RecalledItemListing.objects.all()
+        self.assertEqual(len(recalled), 3)
+        for listing in recalled:
+            self.assertEqual(listing.reason, self.reason)
+            self.assertTrue(listing.collection_pin)
+            self.assertIsNotNone(listing.collection_deadline)
+        self.assertEqual(Item.objects.filter(status=Item.Statuses.RECALLED).count(), 3)
+        self.store.refresh_from_db()
+        self.assertEqual(self.store.active_listings_count, 0)
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_query_count_does_not_grow_with_listings(self):
+        few = self._add_listings(1)
+        with CaptureQueriesContext(connection) as few_queries:
+            self._post(ListingTransition.DELIST, [{"tag_id": l.tag_id} for l in few])
+
+        many = self._add_listings(6)
+        with CaptureQueriesContext(connection) as many_queries:
+            self._post(ListingTransition.DELIST, [{"tag_id": l.tag_id} for l in many])
+
+        self.assertEqual(DelistedItemListing.objects.count(), 7)
+        self.assertEqual(len(few_queries), len(many_queries))
+
+    def test_collect_checks_each_pin(self):
+        listings = self._add_listings(2)
+        self._post(ListingTransition.RECALL, [{"tag_id": l.tag_id} for l in listings])
+        first, second = RecalledItemListing.objects.order_by("id")
+
+        response = self._post(
+            ListingTransition.COLLECT,
+            [
+                {"tag_id": first.tag_id, "pin": first.collection_pin},
+                {"tag_id": second.tag_id, "pin": "wrong"},
+            ],
+        )
+
+        first_result, second_result = response.data["data"]
+        self.assertTrue(first_result["success"])
+        self.assertEqual(second_result["error"], INVALID_PIN)
+        self.assertEqual(
+            list(RecalledItemListing.objects.values_list("id", flat=True)),
+            [second.id],
+        )
+        self.assertTrue(DelistedItemListing.objects.filter(item=first.item).exists())
+
+    def test_collect_requires_pins(self):
+        (listing,) = self._add_listings(1)
+
+        response = self._post(ListingTransition.COLLECT, [{"tag_id": listing.tag_id}])
+
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,97 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.items.services import ItemService
+from apps.marketplace.constants import ListingRole
+from apps.marketplace.models import RecallReason
+from apps.marketplace.processors import ItemListingRecallProcessor
+from apps.marketplace.services import listing_cache_services
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_listing,
+    create_member,
+    create_store,
+    create_tags,
+)
+
+
+class TestListingCache(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.store = create_store()
+        self.member = create_member()
+        (self.tag,) = create_tags(self.store, 1)
+        self.item = create_item(self.member, create_category(), create_condition())
+        self.listing = create_listing(self.item, self.tag)
+        self.url = f"/v1/listings/{self.tag.id}/"
+
+    def test_cached_scan_skips_the_database(self):
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(queries), 0)
+        self.assertTrue(response.data["listing_exists"])
+        self.assertEqual(response.data["tag"], self.tag.id)
+
+    def test_user_relation_is_computed_per_request(self):
+        self.assertEqual(
+            self.client.get(self.url).data["user_listing_relation"],
+            ListingRole.VIEWER,
+        )
+
+        self.client.force_authenticate(self.member.user)
+        self.assertEqual(
+            self.client.get(self.url).data["user_listing_relation"],
+            ListingRole.OWNER,
+        )
+
+        self.client.force_authenticate(self.store.user)
+        self.assertEqual(
+            self.client.get(self.url).data["user_listing_relation"],
+            ListingRole.HOST,
+        )
+
+    def test_item_update_invalidates_listing(self):
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ItemService.update_item(self.item, {"name": "Coat"})
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["item_details"]["name"], "Coat")
+
+    def test_recall_invalidates_listing(self):
+        self.client.get(self.url)
+        reason = RecallReason.objects.create(
+            reason="Damaged", type=RecallReason.Type.ISSUE, description="Damaged"
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ItemListingRecallProcessor(self.listing, reason).process()
+
+        response = self.client.get(self.url)
+        self.assertFalse(response.data["listing_exists"])
+
+    def test_cache_outage_falls_through_to_the_database(self):
+        broken_cache = mock.Mock()
+        broken_cache.get.side_effect = ConnectionError
+        broken_cache.set.side_effect = ConnectionError
+        broken_cache.delete_many.side_effect = ConnectionError
+
+        with mock.patch.object(listing_cache_services, "cache", broken_cache):
+            response = self.client.get(self.url)
+            with self.captureOnCommitCallbacks(execute=True):
+                ItemService.update_item(self.item, {"name": "Coat"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["tag"], self.tag.id)
@@ -0,0 +1,41 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.items.services import ItemService
+from apps.marketplace.models import ItemListing
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_listing,
+    create_member,
+    create_store,
+    create_tags,
+)
+
+
+class TestListingPricing(TestCase):
+    def setUp(self):
+        self.store = create_store(commission=Decimal("20.00"))
+        self.member = create_member()
+        item = create_item(
+            self.member, create_category(), create_condition(), price="40.00"
+        )
+        (tag,) = create_tags(self.store, 1)
+        self.listing = create_listing(item, tag)
+
+    def test_pricing_is_stored_when_listed(self):
+        listing = ItemListing.objects.get(id=self.listing.id)
+
+        self.assertEqual(listing.listing_price, Decimal("43.00"))
+        self.assertEqual(listing.transaction_fee, Decimal("3.00"))
+        self.assertEqual(listing.store_commission_amount, Decimal("8.00"))
+        self.assertEqual(listing.member_earnings, Decimal("32.00"))
+
+    def test_price_change_reprices_the_active_listing(self):
+        ItemService.update_item(self.listing.item, {"price": Decimal("10.00")})
+
+        listing = ItemListing.objects.get(id=self.listing.id)
+        self.assertEqual(listing.listing_price, Decimal("11.50"))
+        self.assertEqual(listing.member_earnings, Decimal("8.00"))
@@ -0,0 +1,86 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.items.reference_data import item_categories, item_conditions
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_listing,
+    create_member,
+    create_store,
+    create_tags,
+)
+
+# Listing select (with joins), pagination count and the images and
+# item listing prefetches. Categories and conditions come from the
+# reference data cache.
+LISTING_PAGE_QUERIES = 4
+
+
+class TestListingPageQueryCount(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.store = create_store()
+        self.member = create_member()
+        self.category = create_category()
+        self.condition = create_condition()
+        item_categories.all()
+        item_conditions.all()
+
+    def _add_listings(self, count: int):
+        for tag in create_tags(self.store, count):
+            item = create_item(self.member, self.category, self.condition, images=3)
+            create_listing(item, tag)
+
+    def _get_page(self, url: str):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_public_store_listing_page_query_count_is_constant(self):
+        url = f"/v1/stores/{self.store.id}/listings/"
+
+        self._add_listings(1)
+        response, single_row_queries = self._get_page(url)
+        self.assertEqual(response.data["count"], 1)
+
+        self._add_listings(9)
+        response, many_row_queries = self._get_page(url)
+        self.assertEqual(response.data["count"], 10)
+
+        self.assertEqual(single_row_queries, LISTING_PAGE_QUERIES)
+        self.assertEqual(many_row_queries, LISTING_PAGE_QUERIES)
+
+    def test_store_owner_listing_page_query_count_is_constant(self):
+        url = "/v1/stores/me/listings/"
+        self.client.force_authenticate(self.store.user)
+
+        self._add_listings(1)
+        _, single_row_queries = self._get_page(url)
+
+        self._add_listings(9)
+        response, many_row_queries = self._get_page(url)
+
+        self.assertEqual(response.data["count"], 10)
+        self.assertEqual(single_row_queries, many_row_queries)
+
+    def test_listing_payload_uses_prefetched_relations(self):
+        self._add_listings(1)
+
+        response = self.client.get(f"/v1/stores/{self.store.id}/listings/")
+
+        listing = response.data["results"][0]
+        item_details = listing["item_details"]
+        self.assertEqual(item_details["tag_id"], listing["tag"])
+        self.assertEqual(
+            item_details["main_image"], item_details["images"][0]["image_url"]
+        )
+        self.assertEqual(
+            [image["order"] for image in item_details["images"]], [0, 1, 2]
+        )
+        self.assertEqual(item_details["category_details"]["name"], self.category.name)
+        self.assertEqual(listing["user_listing_relation"], "VIEWER")
@@ -0,0 +1,77 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from apps.marketplace.constants import ListingRole
+from apps.marketplace.models import ItemListing
+from apps.marketplace.processors import ItemListingCreateProcessor
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_listing,
+    create_member,
+    create_store,
+    create_tags,
+)
+from apps.stores.models import StoreProfile
+
+
+class TestListingResolution(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.store = create_store()
+        self.member = create_member()
+        self.category = create_category()
+        self.condition = create_condition()
+        self.listed_tag, self.empty_tag = create_tags(self.store, 2)
+        self.item = create_item(self.member, self.category, self.condition)
+        create_listing(self.item, self.listed_tag)
+
+    def _check_role(self, tag_id: int):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"/v1/listings/{tag_id}/check-role/")
+        self.assertEqual(response.status_code, 200)
+        return response.data, len(queries)
+
+    def test_role_check_resolves_listed_tag_in_one_query(self):
+        self.client.force_authenticate(self.member.user)
+
+        data, query_count = self._check_role(self.listed_tag.id)
+
+        self.assertEqual(query_count, 1)
+        self.assertEqual(data["user_listing_relation"], ListingRole.OWNER)
+        self.assertTrue(data["listing_exists"])
+
+    def test_role_check_resolves_empty_tag_in_one_query(self):
+        self.client.force_authenticate(self.store.user)
+
+        data, query_count = self._check_role(self.empty_tag.id)
+
+        self.assertEqual(query_count, 1)
+        self.assertEqual(data["user_listing_relation"], ListingRole.HOST)
+        self.assertFalse(data["listing_exists"])
+
+    def test_anonymous_scan_of_empty_tag(self):
+        response = self.client.get(f"/v1/listings/{self.empty_tag.id}/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["user_listing_relation"], ListingRole.VIEWER)
+        self.assertFalse(response.data["listing_exists"])
+
+    def test_unknown_tag_is_not_found(self):
+        response = self.client.get("/v1/listings/0/check-role/")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_second_listing_on_tag_is_rejected(self):
+        item = create_item(self.member, self.category, self.condition)
+
+        with self.assertRaises(serializers.ValidationError):
+            ItemListingCreateProcessor(item, self.listed_tag).process()
+
+        self.assertEqual(ItemListing.objects.filter(tag=self.listed_tag).count(), 1)
+        store = StoreProfile.objects.get(id=self.store.id)
+        self.assertEqual(store.active_listings_count, 0)
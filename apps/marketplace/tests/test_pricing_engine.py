@@ -1,5 +1,18 @@
+import random
+from decimal import Decimal
+
 import pytest
-from apps.marketplace.services.pricing_services import PricingEngine
+from apps.marketplace.services.pricing_services import PricingEngine, from_pence
+
+# Seeded so a parity failure can be replayed.
+PARITY_SEED = 2024
+PARITY_CASES = 5000
+
+
+def random_prices_and_commissions(count: int, rng: random.Random):
+    prices = [Decimal(rng.randint(0, 1_000_000)).scaleb(-2) for _ in range(count)]
+    commissions = [Decimal(rng.randint(0, 10_000)).scaleb(-2) for _ in range(count)]
+    return prices, commissions
 
 
 class TestPricingEngine:
@@ -17,3 +30,57 @@ class TestPricingEngine:
             transaction_fee = PricingEngine().calculate_transaction_fee(price)
             listing_price = PricingEngine().calculate_list_price(price)
             assert round(transaction_fee + price, 2) == round(listing_price, 2)
+
+    def test_breakdown_matches_single_calculations(self):
+        engine = PricingEngine()
+        test_prices = [10, 11.125, 43.53, 100.01, 1000.01, 234.42, 0.99]
+        for commission in [0, 12.5, 20]:
+            for price in test_prices:
+                breakdown = engine.calculate_breakdown(price, commission)
+                expected = {
+                    "listing_price": engine.calculate_list_price(price),
+                    "transaction_fee": engine.calculate_transaction_fee(price),
+                    "store_commission_amount": engine.calculate_store_commission(
+                        price, commission
+                    ),
+                    "member_earnings": engine.calculate_user_earnings(
+                        price, commission
+                    ),
+                }
+                assert {k: float(v) for k, v in breakdown.items()} == expected
+
+    def test_batch_matches_scalar_breakdowns(self):
+        engine = PricingEngine()
+        prices, commissions = random_prices_and_commissions(
+            PARITY_CASES, random.Random(PARITY_SEED)
+        )
+        # Half-pence boundaries, where the rounding mode matters.
+        prices += [Decimal("0.10"), Decimal("0.30"), Decimal("10.10"), 0, 7]
+        commissions += [Decimal("5.00"), Decimal("12.50"), Decimal("0.05"), 0, 100]
+
+        batch = engine.calculate_breakdowns(prices, commissions)
+
+        for price, commission, breakdown in zip(prices, commissions, batch):
+            assert breakdown == engine.calculate_breakdown(price, commission)
+
+    def test_batch_pence_columns_are_exact(self):
+        columns = PricingEngine().calculate_breakdowns_in_pence(
+            [Decimal("40.00"), Decimal("0.10")], [Decimal("20.00"), Decimal("12.50")]
+        )
+
+        assert columns == {
+            "listing_price": [4300, 111],
+            "transaction_fee": [300, 101],
+            "store_commission_amount": [800, 1],
+            "member_earnings": [3200, 9],
+        }
+        assert from_pence(columns["listing_price"][0]) == Decimal("43.00")
+
+    def test_batch_rejects_sub_pence_and_mismatched_inputs(self):
+        engine = PricingEngine()
+        with pytest.raises(ValueError):
+            engine.calculate_breakdowns([Decimal("1.005")], [Decimal("10")])
+        with pytest.raises(ValueError):
+            engine.calculate_breakdowns([Decimal("1.00")], [Decimal("101")])
+        with pytest.raises(ValueError):
+            engine.calculate_breakdowns([Decimal("1.00")], [])
@@ -0,0 +1,108 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from apps.marketplace.models import (
+    RecalledItemListing,
+    RecalledItemListingReminder,
+    RecallReason,
+)
+from apps.marketplace.tasks import reminders
+from apps.marketplace.tasks.reminders import run_recalled_listing_reminders
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_member,
+    create_store,
+    create_tags,
+)
+
+
+class TestRecalledListingReminders(TestCase):
+    def setUp(self):
+        self.store = create_store()
+        self.category = create_category()
+        self.condition = create_condition()
+        self.reason = RecallReason.objects.create(
+            reason="Damaged", type=RecallReason.Type.ISSUE, description="Damaged"
+        )
+        self.member_count = 0
+
+    def _recall(self, recalled_days_ago: int, deadline_in_days: int):
+        self.member_count += 1
+        member = create_member(f"member{self.member_count}")
+        item = create_item(member, self.category, self.condition)
+        (tag,) = create_tags(self.store, 1)
+        listing = RecalledItemListing.objects.create(
+            item=item,
+            tag=tag,
+            store=self.store,
+            store_commission=self.store.commission,
+            min_listing_days=self.store.min_listing_days,
+            reason=self.reason,
+            collection_deadline=now() + timedelta(days=deadline_in_days),
+        )
+        RecalledItemListing.objects.filter(id=listing.id).update(
+            created_at=now() - timedelta(days=recalled_days_ago)
+        )
+        return listing
+
+    def _run(self):
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                run_recalled_listing_reminders()
+        return len(queries)
+
+    def test_reminds_due_listings_once_a_day(self):
+        due = self._recall(recalled_days_ago=2, deadline_in_days=5)
+        self._recall(recalled_days_ago=0, deadline_in_days=5)
+        self._recall(recalled_days_ago=2, deadline_in_days=-1)
+
+        self._run()
+        self._run()
+
+        (email,) = mail.outbox
+        self.assertEqual(email.to, [due.item.owner.email])
+        self.assertTrue(
+            RecalledItemListingReminder.objects.filter(
+                recalled_listing=due, sent_on=now().date()
+            ).exists()
+        )
+
+    def test_queries_do_not_grow_with_due_reminders(self):
+        self._recall(recalled_days_ago=2, deadline_in_days=5)
+        few_queries = self._run()
+        RecalledItemListingReminder.objects.all().delete()
+
+        for _ in range(4):
+            self._recall(recalled_days_ago=2, deadline_in_days=5)
+        many_queries = self._run()
+
+        self.assertEqual(few_queries, many_queries)
+        self.assertEqual(len(mail.outbox), 6)
+
+    def test_overlapping_runs_send_each_reminder_once(self):
+        first = self._recall(recalled_days_ago=2, deadline_in_days=5)
+        second = self._recall(recalled_days_ago=2, deadline_in_days=5)
+        record_reminders = reminders.record_reminders
+
+        def record_after_another_run(listing_ids, sent_on):
+            # Another run records the first listing after this run chose it.
+            RecalledItemListingReminder.objects.create(
+                recalled_listing=first, sent_on=sent_on
+            )
+            return record_reminders(listing_ids, sent_on)
+
+        with mock.patch.object(
+            reminders, "record_reminders", side_effect=record_after_another_run
+        ):
+            self._run()
+
+        (email,) = mail.outbox
+        self.assertEqual(email.to, [second.item.owner.email])
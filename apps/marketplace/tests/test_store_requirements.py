@@ -0,0 +1,107 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.items.reference_data import item_categories, item_conditions
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_member,
+    create_store,
+    create_tags,
+)
+from apps.stores.models import StoreItemCategory, StoreItemCondition
+from apps.stores.services import store_services
+
+
+class TestStoreRequirements(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.member = create_member()
+        self.client.force_authenticate(self.member.user)
+        self.condition = create_condition()
+
+    def _create_store(self, name: str, category_count: int):
+        store = create_store(name)
+        categories = [create_category(f"{name} {i}") for i in range(category_count)]
+        StoreItemCategory.objects.bulk_create(
+            StoreItemCategory(store=store, category=category) for category in categories
+        )
+        StoreItemCondition.objects.create(store=store, condition=self.condition)
+        return store, categories[0]
+
+    def _create_listing(self, store, category):
+        item = create_item(self.member, category, self.condition)
+        (tag,) = create_tags(store, 1)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                "/v1/members/me/listings/",
+                {"item_id": item.id, "tag_id": tag.id},
+                format="json",
+            )
+        return response, len(queries)
+
+    def test_listing_creation_queries_do_not_grow_with_store_preferences(self):
+        small_store, small_category = self._create_store("small", 1)
+        large_store, large_category = self._create_store("large", 20)
+        item_categories.all()
+        item_conditions.all()
+
+        small_response, small_queries = self._create_listing(
+            small_store, small_category
+        )
+        large_response, large_queries = self._create_listing(
+            large_store, large_category
+        )
+
+        self.assertEqual(small_response.status_code, 201)
+        self.assertEqual(large_response.status_code, 201)
+        self.assertEqual(small_queries, large_queries)
+
+    def test_rejects_items_outside_store_preferences(self):
+        store, _ = self._create_store("store", 1)
+        other_category = create_category("Shoes")
+
+        response, _ = self._create_listing(store, other_category)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data["category"], ["store does not accept 'Shoes' items."]
+        )
+
+    def test_category_update_invalidates_acceptance(self):
+        store, _ = self._create_store("store", 1)
+        new_category = create_category("Shoes")
+        self._create_listing(store, new_category)
+
+        self.client.force_authenticate(store.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/v1/stores/me/categories/",
+                {"categories": [new_category.id], "pin": store.pin},
+                format="json",
+            )
+
+        self.client.force_authenticate(self.member.user)
+        response, _ = self._create_listing(store, new_category)
+        self.assertEqual(response.status_code, 201)
+
+    def test_acceptance_is_read_from_the_database_when_the_cache_is_down(self):
+        store, category = self._create_store("store", 1)
+        other_category = create_category("Shoes")
+        broken_cache = mock.Mock()
+        broken_cache.get.side_effect = ConnectionError
+        broken_cache.set.side_effect = ConnectionError
+
+        with mock.patch.object(store_services, "cache", broken_cache):
+            accepted, _ = self._create_listing(store, category)
+            rejected, _ = self._create_listing(store, other_category)
+
+        self.assertEqual(accepted.status_code, 201)
+        self.assertEqual(rejected.status_code, 400)
@@ -0,0 +1,125 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.utils.timezone import now
+
+from apps.marketplace.constants import ListingState
+from apps.marketplace.models import (
+    ActiveListing,
+    DelistedListing,
+    ItemListing,
+    Listing,
+    RecalledItemListing,
+    RecalledListing,
+    RecallReason,
+)
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_listing,
+    create_member,
+    create_store,
+    create_tags,
+)
+
+
+class TestUnifiedListings(TestCase):
+    def setUp(self):
+        self.store = create_store()
+        self.member = create_member()
+        self.category = create_category()
+        self.condition = create_condition()
+        self.reason = RecallReason.objects.create(
+            reason="Damaged", type=RecallReason.Type.ISSUE, description="Damaged"
+        )
+
+    def _listing_data(self, tag=None):
+        if tag is None:
+            (tag,) = create_tags(self.store, 1)
+        return {
+            "item": create_item(self.member, self.category, self.condition),
+            "tag": tag,
+            "store": self.store,
+            "store_commission": self.store.commission,
+            "min_listing_days": self.store.min_listing_days,
+        }
+
+    def test_proxies_create_and_see_only_their_state(self):
+        active = ActiveListing.objects.create(**self._listing_data())
+        recalled = RecalledListing.objects.create(
+            **self._listing_data(),
+            reason=self.reason,
+            collection_deadline=now() + timedelta(days=21),
+        )
+
+        self.assertEqual(active.state, ListingState.ACTIVE)
+        self.assertEqual(recalled.state, ListingState.RECALLED)
+        self.assertTrue(recalled.collection_pin)
+        self.assertIsNotNone(recalled.recalled_at)
+        self.assertEqual(list(ActiveListing.objects.all()), [active])
+        self.assertEqual(list(RecalledListing.objects.all()), [recalled])
+        self.assertEqual(Listing.objects.count(), 2)
+
+    def test_transition_is_a_single_update(self):
+        listings = [
+            ActiveListing.objects.create(**self._listing_data()) for _ in range(3)
+        ]
+
+        with self.assertNumQueries(1):
+            moved = ActiveListing.objects.filter(
+                id__in=[listing.id for listing in listings]
+            ).transition(ListingState.ACTIVE, ListingState.DELISTED, reason=self.reason)
+
+        self.assertEqual(moved, 3)
+        self.assertFalse(ActiveListing.objects.exists())
+        for listing in DelistedListing.objects.all():
+            self.assertEqual(listing.reason, self.reason)
+            self.assertIsNotNone(listing.delisted_at)
+
+    def test_history_spans_states_in_one_query(self):
+        data = self._listing_data()
+        first = DelistedListing.objects.create(**data, reason=self.reason)
+        second = ActiveListing.objects.create(**data)
+
+        with self.assertNumQueries(1):
+            history = list(Listing.objects.history(data["item"].id))
+
+        self.assertEqual(history, [first, second])
+
+    def test_tag_is_unique_among_active_listings_only(self):
+        data = self._listing_data()
+        ActiveListing.objects.create(**data)
+        RecalledListing.objects.create(
+            **self._listing_data(tag=data["tag"]),
+            reason=self.reason,
+            collection_deadline=now(),
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ActiveListing.objects.create(**self._listing_data(tag=data["tag"]))
+
+    def test_backfill_copies_legacy_tables(self):
+        (tag,) = create_tags(self.store, 1)
+        legacy = create_listing(
+            create_item(self.member, self.category, self.condition), tag
+        )
+        created_at = now() - timedelta(days=5)
+        ItemListing.objects.filter(id=legacy.id).update(created_at=created_at)
+        RecalledItemListing.objects.create(
+            **self._listing_data(),
+            reason=self.reason,
+            collection_deadline=now() + timedelta(days=21),
+        )
+
+        call_command("backfill_listings", stdout=StringIO())
+
+        active = ActiveListing.objects.get()
+        self.assertEqual(active.item_id, legacy.item_id)
+        self.assertEqual(active.created_at, created_at)
+        recalled = RecalledListing.objects.get()
+        self.assertEqual(recalled.reason, self.reason)
+        self.assertTrue(recalled.collection_pin)
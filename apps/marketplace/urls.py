@@ -11,7 +11,8 @@ from apps.marketplace.views import (
     DelistListing,
     CollectRecalledListingView,
     StoreRecalledListingListView,
-    PublicStoreItemListingView
+    PublicStoreItemListingView,
+    BulkListingTransitionView,
 )
 
 
@@ -37,6 +38,11 @@ urlpatterns = [
         StoreRecalledListingListView.as_view(),
         name="store-recalled-listing-retrieve",
     ),
+    path(
+        "stores/me/listings/bulk-transition/",
+        BulkListingTransitionView.as_view(),
+        name="listing-bulk-transition",
+    ),
     path(
         "stores/me/listings/<int:id>/replace-tag/",
         ReplaceTagView.as_view(),
@@ -6,11 +6,14 @@ from rest_framework.exceptions import NotFound
 from rest_framework.views import APIView
 
 from apps.marketplace.serializers import (
+    BulkListingTransitionSerializer,
     CreateListingSerializer,
     CreateItemAndListingSerializer,
     ItemListingSerializer,
     RecallItemListingSerializer,
 )
+from apps.common.views import ImageVariantMixin
+from apps.items.constants import ItemImageVariant
 from apps.items.serializers import FlatItemSerializer
 from apps.marketplace.models import ItemListing, RecalledItemListing
 from apps.marketplace.services.listing_services import (
@@ -19,9 +22,9 @@ from apps.marketplace.services.listing_services import (
 from apps.marketplace.permissions import IsTagOwner, IsListingOwner
 from apps.members.permissions import IsMemberUser
 from apps.stores.permissions import IsStoreUser
-from apps.marketplace.models import RecallReason
 from apps.stores.models import Tag
 from apps.marketplace.services.listing_services import ItemListingService
+from apps.marketplace.services.listing_cache_services import ListingCacheService
 from apps.stores.services.tags_services import TagService
 from apps.marketplace.processors import (
     ItemListingRecallProcessor,
@@ -73,18 +76,37 @@ class CreateItemAndListingView(generics.CreateAPIView):
         )
 
 
-class ListingRetrieveView(generics.RetrieveAPIView):
+class ListingRetrieveView(ImageVariantMixin, generics.RetrieveAPIView):
     serializer_class = ItemListingSerializer
+    image_variant = ItemImageVariant.LARGE
+
+    def retrieve(self, request: Request, *args, **kwargs):
+        cached_listing = ListingCacheService.get_listing(self.kwargs.get(ID))
+        if cached_listing is None:
+            instance = self.get_object()
+            data = self.get_serializer(instance).data
+            if not isinstance(instance, ItemListing):
+                return Response(data)
+            data.pop(USER_LISTING_RELATION)
+            cached_listing = ListingCacheService.set_listing(instance, data)
+
+        data = {
+            **cached_listing[DATA],
+            USER_LISTING_RELATION: ItemListingService.get_user_relation(
+                request, cached_listing[STORE_USER_ID], cached_listing[OWNER_USER_ID]
+            ),
+        }
+        return Response(data)
 
     def get_object(self):
         tag_id = self.kwargs.get(ID)
-        listing = ItemListing.objects.filter(tag__id=tag_id).first()
+        listing = ItemListing.objects.with_details().filter(tag_id=tag_id).first()
         if listing:
             return listing
         else:
             try:
-                return Tag.objects.get(id=tag_id)
-            except Tag.DoesNotExist:
+                return TagService.get_tag(tag_id)
+            except serializers.ValidationError:
                 raise NotFound({DETAIL: "Tag does not exist."})
 
 
@@ -92,12 +114,11 @@ class ListingRoleCheckView(APIView):
     def get(self, request, *args, **kwargs):
         tag_id = self.kwargs.get(ID)
         try:
-            tag = TagService.get_tag(tag_id)
-            listing = ItemListing.objects.filter(tag__id=tag_id).first()
+            tag = ItemListingService.resolve_tag(tag_id)
 
-            if listing:
-                user_relation = ItemListingService.get_user_listing_relation(
-                    request, listing
+            if tag.listing_id:
+                user_relation = ItemListingService.get_user_relation(
+                    request, tag.store.user_id, tag.listing_owner_user_id
                 )
                 listing_exists = True
             else:
@@ -114,34 +135,45 @@ class ListingRoleCheckView(APIView):
             raise NotFound(detail=str(e.detail[0]))
 
 
-class StoreRecalledListingListView(generics.ListAPIView):
+class StoreRecalledListingListView(ImageVariantMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated, IsStoreUser]
     serializer_class = RecallItemListingSerializer
+    image_variant = ItemImageVariant.MEDIUM
 
     def get_queryset(self):
-        return RecalledItemListing.objects.filter(
-            tag__tag_group__store__user=self.request.user
+        return (
+            RecalledItemListing.objects.for_store_user(self.request.user)
+            .with_details()
+            .select_related("reason")
+            .order_by("-created_at")
         )
 
 
-class StoreItemListingListView(generics.ListAPIView):
+class StoreItemListingListView(ImageVariantMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated, IsStoreUser]
     serializer_class = ItemListingSerializer
+    image_variant = ItemImageVariant.MEDIUM
 
     def get_queryset(self):
-        return ItemListing.objects.filter(
-            tag__tag_group__store__user=self.request.user
+        return (
+            ItemListing.objects.for_store_user(self.request.user)
+            .with_details()
+            .order_by("-created_at")
         )
-    
 
-class PublicStoreItemListingView(generics.ListAPIView):
+
+class PublicStoreItemListingView(ImageVariantMixin, generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = ItemListingSerializer
+    image_variant = ItemImageVariant.MEDIUM
 
     def get_queryset(self):
-        store_id = self.kwargs.get(ID)
-        return ItemListing.objects.filter(tag__tag_group__store__id=store_id)
-        
+        store_id = self.kwargs.get(STORE_ID)
+        return (
+            ItemListing.objects.for_store(store_id)
+            .with_details()
+            .order_by("-created_at")
+        )
 
 
 class ReplaceTagView(generics.UpdateAPIView):
@@ -197,7 +229,7 @@ class RecallListingView(generics.UpdateAPIView):
         reason_id = request.data.get(REASON)
 
         try:
-            reason = RecallReason.objects.get(id=reason_id)
+            reason = ItemListingService.get_recall_reasons(reason_id)
         except Exception as e:
             return Response({DETAIL: str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -211,6 +243,20 @@ class RecallListingView(generics.UpdateAPIView):
         )
 
 
+class BulkListingTransitionView(generics.GenericAPIView):
+    permission_classes = [permissions.IsAuthenticated, IsStoreUser]
+    serializer_class = BulkListingTransitionSerializer
+
+    def post(self, request: Request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = serializer.save(store=request.user.store)
+        return Response(
+            {MESSAGE: "Bulk listing transition processed", DATA: results},
+            status=status.HTTP_200_OK,
+        )
+
+
 class GenerateNewCollectionPinView(generics.UpdateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsListingOwner]
     serializer_class = RecallItemListingSerializer
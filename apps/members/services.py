@@ -1,6 +1,10 @@
+import uuid
+
+from django.db import transaction
 from rest_framework import serializers
 
 from apps.common.s3.s3_utils import S3Service
+from apps.common.s3.s3_cleanup import S3CleanupService
 from apps.common.s3.s3_config import get_member_profile_photo_key
 from apps.members.models import MemberProfile
 from apps.members.models import MemberNotificationPreferences
@@ -31,8 +35,14 @@ class MemberService:
             )
 
     @staticmethod
+    @transaction.atomic
     def update_member_profile_photo(member: MemberProfile, file):
+        """
+        Uploads the photo under a new key and queues the previous photo for
+        deletion once the new URL is saved.
+        """
         image_url = MemberService.upload_profile_photo_to_s3(member, file)
+        MemberService.delete_profile_photo_in_s3(member)
         member = MemberService.save_profile_photo_url(member, image_url)
         return member
 
@@ -48,7 +58,7 @@ class MemberService:
     @staticmethod
     def upload_profile_photo_to_s3(member: MemberProfile, file):
         try:
-            key = get_member_profile_photo_key(member)
+            key = get_member_profile_photo_key(member, uuid.uuid4().hex)
             image_url = S3Service().upload_image(file, key)
             return image_url
         except Exception as e:
@@ -57,6 +67,7 @@ class MemberService:
             )
 
     @staticmethod
+    @transaction.atomic
     def delete_member_profile_photo(member: MemberProfile):
         MemberService.delete_profile_photo_in_s3(member)
         member = MemberService.delete_profile_photo_url(member)
@@ -65,8 +76,9 @@ class MemberService:
     @staticmethod
     def delete_profile_photo_in_s3(member: MemberProfile):
         try:
-            key = get_member_profile_photo_key(member)
-            S3Service().delete_image(key)
+            key = S3Service().get_key_from_s3_url(member.profile_photo_url)
+            if key:
+                S3CleanupService.queue_deletions([key])
         except Exception as e:
             raise serializers.ValidationError(
                 f"Failed to delete profile photo in s3: {e}"
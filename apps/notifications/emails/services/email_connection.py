@@ -0,0 +1,76 @@
+import smtplib
+import threading
+import time
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.message import EmailMessage
+
+# Errors that mean the connection went away, rather than a message problem.
+RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class EmailConnectionPool:
+    """
+    Keeps one open mail connection per worker thread, so SMTP connect, TLS
+    and login happen once rather than for every email. A connection idle for
+    longer than EMAIL_CONNECTION_MAX_IDLE is replaced before use, since
+    servers drop idle clients, and a dropped connection is reopened once
+    before a send is given up on.
+    """
+
+    _local = threading.local()
+
+    @staticmethod
+    def send_messages(messages: list[EmailMessage]):
+        """
+        Sends every message over the pooled connection. A failing message
+        does not stop the rest; the first error is raised once all have been
+        tried.
+        """
+        sent = 0
+        errors = []
+        for message in messages:
+            try:
+                sent += EmailConnectionPool._send(message)
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            raise errors[0]
+        return sent
+
+    @staticmethod
+    def close():
+        connection = getattr(EmailConnectionPool._local, "connection", None)
+        EmailConnectionPool._local.connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def get_connection():
+        local = EmailConnectionPool._local
+        idle = time.monotonic() - getattr(local, "last_used", 0)
+        if getattr(local, "connection", None) and idle > (
+            settings.EMAIL_CONNECTION_MAX_IDLE
+        ):
+            EmailConnectionPool.close()
+
+        if getattr(local, "connection", None) is None:
+            connection = get_connection(fail_silently=False)
+            connection.open()
+            local.connection = connection
+        return local.connection
+
+    @staticmethod
+    def _send(message: EmailMessage):
+        try:
+            sent = EmailConnectionPool.get_connection().send_messages([message])
+        except RECONNECT_ERRORS:
+            EmailConnectionPool.close()
+            sent = EmailConnectionPool.get_connection().send_messages([message])
+        EmailConnectionPool._local.last_used = time.monotonic()
+        return sent
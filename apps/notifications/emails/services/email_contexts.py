@@ -230,7 +230,7 @@ class SuppliesEmailContextGenerator:
 class OperationsEmailContextGenerator:
 
     @staticmethod
-    def generate_tag_images_context(tag_group: TagGroup):
+    def generate_tag_images_context(tag_group: TagGroup, download_url: str):
         store = tag_group.store
         email = store.user.email
         address = store.store_address
@@ -240,6 +240,7 @@ class OperationsEmailContextGenerator:
             STORE: store.store_name,
             EMAIL: email,
             ADDRESS: address,
+            DOWNLOAD_URL: download_url,
         }
 
     @staticmethod
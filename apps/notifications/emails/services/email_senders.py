@@ -170,7 +170,7 @@ class ListingEmailSender(ListingEmailContextGenerator):
         send_email(
             subject=f"Notice: Item Was Not Collected - {item}",
             to=recalled_listing.item.owner.email,
-            template_name=f"{NOTIFICATIONS}/member_item_abandoned_notification.html",
+            template_name=f"{NOTIFICATIONS}/item_abandoned_notification.html",
             context=context,
         )
 
@@ -183,7 +183,7 @@ class ListingEmailSender(ListingEmailContextGenerator):
         send_email(
             subject=f"Collection Reminder - {item}",
             to=recalled_listing.item.owner.email,
-            template_name=f"{REMINDERS}/member_collect_item_reminder.html",
+            template_name=f"{REMINDERS}/collect_item_reminder.html",
             context=context,
         )
 
@@ -216,14 +216,15 @@ class SuppliesEmailSender:
 
 class OperationsEmailSender:
     @staticmethod
-    def send_tag_images_email(tag_group: TagGroup, attachment):
-        context = OperationsEmailContextGenerator.generate_tag_images_context(tag_group)
+    def send_tag_images_email(tag_group: TagGroup, download_url: str):
+        context = OperationsEmailContextGenerator.generate_tag_images_context(
+            tag_group, download_url
+        )
         send_email(
             subject=f"Tag Images - Group {tag_group.id}",
             to=settings.OPERATIONS_EMAIL,
             template_name=f"{INTERNAL}/tag_images.html",
             context=context,
-            attachment=attachment,
         )
 
     @staticmethod
@@ -1,12 +1,20 @@
-from premailer import transform
-from celery import shared_task
+import threading
+from contextlib import contextmanager
 
+from celery import shared_task
 from django.conf import settings
-from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 
+from apps.common.models import OutboxMessage
+from apps.common.outbox import OutboxService
+from apps.notifications.emails.services.email_connection import EmailConnectionPool
+from apps.notifications.emails.services.email_renderer import EmailTemplateRenderer
+
+_batch = threading.local()
+# send_email's arguments, in order, as the retired email tasks took them.
+EMAIL_FIELDS = ("subject", "to", "template_name", "context", "from_email", "attachment")
+
 
 def send_email(
     subject: str,
@@ -18,7 +26,9 @@ def send_email(
 ):
     """
     Generic function to send emails using Django's built-in email backend.
-    This function now sends the email asynchronously using a Celery task.
+    The email is recorded in the outbox and delivered by a Celery worker
+    once the current transaction commits, so it is never sent for changes
+    that roll back.
 
     :param subject: Subject of the email.
     :param to: Recipient email address.
@@ -26,9 +36,64 @@ def send_email(
     :param context: Context to render the template with.
     :param from_email: Sender's email address. Defaults to settings.DEFAULT_FROM_EMAIL.
     """
-    send_email_task.delay(subject, to, template_name, context, from_email, attachment)
+    email = {
+        "subject": subject,
+        "to": to,
+        "template_name": template_name,
+        "context": context,
+        "from_email": from_email,
+        "attachment": attachment,
+    }
+    emails = getattr(_batch, "emails", None)
+    if emails is not None:
+        emails.append(email)
+        return
+
+    OutboxService.enqueue(OutboxMessage.Topics.EMAIL, [email])
+
+
+@contextmanager
+def email_batch():
+    """
+    Collects the emails sent inside the block and records them in the
+    outbox with one insert when it exits, so they are delivered together
+    over one connection.
+    """
+    if getattr(_batch, "emails", None) is not None:
+        # Already batching; the outer block sends these.
+        yield
+        return
 
+    _batch.emails = []
+    try:
+        yield
+        emails = _batch.emails
+    finally:
+        _batch.emails = None
 
+    if emails:
+        OutboxService.enqueue(OutboxMessage.Topics.EMAIL, emails)
+
+
+def deliver_outbox_emails(emails: list[dict]):
+    """
+    Outbox handler: sends a batch of emails over one pooled connection and
+    returns the positions of those that failed, so only they are retried.
+
+    :param emails: send_email arguments, one dict per email.
+    """
+    failed = []
+    for position, email in enumerate(emails):
+        try:
+            EmailConnectionPool.send_messages([build_email_message(**email)])
+        except Exception:
+            failed.append(position)
+    return failed
+
+
+# send_email_task and send_email_batch_task are no longer queued; emails go
+# through the outbox. They stay registered for one release so that tasks
+# already in the broker are moved to the outbox rather than rejected.
 @shared_task
 def send_email_task(
     subject: str,
@@ -38,37 +103,33 @@ def send_email_task(
     from_email=None,
     attachment=None,
 ):
-    """
-    Celery task to send emails using Django's built-in email backend.
+    email = dict(
+        zip(EMAIL_FIELDS, (subject, to, template_name, context, from_email, attachment))
+    )
+    OutboxService.enqueue(OutboxMessage.Topics.EMAIL, [email])
 
-    :param subject: Subject of the email.
-    :param to: Recipient email address.
-    :param template_name: Path to the email template.
-    :param context: Context to render the template with.
-    :param from_email: Sender's email address. Defaults to settings.DEFAULT_FROM_EMAIL.
-    """
 
-    # Load CSS from the static directory
-    css_path = staticfiles_storage.path("css/email_styles.css")
-    with open(css_path, "r") as css_file:
-        css_content = css_file.read().replace('"', "&quot;")
-
-    # Update context with CSS content and logo URL
-    if context is None:
-        context = {}
-    context.update(
-        {
-            "css": css_content,
-        }
+@shared_task
+def send_email_batch_task(emails: list):
+    """:param emails: send_email_task arguments, one list per email."""
+    OutboxService.enqueue(
+        OutboxMessage.Topics.EMAIL, [dict(zip(EMAIL_FIELDS, email)) for email in emails]
     )
 
-    # Render the email template with the context
-    html_message = render_to_string(template_name, context)
-    html_message = transform(html_message, remove_classes=False)
+
+def build_email_message(
+    subject: str,
+    to: str,
+    template_name: str,
+    context=None,
+    from_email=None,
+    attachment=None,
+):
+    # Templates are compiled with their CSS inlined once per process
+    html_message = EmailTemplateRenderer.render(template_name, context)
     plain_message = strip_tags(html_message)
     from_email = from_email or settings.DEFAULT_FROM_EMAIL
 
-    # Create and send the email
     email_message = EmailMultiAlternatives(
         subject=subject,
         body=plain_message,
@@ -81,4 +142,4 @@ def send_email_task(
         filename, file_content, mime_type = attachment
         email_message.attach(filename, file_content, mime_type)
 
-    email_message.send()
+    return email_message
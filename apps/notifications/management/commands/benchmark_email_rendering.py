@@ -0,0 +1,83 @@
+import time
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.utils.html import strip_tags
+from premailer import transform
+
+from apps.notifications.emails.services.email_renderer import (
+    EMAIL_CSS_PATH,
+    EMAIL_TEMPLATES_DIR,
+    EmailTemplateRenderer,
+)
+
+SAMPLE_CONTEXT = {
+    "logo_url": "https://tagandtake.com/logo.png",
+    "name": "Sam",
+    "item_name": "Denim jacket",
+    "store_name": "Corner Store",
+    "earnings": "12.50",
+    "pin": "1234",
+    "collection_pin": "9876",
+    "item_page_url": "https://tagandtake.com/listing/1",
+    "activation_url": "https://tagandtake.com/activate/abc",
+    "reset_url": "https://tagandtake.com/reset/abc",
+    "login_url": "https://tagandtake.com/login",
+    "download_url": "https://s3.amazonaws.com/tag_group_1.zip",
+    "purchased_supplies": [
+        {"name": "Tags", "quantity": 2, "price": "5.00", "total_price": "10.00"},
+        {"name": "Hangers", "quantity": 1, "price": "3.00", "total_price": "3.00"},
+    ],
+    "order_total": "13.00",
+    "current_year": 2024,
+}
+
+
+def render_with_premailer(template_name: str, context: dict):
+    """The per-send pipeline EmailTemplateRenderer replaced."""
+    with open(staticfiles_storage.path(EMAIL_CSS_PATH), "r") as css_file:
+        css = css_file.read().replace('"', "&quot;")
+    html = render_to_string(template_name, {**context, "css": css})
+    return transform(html, remove_classes=False)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare emails rendered per second by one worker process with "
+        "premailer run on every send versus precompiled templates. Rendering "
+        "only; nothing is sent."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--emails", type=int, default=500)
+
+    def handle(self, *args, **options):
+        template_names = [
+            path.relative_to(EMAIL_TEMPLATES_DIR).as_posix()
+            for path in sorted(EMAIL_TEMPLATES_DIR.rglob("*.html"))
+        ]
+        sends = [
+            template_names[i % len(template_names)] for i in range(options["emails"])
+        ]
+
+        # Compile up front, as the worker does on start.
+        started = time.perf_counter()
+        EmailTemplateRenderer.warm()
+        warm_seconds = time.perf_counter() - started
+
+        before = self.measure(render_with_premailer, sends)
+        after = self.measure(EmailTemplateRenderer.render, sends)
+
+        self.stdout.write(
+            f"{len(template_names)} templates compiled in {warm_seconds:.2f}s"
+        )
+        self.stdout.write(f"premailer per send: {before:>10.1f} emails/s")
+        self.stdout.write(f"precompiled:        {after:>10.1f} emails/s")
+        self.stdout.write(f"speedup:            {after / before:>10.1f}x")
+
+    def measure(self, render, sends: list[str]):
+        started = time.perf_counter()
+        for template_name in sends:
+            strip_tags(render(template_name, dict(SAMPLE_CONTEXT)))
+        return len(sends) / (time.perf_counter() - started)
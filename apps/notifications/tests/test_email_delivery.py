@@ -0,0 +1,114 @@
+import socketserver
+import threading
+
+from django.test import TestCase, override_settings
+
+from apps.common.models import OutboxMessage
+from apps.notifications.emails.services.email_connection import EmailConnectionPool
+from apps.notifications.emails.services.email_service import email_batch, send_email
+
+TEMPLATE_NAME = "action_triggered/member_item_sold.html"
+
+
+class SMTPStandInHandler(socketserver.StreamRequestHandler):
+    """Just enough of SMTP for Django's backend, without AUTH or STARTTLS."""
+
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.server.connections += 1
+        self.reply("220 localhost ESMTP stand-in")
+        while line := self.rfile.readline():
+            command = line.decode().strip().upper()
+            if command.startswith("EHLO"):
+                self.reply("250-localhost")
+                self.reply("250 8BITMIME")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                message = []
+                while (data := self.rfile.readline()) not in (b".\r\n", b""):
+                    message.append(data)
+                self.server.messages.append(b"".join(message))
+                self.reply("250 OK")
+                if self.server.drop_after_message:
+                    return
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPStandInHandler)
+        self.connections = 0
+        self.messages = []
+        self.drop_after_message = False
+
+
+class TestPooledEmailDelivery(TestCase):
+    def setUp(self):
+        # Drop any connection pooled by earlier tests under other settings.
+        EmailConnectionPool.close()
+        self.server = SMTPStandIn()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        settings_override = override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=self.server.server_address[1],
+            EMAIL_USE_TLS=False,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+            DEFAULT_FROM_EMAIL="noreply@tagandtake.com",
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(EmailConnectionPool.close)
+
+    def _send(self, count: int):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._queue(count)
+
+    def _queue(self, count: int):
+        for i in range(count):
+            send_email(
+                subject=f"Sold {i}",
+                to=f"member{i}@test.com",
+                template_name=TEMPLATE_NAME,
+                context={"item_name": f"Item {i}"},
+            )
+
+    def test_sends_reuse_one_connection(self):
+        self._send(3)
+
+        self.assertEqual(len(self.server.messages), 3)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_reconnects_when_the_server_drops_the_connection(self):
+        self.server.drop_after_message = True
+
+        self._send(2)
+
+        self.assertEqual(len(self.server.messages), 2)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_batch_is_delivered_together_when_the_block_exits(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with email_batch():
+                self._queue(3)
+                self.assertFalse(OutboxMessage.objects.exists())
+            self.assertEqual(OutboxMessage.objects.count(), 3)
+            self.assertEqual(self.server.messages, [])
+
+        self.assertEqual(len(self.server.messages), 3)
+        self.assertEqual(self.server.connections, 1)
+        self.assertIn(b"Item 2", self.server.messages[2])
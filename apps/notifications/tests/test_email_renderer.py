@@ -0,0 +1,44 @@
+import os
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.notifications.emails.services import email_renderer
+from apps.notifications.emails.services.email_renderer import (
+    EMAIL_TEMPLATES_DIR,
+    EmailTemplateRenderer,
+)
+from apps.notifications.management.commands.benchmark_email_rendering import (
+    SAMPLE_CONTEXT,
+    render_with_premailer,
+)
+
+
+class TestEmailTemplateRenderer(TestCase):
+    def test_matches_premailer_on_every_send(self):
+        for path in sorted(EMAIL_TEMPLATES_DIR.rglob("*.html")):
+            template_name = path.relative_to(EMAIL_TEMPLATES_DIR).as_posix()
+            with self.subTest(template_name):
+                self.assertEqual(
+                    EmailTemplateRenderer.render(template_name, dict(SAMPLE_CONTEXT)),
+                    render_with_premailer(template_name, dict(SAMPLE_CONTEXT)),
+                )
+
+    def test_compiles_once_until_the_template_changes(self):
+        template_name = "action_triggered/member_item_sold.html"
+        EmailTemplateRenderer.render(template_name)
+
+        with mock.patch.object(
+            email_renderer, "transform", wraps=email_renderer.transform
+        ) as transform:
+            EmailTemplateRenderer.render(template_name)
+            self.assertEqual(transform.call_count, 0)
+
+            compiled = EmailTemplateRenderer._compiled[template_name]
+            template_path = compiled.paths[0]
+            mtime = os.path.getmtime(template_path)
+            os.utime(template_path, (mtime, mtime + 1))
+            self.addCleanup(os.utime, template_path, (mtime, mtime))
+
+            EmailTemplateRenderer.render(template_name)
+            self.assertEqual(transform.call_count, 1)
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0002_item_images_ordering"),
+        ("members", "0001_initial"),
+        ("payments", "0007_itemcheckoutsession_checkout_status_checked_and_more"),
+        ("stores", "0003_tag_store"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="itemcheckoutsession",
+            index=models.Index(
+                condition=models.Q(("checkout_status_checked", False)),
+                fields=["created_at"],
+                name="checkout_unchecked_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="itempaymenttransaction",
+            index=models.Index(
+                condition=models.Q(("payment_status_checked", False)),
+                fields=["created_at"],
+                name="payment_unchecked_idx",
+            ),
+        ),
+    ]
@@ -73,6 +73,14 @@ class ItemCheckoutSession(BaseChekoutSession):
         verbose_name = "Item Checkout Session"
         verbose_name_plural = "Item Checkout Sessions"
         db_table = "item_checkout_sessions"
+        indexes = [
+            # Only the rows still waiting for the cleanup task are indexed.
+            models.Index(
+                fields=["created_at"],
+                name="checkout_unchecked_idx",
+                condition=models.Q(checkout_status_checked=False),
+            ),
+        ]
 
 
 class ItemPaymentTransaction(BasePaymentTransaction):
@@ -101,6 +109,14 @@ class ItemPaymentTransaction(BasePaymentTransaction):
         verbose_name = "Item Payment Transaction"
         verbose_name_plural = "Item Payment Transactions"
         db_table = "item_payment_transactions"
+        indexes = [
+            # Only the rows still waiting for the status update task are indexed.
+            models.Index(
+                fields=["created_at"],
+                name="payment_unchecked_idx",
+                condition=models.Q(payment_status_checked=False),
+            ),
+        ]
 
 
 class FailedItemPaymentTransaction(BaseFailedPaymentTransaction):
@@ -0,0 +1,7 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class TagRenderMode(models.TextChoices):
+    RASTER = "RASTER", _("PNG per tag, emailed as a zip")
+    VECTOR = "VECTOR", _("SVG per tag, emailed as a PDF of A4 sheets")
@@ -0,0 +1,74 @@
+import time
+import zipfile
+from io import BytesIO
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.common.constants import LISTING
+from apps.stores.constants import TagRenderMode
+from apps.stores.services.tag_sheets import (
+    TagSheetWriter,
+    get_tag_qr_matrix,
+    render_tag_svg,
+)
+from apps.stores.services.tags_services import render_tag_image
+
+
+class Command(BaseCommand):
+    help = (
+        "Render a tag group in both render modes and compare CPU time, the "
+        "size of the uploaded images and the size of the email attachment. "
+        "Uses synthetic tag ids; nothing is written to the database or S3."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tags", type=int, default=500)
+        parser.add_argument("--first-tag-id", type=int, default=100_000)
+
+    def handle(self, *args, **options):
+        first_id = options["first_tag_id"]
+        tag_ids = range(first_id, first_id + options["tags"])
+        urls = {
+            tag_id: f"{settings.FRONTEND_URL}/{LISTING}/{tag_id}" for tag_id in tag_ids
+        }
+
+        results = {
+            TagRenderMode.RASTER: self.measure(self.render_raster, urls),
+            TagRenderMode.VECTOR: self.measure(self.render_vector, urls),
+        }
+
+        self.stdout.write(
+            f"{'mode':<8}{'cpu s':>10}{'ms/tag':>10}{'uploads KiB':>14}"
+            f"{'attachment KiB':>17}"
+        )
+        for mode, (seconds, uploaded, attachment) in results.items():
+            self.stdout.write(
+                f"{mode:<8}{seconds:>10.2f}{seconds * 1000 / len(urls):>10.2f}"
+                f"{uploaded / 1024:>14.1f}{attachment / 1024:>17.1f}"
+            )
+
+    def measure(self, render, urls: dict[int, str]):
+        started = time.process_time()
+        uploads, attachment = render(urls)
+        seconds = time.process_time() - started
+        return seconds, sum(map(len, uploads.values())), len(attachment)
+
+    def render_raster(self, urls: dict[int, str]):
+        images = {tag_id: render_tag_image(url, tag_id) for tag_id, url in urls.items()}
+
+        zip_buffer = BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for tag_id, image in images.items():
+                zip_file.writestr(f"tag_{tag_id}.png", image)
+        return images, zip_buffer.getvalue()
+
+    def render_vector(self, urls: dict[int, str]):
+        svgs = {}
+        sheets = BytesIO()
+        with TagSheetWriter(sheets) as writer:
+            for tag_id, url in urls.items():
+                matrix = get_tag_qr_matrix(url)
+                svgs[tag_id] = render_tag_svg(matrix, tag_id)
+                writer.add_tag(matrix, tag_id)
+        return svgs, sheets.getvalue()
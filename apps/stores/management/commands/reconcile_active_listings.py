@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from apps.marketplace.models import ItemListing
+from apps.stores.models import StoreProfile
+from apps.common.constants import ACTIVE_LISTINGS_COUNT, COUNT, ID, STORE
+
+
+class Command(BaseCommand):
+    help = "Rebuild StoreProfile.active_listings_count from the item listings table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report stores whose counter has drifted without fixing them.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            # Lock the profiles so processors cannot move the counters while
+            # they are being rebuilt.
+            stores = list(
+                StoreProfile.objects.select_for_update().only(
+                    "id", "store_name", ACTIVE_LISTINGS_COUNT
+                )
+            )
+            actual_counts = dict(
+                ItemListing.objects.values(STORE)
+                .annotate(count=Count(ID))
+                .values_list(STORE, COUNT)
+            )
+
+            drifted = []
+            for store in stores:
+                actual = actual_counts.get(store.id, 0)
+                if store.active_listings_count != actual:
+                    self.stdout.write(
+                        f"{store.store_name}: stored {store.active_listings_count}, "
+                        f"actual {actual}"
+                    )
+                    store.active_listings_count = actual
+                    drifted.append(store)
+
+            if drifted and not options["dry_run"]:
+                StoreProfile.objects.bulk_update(drifted, [ACTIVE_LISTINGS_COUNT])
+
+        action = "Found" if options["dry_run"] else "Reconciled"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {len(drifted)} of {len(stores)} store listing counters"
+            )
+        )
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:49
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_active_listings_count(apps, schema_editor):
+    StoreProfile = apps.get_model("stores", "StoreProfile")
+    ItemListing = apps.get_model("marketplace", "ItemListing")
+
+    counts = (
+        ItemListing.objects.values("tag__tag_group__store")
+        .annotate(count=Count("id"))
+        .values_list("tag__tag_group__store", "count")
+    )
+    for store_id, count in counts:
+        StoreProfile.objects.filter(id=store_id).update(active_listings_count=count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stores", "0001_initial"),
+        ("marketplace", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="storeprofile",
+            name="active_listings_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_active_listings_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_tag_store(apps, schema_editor):
+    Tag = apps.get_model("stores", "Tag")
+    TagGroup = apps.get_model("stores", "TagGroup")
+
+    Tag.objects.update(
+        store_id=Subquery(
+            TagGroup.objects.filter(id=OuterRef("tag_group_id")).values("store_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stores", "0002_storeprofile_active_listings_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="store",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tags",
+                to="stores.storeprofile",
+            ),
+        ),
+        migrations.RunPython(backfill_tag_store, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="tag",
+            name="store",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tags",
+                to="stores.storeprofile",
+            ),
+        ),
+    ]
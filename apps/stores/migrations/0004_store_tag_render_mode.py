@@ -0,0 +1,25 @@
+# Generated by Django 5.0.4 on 2026-10-18 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stores", "0003_tag_store"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="storeprofile",
+            name="tag_render_mode",
+            field=models.CharField(
+                choices=[
+                    ("RASTER", "PNG per tag, emailed as a zip"),
+                    ("VECTOR", "SVG per tag, emailed as a PDF of A4 sheets"),
+                ],
+                default="RASTER",
+                max_length=10,
+            ),
+        ),
+    ]
@@ -13,8 +13,9 @@ from django.utils.translation import gettext_lazy as _
 from django.apps import apps
 
 from apps.items.models import ItemCategory, ItemCondition
+from apps.stores.constants import TagRenderMode
 from apps.stores.utils import generate_pin
-from apps.common.constants import STORE
+from apps.common.constants import STORE, ACTIVE_LISTINGS_COUNT
 
 
 User = get_user_model()
@@ -47,6 +48,8 @@ class StoreProfile(models.Model):
     min_listing_days = models.IntegerField(
         default=14, validators=[MinValueValidator(7)]
     )
+    # Maintained by the listing processors, see StoreService.
+    active_listings_count = models.PositiveIntegerField(default=0)
     min_price = models.DecimalField(
         default=0.00,
         max_digits=10,
@@ -54,21 +57,30 @@ class StoreProfile(models.Model):
         validators=[MinValueValidator(Decimal(0.00))],
     )
     currency = models.CharField(max_length=3, default="GBP", null=False)
+    # How purchased tag groups are rendered and emailed.
+    tag_render_mode = models.CharField(
+        max_length=10, choices=TagRenderMode.choices, default=TagRenderMode.RASTER
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "store_profiles"
 
+    def save(self, *args, **kwargs):
+        # The listings counter is only written through F() updates, so a
+        # stale instance must never overwrite it.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != ACTIVE_LISTINGS_COUNT
+            ]
+        super().save(*args, **kwargs)
+
     def validate_pin(self, pin):
         return self.pin == pin
 
-    @property
-    def active_listings_count(self):
-        from apps.marketplace.models import ItemListing
-
-        return ItemListing.objects.filter(tag__tag_group__store=self).count()
-
     @property
     def accepting_listings(self):
         return self.active_listings_count < self.stock_limit
@@ -223,6 +235,10 @@ class Tag(models.Model):
     tag_group = models.ForeignKey(
         TagGroup, on_delete=models.CASCADE, related_name="tags"
     )
+    # Denormalised from tag_group so store lookups skip the tag group join.
+    store = models.ForeignKey(
+        StoreProfile, on_delete=models.CASCADE, related_name="tags"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -231,7 +247,3 @@ class Tag(models.Model):
 
     def __str__(self):
         return f"Store: {self.store.store_name} - Tag: {self.id}"
-
-    @property
-    def store(self):
-        return self.tag_group.store
@@ -8,10 +8,14 @@ from apps.stores.models import (
     StoreItemCondition,
     StoreNotificationPreferences,
 )
-from apps.items.models import ItemCategory, ItemCondition
+from apps.items.reference_data import item_categories, item_conditions
 from apps.items.serializers import ItemCategorySerializer, ItemConditionSerializer
 from apps.common.constants import *
-from apps.stores.services.store_services import StoreService
+from apps.stores.services.store_services import (
+    StoreService,
+    StoreItemCategoryService,
+    StoreItemConditionService,
+)
 
 
 class StoreAddressSerializer(serializers.ModelSerializer):
@@ -61,6 +65,7 @@ class StoreProfileSerializer(serializers.ModelSerializer):
             REMAINING_STOCK,
             MIN_LISTING_DAYS,
             MIN_PRICE,
+            TAG_RENDER_MODE,
             OPENING_HOURS,
             STORE_ADDRESS,
             CREATED_AT,
@@ -88,21 +93,27 @@ class StoreItemCategorySerializer(serializers.ModelSerializer):
 
 
 class StoreItemCategoryBulkSerializer(serializers.ModelSerializer):
-    categories = serializers.ListField(
-        child=serializers.PrimaryKeyRelatedField(queryset=ItemCategory.objects.all())
-    )
+    categories = serializers.ListField(child=serializers.IntegerField())
 
     class Meta:
         model = StoreItemCategory
         fields = [ID, CATEGORIES]
 
+    def validate_categories(self, category_ids: list[int]):
+        invalid_ids = [
+            category_id
+            for category_id in category_ids
+            if item_categories.get(category_id) is None
+        ]
+        if invalid_ids:
+            raise serializers.ValidationError(f"Invalid category ids: {invalid_ids}")
+        return category_ids
+
     def create(self, validated_data):
         store = self.context[STORE]
-        categories = validated_data[CATEGORIES]
-        store_item_categories = [
-            StoreItemCategory(store=store, category=category) for category in categories
-        ]
-        return StoreItemCategory.objects.bulk_create(store_item_categories)
+        return StoreItemCategoryService.update_store_categories(
+            store, validated_data[CATEGORIES]
+        )
 
 
 class StoreItemConditionSerializer(serializers.ModelSerializer):
@@ -114,22 +125,27 @@ class StoreItemConditionSerializer(serializers.ModelSerializer):
 
 
 class StoreItemConditionUpdateSerializer(serializers.Serializer):
-    conditions = serializers.ListField(
-        child=serializers.PrimaryKeyRelatedField(queryset=ItemCondition.objects.all())
-    )
+    conditions = serializers.ListField(child=serializers.IntegerField())
 
     class Meta:
         model = StoreItemCondition
         fields = [ID, CONDITIONS]
 
+    def validate_conditions(self, condition_ids: list[int]):
+        invalid_ids = [
+            condition_id
+            for condition_id in condition_ids
+            if item_conditions.get(condition_id) is None
+        ]
+        if invalid_ids:
+            raise serializers.ValidationError(f"Invalid condition ids: {invalid_ids}")
+        return condition_ids
+
     def create(self, validated_data):
         store = self.context[STORE]
-        conditions = validated_data[CONDITIONS]
-        store_item_categories = [
-            StoreItemCondition(store=store, condition=condition)
-            for condition in conditions
-        ]
-        return StoreItemCondition.objects.bulk_create(store_item_categories)
+        return StoreItemConditionService.update_store_conditions(
+            store, validated_data[CONDITIONS]
+        )
 
 
 class StoreNotificationPreferencesSerializer(serializers.ModelSerializer):
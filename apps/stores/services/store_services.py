@@ -1,8 +1,15 @@
+import logging
+import uuid
+
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import CharField, F, Value
+from django.db.models.functions import Greatest
 
 from rest_framework import serializers
 
 from apps.common.s3.s3_utils import S3Service
+from apps.common.s3.s3_cleanup import S3CleanupService
 from apps.common.s3.s3_config import get_store_profile_photo_key
 from apps.accounts.models import User
 from apps.items.models import ItemCategory, ItemCondition
@@ -14,6 +21,21 @@ from apps.stores.models import (
     StoreNotificationPreferences,
 )
 from apps.stores.models import StoreProfile
+from apps.common.constants import (
+    STORE,
+    STOCK_LIMIT,
+    ACTIVE_LISTINGS_COUNT,
+    CATEGORY,
+    CONDITION,
+    CATEGORIES,
+    CONDITIONS,
+    ID,
+    TYPE,
+)
+
+logger = logging.getLogger(__name__)
+
+STORE_ACCEPTANCE_CACHE_TIMEOUT = 60 * 60
 
 
 class StoreService:
@@ -48,9 +70,29 @@ class StoreService:
             )
 
     @staticmethod
+    def create_store_opening_hours_bulk(
+        store: StoreProfile, opening_hours_data: list[dict]
+    ):
+        try:
+            return StoreOpeningHours.objects.bulk_create(
+                StoreOpeningHours(store=store, **opening_hours)
+                for opening_hours in opening_hours_data
+            )
+        except Exception as e:
+            raise serializers.ValidationError(
+                f"Failed to create store opening hours: {e}"
+            )
+
+    @staticmethod
+    @transaction.atomic
     def update_store_profile_photo(store: StoreProfile, file):
-        profile_photo_url = StoreService.upload_profile_photo_to_s3(store, file)
-        store = StoreService.save_profile_photo_url(store, profile_photo_url)
+        """
+        Uploads the photo under a new key and queues the previous photo for
+        deletion once the new URL is saved.
+        """
+        image_url = StoreService.upload_profile_photo_to_s3(store, file)
+        StoreService.delete_profile_photo_from_s3(store)
+        store = StoreService.save_profile_photo_url(store, image_url)
         return store
 
     @staticmethod
@@ -65,7 +107,7 @@ class StoreService:
     @staticmethod
     def upload_profile_photo_to_s3(store: StoreProfile, file):
         try:
-            key = get_store_profile_photo_key(store)
+            key = get_store_profile_photo_key(store, uuid.uuid4().hex)
             image_url = S3Service().upload_image(file, key)
             return image_url
         except Exception as e:
@@ -74,6 +116,7 @@ class StoreService:
             )
 
     @staticmethod
+    @transaction.atomic
     def delete_store_profile_photo(store: StoreProfile):
         StoreService.delete_profile_photo_from_s3(store)
         store = StoreService.delete_profile_photo_url(store)
@@ -93,13 +136,30 @@ class StoreService:
     @staticmethod
     def delete_profile_photo_from_s3(store: StoreProfile):
         try:
-            key = get_store_profile_photo_key(store)
-            S3Service().delete_image(key)
+            key = S3Service().get_key_from_s3_url(store.profile_photo_url)
+            if key:
+                S3CleanupService.queue_deletions([key])
         except Exception as e:
             raise serializers.ValidationError(
                 f"Failed to delete profile photo from s3: {e}"
             )
 
+    @staticmethod
+    def increment_active_listings(store: StoreProfile):
+        updated = StoreProfile.objects.filter(
+            pk=store.pk, active_listings_count__lt=F(STOCK_LIMIT)
+        ).update(active_listings_count=F(ACTIVE_LISTINGS_COUNT) + 1)
+        if not updated:
+            raise serializers.ValidationError(
+                {STORE: "Store is not currently accepting listings."}
+            )
+
+    @staticmethod
+    def decrement_active_listings(store: StoreProfile, count: int = 1):
+        StoreProfile.objects.filter(pk=store.pk, active_listings_count__gt=0).update(
+            active_listings_count=Greatest(F(ACTIVE_LISTINGS_COUNT) - count, 0)
+        )
+
     @staticmethod
     @transaction.atomic
     def initialize_store_defaults(store: StoreProfile):
@@ -108,26 +168,26 @@ class StoreService:
         StoreService.initialize_store_notifications(store)
 
     @staticmethod
-    @transaction.atomic
     def initialize_default_categories(store_profile: StoreProfile):
         try:
-            item_categories = ItemCategory.objects.all()
-            for category in item_categories:
-                StoreItemCategory.objects.create(store=store_profile, category=category)
+            category_ids = ItemCategory.objects.values_list(ID, flat=True)
+            StoreItemCategory.objects.bulk_create(
+                StoreItemCategory(store=store_profile, category_id=category_id)
+                for category_id in category_ids
+            )
         except Exception as e:
             raise serializers.ValidationError(
                 f"Failed to initialize default categories: {e}"
             )
 
     @staticmethod
-    @transaction.atomic
     def initialize_default_conditions(store_profile: StoreProfile):
         try:
-            item_conditions = ItemCondition.objects.all()
-            for condition in item_conditions:
-                StoreItemCondition.objects.create(
-                    store=store_profile, condition=condition
-                )
+            condition_ids = ItemCondition.objects.values_list(ID, flat=True)
+            StoreItemCondition.objects.bulk_create(
+                StoreItemCondition(store=store_profile, condition_id=condition_id)
+                for condition_id in condition_ids
+            )
         except Exception as e:
             raise serializers.ValidationError(
                 f"Failed to initialize default conditions: {e}"
@@ -166,9 +226,111 @@ class StoreItemCategoryService:
     @transaction.atomic
     def update_store_categories(store: StoreProfile, category_ids: list[int]):
         try:
-            categories = ItemCategory.objects.filter(id__in=category_ids)
-            store.preferred_categories.all().delete()
-            for category in categories:
-                StoreItemCategory.objects.create(store=store, category=category)
+            StorePreferenceService.sync_preferences(
+                store, StoreItemCategory, CATEGORY, category_ids
+            )
+            return store.preferred_categories.select_related(CATEGORY)
         except Exception as e:
             raise serializers.ValidationError(f"Failed to update store categories: {e}")
+
+
+class StoreItemConditionService:
+    @staticmethod
+    def get_store_conditions(store: StoreProfile):
+        return store.preferred_conditions.all()
+
+    @staticmethod
+    @transaction.atomic
+    def update_store_conditions(store: StoreProfile, condition_ids: list[int]):
+        try:
+            StorePreferenceService.sync_preferences(
+                store, StoreItemCondition, CONDITION, condition_ids
+            )
+            return store.preferred_conditions.select_related(CONDITION)
+        except Exception as e:
+            raise serializers.ValidationError(f"Failed to update store conditions: {e}")
+
+
+class StorePreferenceService:
+    @staticmethod
+    def sync_preferences(store: StoreProfile, model, field: str, ids: list[int]):
+        """
+        Brings a store's category or condition preference rows in line with
+        ids, deleting and inserting only the rows that changed.
+        """
+        id_field = f"{field}_id"
+        preferences = model.objects.filter(store=store)
+        existing_ids = set(preferences.values_list(id_field, flat=True))
+        new_ids = set(ids)
+
+        removed_ids = existing_ids - new_ids
+        added_ids = new_ids - existing_ids
+
+        if removed_ids:
+            preferences.filter(**{f"{id_field}__in": removed_ids}).delete()
+        if added_ids:
+            model.objects.bulk_create(
+                model(store=store, **{id_field: added_id}) for added_id in added_ids
+            )
+        if removed_ids or added_ids:
+            StoreAcceptanceService.invalidate(store.id)
+
+
+class StoreAcceptanceService:
+    """
+    The category and condition ids a store accepts, read with a single query
+    and cached until the store changes its preferences. The cache is best
+    effort: if it is unavailable, the ids are read from the database.
+    """
+
+    @staticmethod
+    def get_key(store_id: int):
+        return f"store:{store_id}:acceptance"
+
+    @staticmethod
+    def get_accepted_ids(store_id: int):
+        key = StoreAcceptanceService.get_key(store_id)
+        try:
+            accepted_ids = cache.get(key)
+        except Exception:
+            logger.exception(
+                "Failed to read store %s acceptance from the cache", store_id
+            )
+            accepted_ids = None
+        if accepted_ids is not None:
+            return accepted_ids
+
+        accepted_ids = StoreAcceptanceService.load_accepted_ids(store_id)
+        try:
+            cache.set(key, accepted_ids, STORE_ACCEPTANCE_CACHE_TIMEOUT)
+        except Exception:
+            logger.exception("Failed to cache store %s acceptance", store_id)
+        return accepted_ids
+
+    @staticmethod
+    def load_accepted_ids(store_id: int):
+        categories = (
+            StoreItemCategory.objects.filter(store_id=store_id)
+            .annotate(type=Value(CATEGORY, output_field=CharField()))
+            .values_list(TYPE, "category_id")
+        )
+        conditions = (
+            StoreItemCondition.objects.filter(store_id=store_id)
+            .annotate(type=Value(CONDITION, output_field=CharField()))
+            .values_list(TYPE, "condition_id")
+        )
+
+        accepted_ids = {CATEGORIES: set(), CONDITIONS: set()}
+        for row_type, row_id in categories.union(conditions, all=True):
+            if row_type == CATEGORY:
+                accepted_ids[CATEGORIES].add(row_id)
+            else:
+                accepted_ids[CONDITIONS].add(row_id)
+        return accepted_ids
+
+    @staticmethod
+    def invalidate(store_id: int):
+        key = StoreAcceptanceService.get_key(store_id)
+        # A failed delete must not fail the committed change; the entry
+        # expires after STORE_ACCEPTANCE_CACHE_TIMEOUT.
+        transaction.on_commit(lambda: cache.delete(key), robust=True)
@@ -0,0 +1,224 @@
+import zlib
+from typing import BinaryIO
+
+import qrcode
+
+TAG_QR_VERSION = 2
+TAG_QR_BORDER = 4
+# The raster tags use 10px modules and a 30px caption strip.
+TAG_SVG_MODULE_SIZE = 10
+TAG_SVG_CAPTION_MODULES = 3
+
+# A4 in points, laid out as a grid of tags.
+SHEET_WIDTH = 595
+SHEET_HEIGHT = 842
+SHEET_MARGIN = 36
+SHEET_COLUMNS = 4
+SHEET_ROWS = 5
+SHEET_CAPTION_HEIGHT = 16
+SHEET_CAPTION_FONT_SIZE = 10
+
+# Advance widths of Helvetica-Bold (1/1000 em), used to centre captions.
+HELVETICA_BOLD_WIDTHS = {
+    **dict.fromkeys("0123456789", 556),
+    "T": 611,
+    "A": 722,
+    "G": 778,
+    ":": 333,
+    " ": 278,
+}
+
+
+def get_tag_qr_matrix(url: str):
+    qr = qrcode.QRCode(version=TAG_QR_VERSION, border=TAG_QR_BORDER)
+    qr.add_data(url)
+    qr.make(fit=True)
+    return qr.get_matrix()
+
+
+def get_dark_runs(matrix: list[list[bool]]):
+    """
+    Yields (x, y, length) for every horizontal run of dark modules, so a QR
+    code is drawn as a few hundred rectangles instead of one per module.
+    """
+    for y, row in enumerate(matrix):
+        x = 0
+        while x < len(row):
+            if not row[x]:
+                x += 1
+                continue
+            start = x
+            while x < len(row) and row[x]:
+                x += 1
+            yield start, y, x - start
+
+
+def get_tag_caption(tag_id: int):
+    return f"TAG: {tag_id}"
+
+
+def render_tag_svg(matrix: list[list[bool]], tag_id: int):
+    """
+    Renders a tag as SVG bytes with the same proportions as the PNG tag.
+    """
+    size = len(matrix)
+    height = size + TAG_SVG_CAPTION_MODULES
+    path = "".join(
+        f"M{x} {y}h{length}v1h-{length}z" for x, y, length in get_dark_runs(matrix)
+    )
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{size * TAG_SVG_MODULE_SIZE}" '
+        f'height="{height * TAG_SVG_MODULE_SIZE}" '
+        f'viewBox="0 0 {size} {height}" shape-rendering="crispEdges">'
+        f'<rect width="{size}" height="{height}" fill="#fff"/>'
+        f'<path d="{path}" fill="#000"/>'
+        f'<text x="{size / 2:g}" y="{size - 0.2:g}" font-size="2.4" '
+        'font-family="Nunito, Helvetica, Arial, sans-serif" font-weight="bold" '
+        f'text-anchor="middle">{get_tag_caption(tag_id)}</text>'
+        "</svg>"
+    ).encode()
+
+
+class TagSheetWriter:
+    """
+    Streams a PDF of tags laid out on A4 sheets. QR codes are drawn as vector
+    rectangles and each page is written out as soon as it fills up, so memory
+    use does not grow with the size of the group.
+
+        with TagSheetWriter(stream) as writer:
+            for tag in tags:
+                writer.add_tag(matrix, tag.id)
+    """
+
+    CATALOG_ID = 1
+    PAGES_ID = 2
+    FONT_ID = 3
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.position = 0
+        self.offsets = {}
+        self.page_ids = []
+        self.next_id = self.FONT_ID + 1
+        self.page_operations = []
+        self.page_tag_count = 0
+
+        cell_width = (SHEET_WIDTH - 2 * SHEET_MARGIN) / SHEET_COLUMNS
+        self.cell_height = (SHEET_HEIGHT - 2 * SHEET_MARGIN) / SHEET_ROWS
+        self.cell_width = cell_width
+        self.qr_size = min(cell_width, self.cell_height - SHEET_CAPTION_HEIGHT)
+
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._write_object(
+            self.CATALOG_ID, f"<< /Type /Catalog /Pages {self.PAGES_ID} 0 R >>"
+        )
+        self._write_object(
+            self.FONT_ID,
+            "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold "
+            "/Encoding /WinAnsiEncoding >>",
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    @property
+    def tags_per_page(self):
+        return SHEET_COLUMNS * SHEET_ROWS
+
+    def add_tag(self, matrix: list[list[bool]], tag_id: int):
+        column = self.page_tag_count % SHEET_COLUMNS
+        row = self.page_tag_count // SHEET_COLUMNS
+        left = SHEET_MARGIN + column * self.cell_width
+        top = SHEET_HEIGHT - SHEET_MARGIN - row * self.cell_height
+        module = self.qr_size / len(matrix)
+        qr_left = left + (self.cell_width - self.qr_size) / 2
+
+        # Draw in module units with the y axis pointing down, like the matrix.
+        operations = [f"q {module:.4f} 0 0 {-module:.4f} {qr_left:.2f} {top:.2f} cm"]
+        operations.extend(
+            f"{x} {y} {length} 1 re" for x, y, length in get_dark_runs(matrix)
+        )
+        operations.append("f Q")
+
+        caption = get_tag_caption(tag_id)
+        caption_width = (
+            sum(HELVETICA_BOLD_WIDTHS.get(char, 556) for char in caption)
+            * SHEET_CAPTION_FONT_SIZE
+            / 1000
+        )
+        caption_x = left + (self.cell_width - caption_width) / 2
+        caption_y = top - self.qr_size - SHEET_CAPTION_FONT_SIZE
+        operations.append(
+            f"BT /F1 {SHEET_CAPTION_FONT_SIZE} Tf {caption_x:.2f} {caption_y:.2f} Td "
+            f"({caption}) Tj ET"
+        )
+
+        self.page_operations.extend(operations)
+        self.page_tag_count += 1
+        if self.page_tag_count == self.tags_per_page:
+            self._flush_page()
+
+    def close(self):
+        if self.page_tag_count or not self.page_ids:
+            self._flush_page()
+
+        kids = " ".join(f"{page_id} 0 R" for page_id in self.page_ids)
+        self._write_object(
+            self.PAGES_ID,
+            f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>",
+        )
+
+        xref_position = self.position
+        object_count = self.next_id
+        entries = ["xref", f"0 {object_count}", "0000000000 65535 f "]
+        entries.extend(
+            f"{self.offsets[object_id]:010d} 00000 n "
+            for object_id in range(1, object_count)
+        )
+        self._write(("\n".join(entries) + "\n").encode())
+        self._write(
+            f"trailer\n<< /Size {object_count} /Root {self.CATALOG_ID} 0 R >>\n"
+            f"startxref\n{xref_position}\n%%EOF\n".encode()
+        )
+
+    def _flush_page(self):
+        content = zlib.compress("\n".join(self.page_operations).encode())
+        content_id = self._reserve_id()
+        page_id = self._reserve_id()
+
+        self._write_object(
+            content_id,
+            f"<< /Length {len(content)} /Filter /FlateDecode >>\nstream\n".encode()
+            + content
+            + b"\nendstream",
+        )
+        self._write_object(
+            page_id,
+            f"<< /Type /Page /Parent {self.PAGES_ID} 0 R "
+            f"/MediaBox [0 0 {SHEET_WIDTH} {SHEET_HEIGHT}] "
+            f"/Resources << /Font << /F1 {self.FONT_ID} 0 R >> >> "
+            f"/Contents {content_id} 0 R >>",
+        )
+        self.page_ids.append(page_id)
+        self.page_operations = []
+        self.page_tag_count = 0
+
+    def _reserve_id(self):
+        object_id = self.next_id
+        self.next_id += 1
+        return object_id
+
+    def _write_object(self, object_id: int, body: str | bytes):
+        if isinstance(body, str):
+            body = body.encode()
+        self.offsets[object_id] = self.position
+        self._write(f"{object_id} 0 obj\n".encode() + body + b"\nendobj\n")
+
+    def _write(self, data: bytes):
+        self.stream.write(data)
+        self.position += len(data)
@@ -1,4 +1,8 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from PIL import Image, ImageFont, ImageDraw
+import multiprocessing
+import os
 import qrcode
 from io import BytesIO
 import zipfile
@@ -13,34 +17,103 @@ from apps.accounts.models import User
 from apps.stores.models import Tag, TagGroup, StoreProfile
 from apps.common.constants import LISTING
 from apps.common.s3.s3_utils import S3Service
-from apps.common.s3.s3_config import get_tag_image_key
+from apps.common.s3.s3_cleanup import S3CleanupService
+from apps.common.s3.s3_config import (
+    PDF_FILE_TYPE,
+    TAG_ARCHIVE_URL_EXPIRATION,
+    ZIP_FILE_TYPE,
+    get_tag_group_archive_key,
+    get_tag_image_key,
+    get_tag_vector_image_key,
+)
 from apps.common.constants import LISTING
 from apps.notifications.emails.services.email_senders import OperationsEmailSender
 from apps.marketplace.services.listing_services import ItemListingService
-from apps.common.constants import LISTING_ROLE
+from apps.common.constants import LISTING_ROLE, STORE
 from apps.marketplace.constants import ListingRole
+from apps.stores.services.tag_sheets import (
+    TagSheetWriter,
+    get_tag_qr_matrix,
+    render_tag_svg,
+)
+
+TAG_FONT_SIZE = 24
+# Groups smaller than this are rendered in-process; a pool costs more to start.
+TAG_RENDER_POOL_THRESHOLD = 16
+TAG_RENDER_MAX_WORKERS = os.cpu_count() or 1
+TAG_UPLOAD_MAX_WORKERS = 8
+# Tags rendered, uploaded and archived per step; bounds worker memory.
+TAG_RENDER_BATCH_SIZE = 100
+
+
+@lru_cache(maxsize=None)
+def get_tag_font():
+    return ImageFont.truetype(settings.TAG_FONT, TAG_FONT_SIZE)
+
+
+def render_tag_image(url: str, tag_id: int):
+    """
+    Renders the QR code and caption for a tag as PNG bytes. Module level so
+    it can be shipped to a process pool.
+    """
+    qr = qrcode.QRCode(version=2, box_size=10, border=4)
+    qr.add_data(url)
+    qr.make(fit=True)
+
+    qr_img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
+
+    img_width, img_height = qr_img.size
+    total_height = img_height + 30  # Extra space below the QR code for the tag ID
+
+    new_img = Image.new("RGB", (img_width, total_height), "white")
+    new_img.paste(qr_img, (0, 0))
+
+    draw = ImageDraw.Draw(new_img)
+    tag_text = "TAG: " + str(tag_id)
+    font = get_tag_font()
+
+    # Calculate text position
+    bbox = draw.textbbox((0, 0), tag_text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    x_position = (img_width - text_width) // 2
+    y_position = total_height - text_height - 32
+
+    # Draw the text using the Nunito-Bold font
+    draw.text(
+        (x_position, y_position), tag_text, fill="black", align="center", font=font
+    )
+
+    img_io = BytesIO()
+    new_img.save(img_io, format="PNG")
+    return img_io.getvalue()
+
+
+def _render_tag_image_args(args: tuple[str, int]):
+    return render_tag_image(*args)
 
 
 class TagService:
     @staticmethod
     def get_tag(tag_id: int):
         try:
-            return Tag.objects.get(id=tag_id)
+            return Tag.objects.select_related(STORE).get(id=tag_id)
         except Tag.DoesNotExist:
             raise serializers.ValidationError("Tag does not exist.")
 
     @staticmethod
     def get_user_tag_relation(request: Request, tag: Tag):
-        if request.user == tag.tag_group.store.user:
+        if request.user.id == tag.store.user_id:
             return ListingRole.HOST
-        elif request.user.role == User.Roles.STORE:
+        elif getattr(request.user, "role", None) == User.Roles.STORE:
             return ListingRole.OWNER
         else:
             return ListingRole.VIEWER
 
     @staticmethod
     def create_tag(tag_group: TagGroup):
-        tag = Tag.objects.create(tag_group=tag_group)
+        tag = Tag.objects.create(tag_group=tag_group, store_id=tag_group.store_id)
         return tag
 
     @staticmethod
@@ -51,9 +124,17 @@ class TagService:
     @transaction.atomic
     @staticmethod
     def generate_tags_for_group(tag_group: TagGroup):
-        Tag.objects.filter(tag_group=tag_group).delete()
-        tags = [TagService.create_tag(tag_group) for _ in range(tag_group.group_size)]
-        return tags
+        tags = Tag.objects.filter(tag_group=tag_group)
+        S3CleanupService.queue_deletions(
+            key
+            for tag in tags.only("id", "store_id", "tag_group_id")
+            for key in (get_tag_image_key(tag), get_tag_vector_image_key(tag))
+        )
+        tags.delete()
+        return Tag.objects.bulk_create(
+            Tag(tag_group=tag_group, store_id=tag_group.store_id)
+            for _ in range(tag_group.group_size)
+        )
 
     @staticmethod
     def upload_tag_image(tag: Tag, tag_image):
@@ -66,74 +147,114 @@ class TagService:
 
     @staticmethod
     def generate_tag_image(url: str, tag_id: int):
-        # Generate QR code
-        qr = qrcode.QRCode(version=2, box_size=10, border=4)
-        qr.add_data(url)
-        qr.make(fit=True)
+        return BytesIO(render_tag_image(url, tag_id))
 
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
-
-        img_width, img_height = qr_img.size
-        total_height = img_height + 30  # Extra space below the QR code for the tag ID
+    @staticmethod
+    def iter_tag_group_images(tags: list[Tag], use_pool: bool = False):
+        """
+        Renders every tag's image once. Yields the PNG bytes keyed by tag
+        id, one batch at a time, so callers can upload and archive a batch
+        before the next is rendered. With use_pool, large groups are spread
+        across a process pool; only the render_tag_group task opts in, so
+        nothing forks from a web worker.
+        """
+        jobs = [(TagService.get_listing_url(tag), tag.id) for tag in tags]
+        batches = [
+            jobs[start : start + TAG_RENDER_BATCH_SIZE]
+            for start in range(0, len(jobs), TAG_RENDER_BATCH_SIZE)
+        ]
 
-        new_img = Image.new("RGB", (img_width, total_height), "white")
-        new_img.paste(qr_img, (0, 0))
+        # Daemonic processes (e.g. Celery prefork workers) cannot start a pool.
+        if (
+            not use_pool
+            or len(jobs) < TAG_RENDER_POOL_THRESHOLD
+            or TAG_RENDER_MAX_WORKERS < 2
+            or multiprocessing.current_process().daemon
+        ):
+            for batch in batches:
+                images = map(_render_tag_image_args, batch)
+                yield {tag_id: image for (_, tag_id), image in zip(batch, images)}
+            return
 
-        draw = ImageDraw.Draw(new_img)
-        tag_text = "TAG: " + str(tag_id)
+        with ProcessPoolExecutor(max_workers=TAG_RENDER_MAX_WORKERS) as executor:
+            for batch in batches:
+                chunksize = max(1, len(batch) // (TAG_RENDER_MAX_WORKERS * 4))
+                images = executor.map(
+                    _render_tag_image_args, batch, chunksize=chunksize
+                )
+                yield {tag_id: image for (_, tag_id), image in zip(batch, images)}
 
-        font_size = 24
-        font = ImageFont.truetype(settings.TAG_FONT, font_size)
+    @staticmethod
+    def render_tag_group_images(tags: list[Tag], use_pool: bool = False):
+        images = {}
+        for batch in TagService.iter_tag_group_images(tags, use_pool):
+            images.update(batch)
+        return images
 
-        # Calculate text position
-        bbox = draw.textbbox((0, 0), tag_text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+    @staticmethod
+    def upload_tag_group_images(
+        tags: list[Tag], images: dict[int, bytes], get_key=get_tag_image_key
+    ):
+        s3_service = S3Service()
 
-        x_position = (img_width - text_width) // 2
-        y_position = total_height - text_height - 32
+        def upload(tag: Tag):
+            s3_service.upload_image(BytesIO(images[tag.id]), get_key(tag))
 
-        # Draw the text using the Nunito-Bold font
-        draw.text(
-            (x_position, y_position), tag_text, fill="black", align="center", font=font
-        )
+        with ThreadPoolExecutor(max_workers=TAG_UPLOAD_MAX_WORKERS) as executor:
+            # Consume the results so the first failed upload is raised.
+            list(executor.map(upload, tags))
 
-        # Save the image to a BytesIO object
-        img_io = BytesIO()
-        new_img.save(img_io, format="PNG")
-        img_io.seek(0)
+    @staticmethod
+    def create_and_upload_tag_group_images(tag_group: TagGroup, use_pool: bool = False):
+        """
+        Uploads a PNG per tag and streams a zip of all of them to S3, batch
+        by batch, so memory does not grow with the group. Returns the zip's
+        key.
+        """
+        tags = list(tag_group.tags.all())
+        tags_by_id = {tag.id: tag for tag in tags}
+        key = get_tag_group_archive_key(tag_group, ZIP_FILE_TYPE)
 
-        return img_io
+        with S3Service().open_multipart_upload(key, "application/zip") as archive:
+            with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                for images in TagService.iter_tag_group_images(tags, use_pool):
+                    batch = [tags_by_id[tag_id] for tag_id in images]
+                    TagService.upload_tag_group_images(batch, images)
+                    for tag_id, tag_image in images.items():
+                        zip_file.writestr(f"tag_{tag_id}.png", tag_image)
+        return key
 
     @staticmethod
-    def create_and_upload_tag_group_images(tag_group: TagGroup):
-        tags = tag_group.tags.all()
-        for tag in tags:
-            listing_url = TagService.get_listing_url(tag)
-            tag_image = TagService.generate_tag_image(listing_url, tag.id)
-            TagService.upload_tag_image(tag, tag_image)
+    def create_and_upload_tag_group_sheets(tag_group: TagGroup):
+        """
+        Vector counterpart of create_and_upload_tag_group_images: uploads an
+        SVG per tag and streams every tag, packed onto A4 sheets, to S3 as one
+        PDF. Returns the PDF's key.
+        """
+        tags = list(tag_group.tags.all())
+        key = get_tag_group_archive_key(tag_group, PDF_FILE_TYPE)
 
-    @staticmethod
-    def generate_tag_group_images_zipfile(tag_group):
-        tags = tag_group.tags.all()
-        zip_buffer = BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            for tag in tags:
-                listing_url = TagService.get_listing_url(tag)
-                tag_image = TagService.generate_tag_image(listing_url, tag.id)
-                filename = f"tag_{tag.id}.png"
-                zip_file.writestr(filename, tag_image.read())
-        zip_buffer.seek(0)
-        return zip_buffer
+        with S3Service().open_multipart_upload(key, "application/pdf") as sheets:
+            with TagSheetWriter(sheets) as writer:
+                for start in range(0, len(tags), TAG_RENDER_BATCH_SIZE):
+                    batch = tags[start : start + TAG_RENDER_BATCH_SIZE]
+                    svgs = {}
+                    for tag in batch:
+                        matrix = get_tag_qr_matrix(TagService.get_listing_url(tag))
+                        svgs[tag.id] = render_tag_svg(matrix, tag.id)
+                        writer.add_tag(matrix, tag.id)
+                    TagService.upload_tag_group_images(
+                        batch, svgs, get_tag_vector_image_key
+                    )
+        return key
 
     @staticmethod
-    def send_tag_images_email(tag_group):
-        zip_file = TagService.generate_tag_group_images_zipfile(tag_group)
-
-        attachment = (
-            f"tag_images_{tag_group.id}.zip",
-            zip_file.read(),
-            "application/zip",
+    def send_tag_images_email(tag_group: TagGroup, key: str):
+        """
+        Emails operations a link to the group's archive rather than attaching
+        it, so the Celery payload stays small whatever the group size.
+        """
+        download_url = S3Service().generate_presigned_url(
+            key, TAG_ARCHIVE_URL_EXPIRATION
         )
-
-        OperationsEmailSender.send_tag_images_email(tag_group, attachment)
+        OperationsEmailSender.send_tag_images_email(tag_group, download_url)
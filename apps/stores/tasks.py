@@ -0,0 +1,20 @@
+from celery import shared_task
+
+from apps.stores.constants import TagRenderMode
+from apps.stores.models import TagGroup
+from apps.stores.services.tags_services import TagService
+
+
+@shared_task
+def render_tag_group(tag_group_id: int, render_mode: str = TagRenderMode.RASTER):
+    """
+    Renders, uploads and emails a purchased tag group. Routed to the
+    tag_rendering queue, whose worker runs the solo pool: its process is not
+    daemonic, so large groups can be rendered across a process pool.
+    """
+    tag_group = TagGroup.objects.get(id=tag_group_id)
+    if render_mode == TagRenderMode.VECTOR:
+        key = TagService.create_and_upload_tag_group_sheets(tag_group)
+    else:
+        key = TagService.create_and_upload_tag_group_images(tag_group, use_pool=True)
+    TagService.send_tag_images_email(tag_group, key)
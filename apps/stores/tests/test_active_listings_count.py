@@ -0,0 +1,76 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework import serializers
+
+from apps.marketplace.models import RecallReason
+from apps.marketplace.processors import (
+    ItemListingCreateProcessor,
+    ItemListingRecallProcessor,
+)
+from apps.marketplace.tests.factories import (
+    create_category,
+    create_condition,
+    create_item,
+    create_listing,
+    create_member,
+    create_store,
+    create_tags,
+)
+from apps.stores.models import StoreProfile
+
+
+class TestActiveListingsCount(TestCase):
+    def setUp(self):
+        self.store = create_store(stock_limit=2)
+        self.member = create_member()
+        self.category = create_category()
+        self.condition = create_condition()
+        self.tags = create_tags(self.store, 3)
+
+    def _new_item(self):
+        return create_item(self.member, self.category, self.condition)
+
+    def _stored_count(self):
+        return StoreProfile.objects.get(id=self.store.id).active_listings_count
+
+    def test_create_and_recall_processors_maintain_counter(self):
+        listing = ItemListingCreateProcessor(self._new_item(), self.tags[0]).process()
+        ItemListingCreateProcessor(self._new_item(), self.tags[1]).process()
+        self.assertEqual(self._stored_count(), 2)
+
+        reason = RecallReason.objects.create(
+            reason="Damaged", type=RecallReason.Type.ISSUE, description="Damaged"
+        )
+        ItemListingRecallProcessor(listing, reason).process()
+        self.assertEqual(self._stored_count(), 1)
+
+    def test_create_processor_rejects_listing_over_stock_limit(self):
+        ItemListingCreateProcessor(self._new_item(), self.tags[0]).process()
+        ItemListingCreateProcessor(self._new_item(), self.tags[1]).process()
+
+        with self.assertRaises(serializers.ValidationError):
+            ItemListingCreateProcessor(self._new_item(), self.tags[2]).process()
+        self.assertEqual(self._stored_count(), 2)
+
+    def test_saving_stale_profile_keeps_counter(self):
+        stale_store = StoreProfile.objects.get(id=self.store.id)
+        ItemListingCreateProcessor(self._new_item(), self.tags[0]).process()
+
+        stale_store.store_bio = "Updated bio"
+        stale_store.save()
+
+        self.assertEqual(self._stored_count(), 1)
+
+    def test_reconcile_command_rebuilds_drifted_counters(self):
+        create_listing(self._new_item(), self.tags[0])
+        create_listing(self._new_item(), self.tags[1])
+
+        out = StringIO()
+        call_command("reconcile_active_listings", "--dry-run", stdout=out)
+        self.assertEqual(self._stored_count(), 0)
+        self.assertIn("Found 1 of 1", out.getvalue())
+
+        call_command("reconcile_active_listings", stdout=StringIO())
+        self.assertEqual(self._stored_count(), 2)
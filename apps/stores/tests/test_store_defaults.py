@@ -0,0 +1,78 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.items.models import ItemCategory, ItemCondition
+from apps.marketplace.tests.factories import create_store
+from apps.stores.models import StoreItemCategory, StoreOpeningHours, StoreProfile
+from apps.stores.services.store_services import StoreItemCategoryService
+
+DAYS = StoreOpeningHours.DaysOfWeek.values
+
+
+class TestStoreDefaults(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def _add_reference_data(self, count: int):
+        ItemCategory.objects.bulk_create(
+            ItemCategory(name=f"Category {i}") for i in range(count)
+        )
+        ItemCondition.objects.bulk_create(
+            ItemCondition(condition=f"Condition {i}") for i in range(count)
+        )
+
+    def _sign_up(self, username: str):
+        payload = {
+            "username": username,
+            "email": f"{username}@test.com",
+            "password": "a-Strong-passw0rd",
+            "password2": "a-Strong-passw0rd",
+            "store": {"store_name": username},
+            "store_address": {
+                "street_address": "1 High Street",
+                "city": "London",
+                "postal_code": "E1 1AA",
+                "country": "United Kingdom",
+            },
+            "opening_hours": [
+                {"day_of_week": day, "opening_time": "09:00", "closing_time": "17:00"}
+                for day in DAYS
+            ],
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post("/v1/signup/store/", payload, format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+        return len(queries)
+
+    def test_signup_queries_do_not_grow_with_reference_data(self):
+        self._add_reference_data(2)
+        few_defaults_queries = self._sign_up("first_store")
+
+        self._add_reference_data(20)
+        many_defaults_queries = self._sign_up("second_store")
+
+        self.assertEqual(few_defaults_queries, many_defaults_queries)
+        store = StoreProfile.objects.get(store_name="second_store")
+        self.assertEqual(store.preferred_categories.count(), 22)
+        self.assertEqual(store.preferred_conditions.count(), 22)
+        self.assertEqual(store.opening_hours.count(), 7)
+
+    def test_category_update_only_writes_changes(self):
+        self._add_reference_data(3)
+        kept, removed, added = ItemCategory.objects.order_by("id")
+        store = create_store()
+        StoreItemCategory.objects.create(store=store, category=kept)
+        StoreItemCategory.objects.create(store=store, category=removed)
+        kept_row_id = store.preferred_categories.get(category=kept).id
+
+        StoreItemCategoryService.update_store_categories(store, [kept.id, added.id])
+
+        self.assertEqual(
+            set(store.preferred_categories.values_list("category_id", flat=True)),
+            {kept.id, added.id},
+        )
+        self.assertTrue(store.preferred_categories.filter(id=kept_row_id).exists())
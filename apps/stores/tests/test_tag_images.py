@@ -0,0 +1,128 @@
+import re
+import zipfile
+from io import BytesIO
+from unittest import mock
+
+from django.core import mail
+from django.test import TestCase
+
+from apps.common.s3.s3_utils import S3ClientBase, S3MultipartWriter
+from apps.common.tests.fakes import FakeS3Client
+from apps.marketplace.tests.factories import create_store, create_tags
+from apps.stores.constants import TagRenderMode
+from apps.stores.models import StoreAddress
+from apps.stores.services import tags_services
+from apps.stores.services.tags_services import TagService
+from apps.supplies.processors import TagsPurchaseProcessor
+
+
+class TestTagImagePipeline(TestCase):
+    def setUp(self):
+        self.store = create_store()
+        StoreAddress.objects.create(
+            store=self.store,
+            street_address="1 High Street",
+            city="London",
+            postal_code="E1 1AA",
+            country="United Kingdom",
+        )
+        self.s3_client = FakeS3Client()
+        patcher = mock.patch.object(
+            S3ClientBase, "get_s3_client", return_value=self.s3_client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_archive(self, extension: str):
+        (key,) = [key for key in self.s3_client.objects if key.endswith(extension)]
+        return key, self.s3_client.objects[key]
+
+    def test_purchase_streams_a_zip_of_the_uploaded_images(self):
+        with mock.patch.object(tags_services, "TAG_RENDER_BATCH_SIZE", 2):
+            with self.captureOnCommitCallbacks(execute=True):
+                tag_group = TagsPurchaseProcessor(self.store, base_quantity=5).process()
+
+        tags = list(tag_group.tags.all())
+        key, zip_content = self._get_archive(".zip")
+        with zipfile.ZipFile(BytesIO(zip_content)) as zip_file:
+            zipped = {name: zip_file.read(name) for name in zip_file.namelist()}
+
+        self.assertEqual(len(zipped), 5)
+        for tag in tags:
+            uploaded = next(
+                image
+                for key, image in self.s3_client.objects.items()
+                if f"_{tag.id}_" in key
+            )
+            self.assertEqual(zipped[f"tag_{tag.id}.png"], uploaded)
+
+        (email,) = mail.outbox
+        self.assertEqual(email.attachments, [])
+        self.assertIn(f"https://s3.test/{key}", email.alternatives[0][0])
+
+    def test_pool_rendering_matches_in_process_rendering(self):
+        tags = create_tags(self.store, 4)
+        in_process = TagService.render_tag_group_images(tags)
+
+        with mock.patch.multiple(
+            tags_services, TAG_RENDER_POOL_THRESHOLD=0, TAG_RENDER_MAX_WORKERS=2
+        ):
+            pooled = TagService.render_tag_group_images(tags, use_pool=True)
+
+        self.assertEqual(pooled, in_process)
+        self.assertTrue(pooled[tags[0].id].startswith(b"\x89PNG"))
+
+    def test_vector_mode_streams_one_pdf_of_sheets(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            TagsPurchaseProcessor(
+                self.store, base_quantity=25, render_mode=TagRenderMode.VECTOR
+            ).process()
+
+        svgs = [key for key in self.s3_client.objects if key.endswith(".svg")]
+        self.assertEqual(len(svgs), 25)
+        self.assertTrue(self.s3_client.objects[svgs[0]].startswith(b"<svg"))
+
+        key, pdf = self._get_archive(".pdf")
+        self.assertTrue(pdf.startswith(b"%PDF-1.4"))
+        self.assertIn(b"/Count 2", pdf)
+        (email,) = mail.outbox
+        self.assertIn(f"https://s3.test/{key}", email.alternatives[0][0])
+
+        # Every cross-reference entry must point at the object it names.
+        xref_position = int(re.search(rb"startxref\n(\d+)", pdf).group(1))
+        self.assertTrue(pdf[xref_position:].startswith(b"xref"))
+        offsets = re.findall(rb"(\d{10}) 00000 n", pdf[xref_position:])
+        for object_id, offset in enumerate(offsets, start=1):
+            self.assertTrue(pdf[int(offset) :].startswith(b"%d 0 obj" % object_id))
+
+    def test_purchases_render_in_the_stores_chosen_mode(self):
+        self.store.tag_render_mode = TagRenderMode.VECTOR
+        self.store.save()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TagsPurchaseProcessor(self.store, base_quantity=2).process()
+
+        self._get_archive(".pdf")
+        self.assertFalse(any(key.endswith(".zip") for key in self.s3_client.objects))
+
+
+class TestS3MultipartWriter(TestCase):
+    def setUp(self):
+        self.s3_client = FakeS3Client()
+
+    def test_uploads_fixed_size_parts_as_data_arrives(self):
+        with S3MultipartWriter(self.s3_client, "key", part_size=4) as writer:
+            writer.write(b"abcdef")
+            self.assertEqual(self.s3_client.uploads["upload-0"], [b"abcd"])
+            writer.write(b"ghi")
+
+        self.assertEqual(self.s3_client.objects["key"], b"abcdefghi")
+
+    def test_aborts_the_upload_when_writing_fails(self):
+        with self.assertRaises(ValueError):
+            with S3MultipartWriter(self.s3_client, "key", part_size=4) as writer:
+                writer.write(b"abcdef")
+                raise ValueError
+
+        self.assertEqual(self.s3_client.aborted, ["key"])
+        self.assertNotIn("key", self.s3_client.objects)
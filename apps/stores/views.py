@@ -1,4 +1,3 @@
-from django.db import transaction
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
@@ -86,16 +85,11 @@ class StoreOwnerCategoriesView(generics.ListCreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        store = self.request.user.store
-
-        serializer.context[STORE] = store
-
-        with transaction.atomic():
-            StoreItemCategory.objects.filter(store=store).delete()
-            created_store_item_categories = serializer.save()
+        serializer.context[STORE] = self.request.user.store
+        store_item_categories = serializer.save()
 
         response_serializer = StoreItemCategorySerializer(
-            created_store_item_categories, many=True
+            store_item_categories, many=True
         )
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
@@ -120,16 +114,11 @@ class StoreOwnerConditionsView(generics.ListCreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        store = self.request.user.store
-
-        serializer.context[STORE] = store
-
-        with transaction.atomic():
-            StoreItemCondition.objects.filter(store=store).delete()
-            created_store_item_categories = serializer.save()
+        serializer.context[STORE] = self.request.user.store
+        store_item_conditions = serializer.save()
 
         response_serializer = StoreItemConditionSerializer(
-            created_store_item_categories, many=True
+            store_item_conditions, many=True
         )
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
@@ -1,19 +1,37 @@
+from functools import partial
+
 from django.db import transaction
 
 from apps.common.abstract_classes import AbstractProcessor
 from apps.stores.services.tags_services import TagService
+from apps.stores.constants import TagRenderMode
 from apps.stores.models import StoreProfile as Store
+from apps.stores.tasks import render_tag_group
 
 
 class TagsPurchaseProcessor(AbstractProcessor):
 
-    def __init__(self, store: Store, multiplier: int = 1, base_quantity: int = 50):
+    def __init__(
+        self,
+        store: Store,
+        multiplier: int = 1,
+        base_quantity: int = 50,
+        render_mode: TagRenderMode = None,
+    ):
         self.store = store
         self.quantity = int(base_quantity) * int(multiplier)
+        # Defaults to the store's tag_render_mode setting.
+        self.render_mode = render_mode
 
-    @transaction.atomic
     def process(self):
-        tag_group = TagService.create_tag_group(self.store, self.quantity)
-        TagService.generate_tags_for_group(tag_group)
-        TagService.create_and_upload_tag_group_images(tag_group)
-        TagService.send_tag_images_email(tag_group)
+        with transaction.atomic():
+            tag_group = TagService.create_tag_group(self.store, self.quantity)
+            TagService.generate_tags_for_group(tag_group)
+
+        # Rendering and uploading can take minutes for large orders, so it
+        # runs on the tag rendering worker once the tags are committed.
+        render_mode = self.render_mode or self.store.tag_render_mode
+        transaction.on_commit(
+            partial(render_tag_group.delay, tag_group.id, render_mode)
+        )
+        return tag_group
@@ -1,6 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 import os
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
 
@@ -13,3 +14,22 @@ app.autodiscover_tasks()
 @app.task(bind=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
+
+
+@worker_process_init.connect
+def warm_email_templates(**kwargs):
+    # Imported here because Django is only set up once the worker starts.
+    from apps.notifications.emails.services.email_renderer import (
+        EmailTemplateRenderer,
+    )
+
+    EmailTemplateRenderer.warm()
+
+
+@worker_process_shutdown.connect
+def close_email_connection(**kwargs):
+    from apps.notifications.emails.services.email_connection import (
+        EmailConnectionPool,
+    )
+
+    EmailConnectionPool.close()
@@ -0,0 +1,7 @@
+# CPU-heavy tasks go to their own queue, consumed by a worker that can fork
+# a process pool (see celery_tag_worker in docker-compose.yml).
+TAG_RENDERING_QUEUE = "tag_rendering"
+
+CELERY_ROUTES = {
+    "apps.stores.tasks.render_tag_group": {"queue": TAG_RENDERING_QUEUE},
+}
@@ -25,4 +25,12 @@ CELERY_SCHEDULES = {
         "task": "apps.common.tasks.db.backup_db",
         "schedule": crontab(minute=0, hour=0),
     },
+    "relay-outbox-messages-every-minute": {
+        "task": "apps.common.tasks.outbox.relay_all_outbox",
+        "schedule": crontab(),
+    },
+    "collect-orphaned-s3-objects-every-day": {
+        "task": "apps.common.tasks.s3.collect_orphaned_s3_objects",
+        "schedule": crontab(minute=30, hour=3),
+    },
 }
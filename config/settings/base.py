@@ -3,6 +3,7 @@ import environ
 from pathlib import Path
 from datetime import timedelta
 
+from async_tasks.routes import CELERY_ROUTES
 from async_tasks.schedules import CELERY_SCHEDULES
 
 env = environ.Env()
@@ -79,6 +80,16 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
 
 CELERY_BEAT_SCHEDULE = CELERY_SCHEDULES
+CELERY_TASK_ROUTES = CELERY_ROUTES
+
+# Cache configuration (shares the Celery Redis instance)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("REDIS_URL", "redis://localhost:6379/0"),
+        "KEY_PREFIX": "tagandtake",
+    }
+}
 
 SPECTACULAR_SETTINGS = {
     "TITLE": "Tag & Take API",
@@ -240,4 +251,7 @@ EMAIL_PORT = 587
 EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")
-DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
\ No newline at end of file
+DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+EMAIL_TIMEOUT = 30
+# Seconds a pooled SMTP connection may sit idle before it is replaced.
+EMAIL_CONNECTION_MAX_IDLE = 60
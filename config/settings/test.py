@@ -0,0 +1,39 @@
+###################
+#                 #
+#     TESTING     #
+#                 #
+###################
+
+from .base import *
+
+DEBUG = False
+
+ALLOWED_HOSTS = ["*"]
+FRONTEND_URL = "http://localhost:3000"
+
+# Tests run against an in-memory database so they need no running services.
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Emails are rendered and sent synchronously into django.core.mail.outbox.
+EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# AWS S3 settings (never contacted in tests)
+AWS_ACCESS_KEY_ID = "testing"
+AWS_SECRET_ACCESS_KEY = "testing"
+AWS_STORAGE_BUCKET_NAME = "tagandtake-testing"
+AWS_S3_REGION_NAME = "eu-west-2"
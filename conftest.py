@@ -0,0 +1,23 @@
+import os
+
+import django
+import pytest
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
+django.setup()
+
+# Bind shared tasks to the project Celery app so they pick up the test settings.
+import async_tasks  # noqa: E402,F401
+
+
+@pytest.fixture(scope="session", autouse=True)
+def django_test_databases():
+    from django.test.runner import DiscoverRunner
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    setup_test_environment()
+    old_config = runner.setup_databases()
+    yield
+    runner.teardown_databases(old_config)
+    teardown_test_environment()